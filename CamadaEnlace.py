@@ -2,6 +2,390 @@
 ENLACE SEPARADO EM RX E TX PARA FACILITAR GUI COM GTK
 """
 
+import functools
+import zlib
+
+import numpy as np
+
+# Cada byte com a ordem dos bits invertida (0b00000001 -> 0b10000000)
+_BITS_INVERTIDOS = bytes(int(f"{byte:08b}"[::-1], 2) for byte in range(256))
+
+
+def _inverter_32_bits(valor: int) -> int:
+    """Inverte a ordem dos 32 bits de um inteiro (bit 31 <-> bit 0)."""
+    return int.from_bytes(
+        valor.to_bytes(4, "big").translate(_BITS_INVERTIDOS), "little"
+    )
+
+
+# Bits descompactados de cada vez (1 byte por bit) em Hamming e bit stuffing:
+# o quadro inteiro fica compactado e só um trecho deste tamanho é aberto por vez
+BITS_POR_TRECHO = 1 << 18
+
+
+class BitsCompactados:
+    """
+    Sequência de bits compactada 8 por byte (bit mais significativo primeiro),
+    guardada em um array numpy uint8. Ocupa 1/8 da memória de uma string de '0'/'1'.
+    Os bits de preenchimento do último byte são sempre 0.
+    """
+
+    __slots__ = ("_dados", "_tamanho")
+
+    def __init__(self, dados=b"", tamanho: int | None = None):
+        if isinstance(dados, np.ndarray):
+            dados = dados.astype(np.uint8, copy=False)
+        else:
+            dados = np.frombuffer(dados, dtype=np.uint8)
+        if tamanho is None:
+            tamanho = len(dados) * 8
+        num_bytes = (tamanho + 7) // 8
+        if len(dados) < num_bytes:
+            raise ValueError(f"{len(dados)} bytes não comportam {tamanho} bits.")
+        dados = dados[:num_bytes].copy()
+        if tamanho % 8 and num_bytes:
+            dados[-1] &= (0xFF << (8 - tamanho % 8)) & 0xFF
+        self._dados = dados
+        self._tamanho = tamanho
+
+    # ------------------------- Conversões (bordas) -------------------------
+
+    @classmethod
+    def de_string(cls, bits: str) -> "BitsCompactados":
+        """Converte uma string de '0'/'1' -> BitsCompactados."""
+        return cls.de_array(np.frombuffer(bits.encode("ascii"), dtype=np.uint8) - 48)
+
+    @classmethod
+    def de_array(cls, bits: np.ndarray) -> "BitsCompactados":
+        """Converte um array numpy de 0/1 -> [b1, b2, b3, ...] em BitsCompactados."""
+        bits = np.asarray(bits).ravel()
+        return cls(np.packbits(bits.astype(np.uint8, copy=False)), len(bits))
+
+    @classmethod
+    def de_trechos(cls, trechos) -> "BitsCompactados":
+        """
+        Junta uma sequência de arrays de 0/1 em BitsCompactados, compactando cada trecho
+        assim que ele chega (só um trecho fica descompactado por vez).
+        """
+        partes, resto, tamanho = [], np.zeros(0, dtype=np.uint8), 0
+        for trecho in trechos:
+            trecho = np.concatenate((resto, np.asarray(trecho, dtype=np.uint8).ravel()))
+            completos = len(trecho) // 8 * 8
+            partes.append(np.packbits(trecho[:completos]))
+            resto = trecho[completos:]
+            tamanho += completos
+        partes.append(np.packbits(resto))
+        return cls(np.concatenate(partes), tamanho + len(resto))
+
+    def trechos(self, tamanho: int | None = None):
+        """Gera os bits em arrays de 0/1 de até `tamanho` (BITS_POR_TRECHO) bits."""
+        tamanho = tamanho or BITS_POR_TRECHO
+        for inicio in range(0, self._tamanho, tamanho):
+            yield self[inicio : inicio + tamanho].para_array()
+
+    def para_string(self) -> str:
+        return (self.para_array() + 48).tobytes().decode("ascii")
+
+    def para_array(self) -> np.ndarray:
+        """Retorna um array numpy uint8 com um bit por elemento -> [b1, b2, b3, ...]."""
+        return np.unpackbits(self._dados, count=self._tamanho)
+
+    @property
+    def dados(self) -> np.ndarray:
+        """Bytes compactados (alinhados à esquerda, último byte completado com 0s)."""
+        return self._dados
+
+    def bytes_alinhados_a_direita(self) -> np.ndarray:
+        """
+        Bytes com os bits completados por zeros À ESQUERDA, como em int(bits, 2).
+        Útil para CRC e checksum, onde zeros à esquerda não alteram o resultado.
+        """
+        preenchimento = -self._tamanho % 8
+        if preenchimento == 0:
+            return self._dados
+        return _deslocar_para_direita(self._dados, preenchimento)[:-1]
+
+    # ------------------------- Operações -------------------------
+
+    def __len__(self) -> int:
+        return self._tamanho
+
+    def __eq__(self, outro) -> bool:
+        if not isinstance(outro, BitsCompactados):
+            return NotImplemented
+        return self._tamanho == outro._tamanho and np.array_equal(
+            self._dados, outro._dados
+        )
+
+    def __repr__(self) -> str:
+        bits = self[:64].para_string()
+        reticencias = "..." if self._tamanho > 64 else ""
+        return f"BitsCompactados('{bits}{reticencias}', tamanho={self._tamanho})"
+
+    def __add__(self, outro: "BitsCompactados") -> "BitsCompactados":
+        tamanho = self._tamanho + outro._tamanho
+        deslocamento = self._tamanho % 8
+        if deslocamento == 0:
+            return BitsCompactados(np.concatenate((self._dados, outro._dados)), tamanho)
+
+        # O segundo bloco começa no meio do último byte do primeiro
+        deslocado = _deslocar_para_direita(outro._dados, deslocamento)
+        dados = np.concatenate((self._dados, deslocado[1:]))
+        dados[len(self._dados) - 1] |= deslocado[0]
+        return BitsCompactados(dados, tamanho)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            inicio, fim, passo = indice.indices(self._tamanho)
+            if passo != 1:
+                raise ValueError("Somente fatias contíguas são suportadas.")
+            tamanho = max(0, fim - inicio)
+            bytes_fatia = self._dados[inicio // 8 : (inicio + tamanho + 7) // 8 + 1]
+            deslocamento = inicio % 8
+            if deslocamento:
+                bytes_fatia = _deslocar_para_esquerda(bytes_fatia, deslocamento)
+            return BitsCompactados(bytes_fatia, tamanho)
+
+        if indice < 0:
+            indice += self._tamanho
+        if not 0 <= indice < self._tamanho:
+            raise IndexError("Índice de bit fora do quadro.")
+        return int(self._dados[indice // 8] >> (7 - indice % 8)) & 1
+
+    def paridade(self) -> int:
+        """XOR de todos os bits (1 se a quantidade de 1s for ímpar)."""
+        if self._tamanho == 0:
+            return 0
+        return int(np.bitwise_count(np.bitwise_xor.reduce(self._dados))) & 1
+
+    def inverter_bit(self, indice: int) -> "BitsCompactados":
+        """Retorna uma cópia com o bit na posição `indice` invertido (simula ruído)."""
+        if indice < 0:
+            indice += self._tamanho
+        if not 0 <= indice < self._tamanho:
+            raise IndexError("Índice de bit fora do quadro.")
+        dados = self._dados.copy()
+        dados[indice // 8] ^= 0x80 >> (indice % 8)
+        return BitsCompactados(dados, self._tamanho)
+
+    def inverter_bits(self, indices) -> "BitsCompactados":
+        """Como inverter_bit(), mas inverte todas as posições de `indices` juntas."""
+        indices = np.asarray(indices, dtype=np.int64)
+        indices = np.where(indices < 0, indices + self._tamanho, indices)
+        if ((indices < 0) | (indices >= self._tamanho)).any():
+            raise IndexError("Índice de bit fora do quadro.")
+        dados = self._dados.copy()
+        mascaras = (0x80 >> (indices % 8)).astype(np.uint8)
+        np.bitwise_xor.at(dados, indices // 8, mascaras)
+        return BitsCompactados(dados, self._tamanho)
+
+
+def _deslocar_para_direita(dados: np.ndarray, deslocamento: int) -> np.ndarray:
+    """Desloca os bytes `deslocamento` (1..7) bits para a direita (len + 1 bytes)."""
+    saida = np.zeros(len(dados) + 1, dtype=np.uint8)
+    saida[:-1] = dados >> deslocamento
+    # Bits que transbordam do uint8 são descartados
+    saida[1:] |= dados << (8 - deslocamento)
+    return saida
+
+
+def _deslocar_para_esquerda(dados: np.ndarray, deslocamento: int) -> np.ndarray:
+    """Desloca os bytes `deslocamento` (1..7) bits para a esquerda (mesmo tamanho)."""
+    saida = dados << deslocamento  # bits que transbordam do uint8 são descartados
+    saida[:-1] |= dados[1:] >> (8 - deslocamento)
+    return saida
+
+
+FLAG = BitsCompactados(b"\x7e")  # 01111110
+ESC = BitsCompactados(b"\x7d")  # 01111101
+
+
+class CodigoHamming:
+    """
+    Código de Hamming (n, k) na forma matricial: palavras de n bits, k de dados.
+    As paridades ficam nas posições 1, 2, 4, 8... e a coluna j de H é o número j em
+    binário, então a síndrome H·c (mod 2) já é a posição do bit errado (0 = sem erro).
+    Use CodigoHamming.para_tamanho(n) para reaproveitar as matrizes de cada n.
+    """
+
+    def __init__(self, n: int):
+        if n < 3:
+            raise ValueError(
+                f"Palavra de Hamming precisa de pelo menos 3 bits, recebeu {n}."
+            )
+        self.n = n
+        self.r = n.bit_length()  # paridades nas potências de 2 até n
+        self.k = n - self.r
+        self.indices_dados = CodigoHamming.indices_de_dados(n)
+        self.indices_paridade = (1 << np.arange(self.r)) - 1
+
+        # H (r x n): linha i é o bit i de cada posição 1..n
+        posicoes = np.arange(1, n + 1)
+        self.H = ((posicoes >> np.arange(self.r)[:, None]) & 1).astype(np.uint8)
+
+        # G (k x n): cada bit de dados vai para sua posição e liga as suas paridades
+        self.G = np.zeros((self.k, n), dtype=np.uint8)
+        self.G[np.arange(self.k), self.indices_dados] = 1
+        self.G[:, self.indices_paridade] = self.H[:, self.indices_dados].T
+
+        # Síndrome -> posição do erro (1..n), 0 sem erro e -1 fora do alcance
+        self.tabela_sindrome = np.arange(2**self.r)
+        self.tabela_sindrome[self.tabela_sindrome > n] = -1
+        self._pesos = 1 << np.arange(self.r)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def para_tamanho(n: int) -> "CodigoHamming":
+        return CodigoHamming(n)
+
+    @staticmethod
+    def tamanho_da_palavra(m: int) -> int:
+        """Tamanho da palavra para m bits de dados (menor r com 2^r >= m + r + 1)."""
+        r = 0
+        while (2**r) < (m + r + 1):
+            r += 1
+        return m + r
+
+    @staticmethod
+    def indices_de_dados(n: int) -> np.ndarray:
+        """Índices (base 0) das posições 1..n que não são potências de 2."""
+        posicoes = np.arange(1, n + 1)
+        return np.flatnonzero((posicoes & (posicoes - 1)) != 0)
+
+    def codificar(self, dados: np.ndarray) -> np.ndarray:
+        """Codifica um lote de blocos (B x k) de uma vez: palavras = dados·G (mod 2)."""
+        # Produto em float32 (BLAS) é exato para somas menores que 2^24
+        produto = dados.astype(np.float32) @ self.G.astype(np.float32)
+        return (produto % 2).astype(np.uint8)
+
+    def sindromes(self, palavras: np.ndarray) -> np.ndarray:
+        """Síndrome de cada palavra do lote (B x n), já como número: H · c (mod 2)."""
+        produto = palavras.astype(np.float32) @ self.H.T.astype(np.float32)
+        return (produto % 2).astype(np.int64) @ self._pesos
+
+    def decodificar(self, palavras: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Corrige até 1 erro por palavra e devolve (dados B x k, posição do erro de cada
+        palavra pela tabela de síndromes: 0 sem erro, -1 fora do alcance).
+        """
+        posicao_erro = self.tabela_sindrome[self.sindromes(palavras)]
+        corrigidas = palavras.copy()
+        linhas = np.flatnonzero(posicao_erro > 0)
+        corrigidas[linhas, posicao_erro[linhas] - 1] ^= 1
+        return corrigidas[:, self.indices_dados], posicao_erro
+
+    @staticmethod
+    def sindrome_da_palavra(palavra: np.ndarray) -> int:
+        """
+        H · c para uma única palavra de qualquer tamanho, sem montar H: como as colunas
+        de H são as posições em binário, o produto é o XOR das posições dos bits 1.
+        """
+        return int(np.bitwise_xor.reduce(np.flatnonzero(palavra) + 1, initial=0))
+
+    @staticmethod
+    def codificar_palavra(dados: np.ndarray) -> np.ndarray:
+        """Codifica todos os bits em uma única palavra (ver tamanho_da_palavra)."""
+        n = CodigoHamming.tamanho_da_palavra(len(dados))
+        palavra = np.zeros(n, dtype=np.uint8)
+        palavra[CodigoHamming.indices_de_dados(n)] = dados
+        # Paridades escolhidas para zerar a síndrome: o bit i da síndrome vai em 2^i
+        s = CodigoHamming.sindrome_da_palavra(palavra)
+        bits_paridade = np.arange(n.bit_length())
+        palavra[(1 << bits_paridade) - 1] = (s >> bits_paridade) & 1
+        return palavra
+
+    @staticmethod
+    def decodificar_palavra(palavra: np.ndarray) -> tuple[np.ndarray, int]:
+        """Mesmo que decodificar() para uma única palavra: devolve (dados, síndrome)."""
+        n = len(palavra)
+        s = CodigoHamming.sindrome_da_palavra(palavra)
+        if 0 < s <= n:
+            palavra = palavra.copy()
+            palavra[s - 1] ^= 1
+        return palavra[CodigoHamming.indices_de_dados(n)], s
+
+    # --------- Mesmas operações sobre BitsCompactados, trecho a trecho ---------
+
+    def codificar_blocos(self, dados: BitsCompactados) -> BitsCompactados:
+        """codificar() sobre blocos compactados (len múltiplo de k), trecho a trecho."""
+        passo = self.k * max(1, BITS_POR_TRECHO // self.k)
+        return BitsCompactados.de_trechos(
+            self.codificar(trecho.reshape(-1, self.k)).ravel()
+            for trecho in dados.trechos(passo)
+        )
+
+    def decodificar_blocos(
+        self, palavras: BitsCompactados
+    ) -> tuple[BitsCompactados, list[int], bool]:
+        """
+        decodificar() sobre blocos compactados (len múltiplo de n), um trecho por vez.
+        Devolve (dados, posições corrigidas desde o início do payload, se algum erro
+        ficou fora do alcance).
+        """
+        passo = self.n * max(1, BITS_POR_TRECHO // self.n)
+        erros, fora_do_alcance = [], False
+
+        def dados_por_trecho():
+            nonlocal fora_do_alcance
+            for i, trecho in enumerate(palavras.trechos(passo)):
+                dados, posicao_erro = self.decodificar(trecho.reshape(-1, self.n))
+                fora_do_alcance |= bool((posicao_erro < 0).any())
+                com_erro = np.flatnonzero(posicao_erro > 0)
+                erros.extend(
+                    (i * passo + com_erro * self.n + posicao_erro[com_erro]).tolist()
+                )
+                yield dados
+
+        dados = BitsCompactados.de_trechos(dados_por_trecho())
+        return dados, erros, fora_do_alcance
+
+    @staticmethod
+    def _fatias_de_dados(n: int):
+        """Fatias [início, fim) (base 0) dos dados que seguem cada paridade 2^i."""
+        for i in range(n.bit_length()):
+            yield 1 << i, max(1 << i, min((1 << (i + 1)) - 1, n))
+
+    @staticmethod
+    def sindrome_compactada(palavra: BitsCompactados) -> int:
+        """sindrome_da_palavra() sobre bits compactados, um trecho por vez."""
+        s, inicio = 0, 1
+        for trecho in palavra.trechos():
+            s ^= int(np.bitwise_xor.reduce(np.flatnonzero(trecho) + inicio, initial=0))
+            inicio += len(trecho)
+        return s
+
+    @staticmethod
+    def codificar_compactado(dados: BitsCompactados) -> BitsCompactados:
+        """codificar_palavra() sobre bits compactados, sem abrir a palavra inteira."""
+        n = CodigoHamming.tamanho_da_palavra(len(dados))
+
+        def trechos():
+            usados = 0
+            for inicio, fim in CodigoHamming._fatias_de_dados(n):
+                yield np.zeros(1, dtype=np.uint8)  # paridade 2^i, preenchida abaixo
+                yield from dados[usados : usados + fim - inicio].trechos()
+                usados += fim - inicio
+
+        palavra = BitsCompactados.de_trechos(trechos())
+        s = CodigoHamming.sindrome_compactada(palavra)
+        return palavra.inverter_bits(
+            [(1 << i) - 1 for i in range(n.bit_length()) if (s >> i) & 1]
+        )
+
+    @staticmethod
+    def decodificar_compactado(palavra: BitsCompactados) -> tuple[BitsCompactados, int]:
+        """decodificar_palavra() sobre bits compactados: devolve (dados, síndrome)."""
+        n = len(palavra)
+        s = CodigoHamming.sindrome_compactada(palavra)
+        if 0 < s <= n:
+            palavra = palavra.inverter_bit(s - 1)
+        dados = BitsCompactados.de_trechos(
+            trecho
+            for inicio, fim in CodigoHamming._fatias_de_dados(n)
+            for trecho in palavra[inicio:fim].trechos()
+        )
+        return dados, s
+
 
 class Utilitarios:
     """Ferramentas matemáticas estáticas para auxiliar TX e RX."""
@@ -13,32 +397,178 @@ class Utilitarios:
     def is_power_2(n):
         return n > 0 and (n & (n - 1)) == 0
 
+    @staticmethod
+    def crc32(dados, crc=0):
+        """
+        CRC-32 sobre bytes, bytearray, memoryview ou array uint8: resto da divisão de
+        (dados * x^32) por POLINOMIO_CRC32, sem reflexão nem XOR final.
+        `crc` permite continuar o cálculo de um bloco anterior.
+        Usa o zlib.crc32 (em C), que divide pelo mesmo polinômio na versão "refletida"
+        (bits do menos para o mais significativo) e inverte o registrador no início e
+        no fim. Espelhando os bits de cada byte na entrada e os 32 bits do resultado, e
+        desfazendo as inversões, o resto é exatamente o da divisão bit a bit.
+        """
+        refletidos = bytes(memoryview(dados).cast("B")).translate(_BITS_INVERTIDOS)
+        registrador = (
+            zlib.crc32(refletidos, _inverter_32_bits(crc) ^ 0xFFFFFFFF) ^ 0xFFFFFFFF
+        )
+        return _inverter_32_bits(registrador)
+
     @staticmethod
     def divisao_crc(numero_alvo):
-        divisor = Utilitarios.POLINOMIO_CRC32
-        dividendo = numero_alvo
-        num_bits = dividendo.bit_length()
-        while num_bits >= (Utilitarios.GRAU_CRC + 1):
-            shift = num_bits - (Utilitarios.GRAU_CRC + 1)
-            dividendo ^= divisor << shift
-            num_bits = dividendo.bit_length()
-        return dividendo
+        # numero_alvo = cabeca * x^32 + cauda, e cauda já é menor que o polinômio
+        cabeca = numero_alvo >> Utilitarios.GRAU_CRC
+        cauda = numero_alvo & ((1 << Utilitarios.GRAU_CRC) - 1)
+        cabeca_bytes = cabeca.to_bytes((cabeca.bit_length() + 7) // 8, "big")
+        return Utilitarios.crc32(cabeca_bytes) ^ cauda
 
     @staticmethod
     def checksum_math(dados, n_bits):
+        """
+        Soma em complemento de 1 das palavras de n_bits (com zeros à esquerda).
+        As palavras são somadas de uma vez e os "vai-uns" só são dobrados no final, o
+        que dá o mesmo resultado de dobrar a cada soma.
+        """
+        if isinstance(dados, str):
+            dados = BitsCompactados.de_string(dados)
         mascara = (1 << n_bits) - 1
-        # Padding
-        resto = len(dados) % n_bits
-        if resto != 0:
-            dados = ("0" * (n_bits - resto)) + dados
+        soma = Utilitarios._somar_palavras(dados, n_bits)
+        while soma > mascara:
+            soma = (soma & mascara) + (soma >> n_bits)
+        return soma
+
+    @staticmethod
+    def _somar_palavras(dados, n_bits):
+        """Soma comum (sem dobrar os vai-uns) das palavras de n_bits, como int."""
+        if n_bits % 8 == 0:
+            # Cada palavra vira uma linha de pedaços de 4, 2 ou 1 byte (big-endian)
+            bytes_por_palavra = n_bits // 8
+            pedaco = next(t for t in (4, 2, 1) if bytes_por_palavra % t == 0)
+            alinhados = dados.bytes_alinhados_a_direita()
+            preenchimento = -len(alinhados) % bytes_por_palavra
+            if preenchimento:
+                alinhados = np.concatenate(
+                    (np.zeros(preenchimento, dtype=np.uint8), alinhados)
+                )
+            colunas = alinhados.view(f">u{pedaco}").reshape(
+                -1, bytes_por_palavra // pedaco
+            )
+            bits_por_coluna = 8 * pedaco
+        else:
+            # Palavras fora das fronteiras de byte: uma coluna por bit
+            bits = dados.para_array()
+            preenchimento = np.zeros(-len(bits) % n_bits, dtype=np.uint8)
+            colunas = np.concatenate((preenchimento, bits)).reshape(-1, n_bits)
+            bits_por_coluna = 1
+
+        # Acumulador de 64 bits: não estoura antes de 2^32 palavras
         soma = 0
-        for i in range(0, len(dados), n_bits):
-            val = int(dados[i : i + n_bits], 2)
-            soma += val
-            while soma > mascara:
-                soma = (soma & mascara) + (soma >> n_bits)
+        for coluna in colunas.sum(axis=0, dtype=np.uint64).tolist():
+            soma = (soma << bits_por_coluna) + coluna
         return soma
 
+    @staticmethod
+    def byte_stuffing(dados, flag, esc):
+        """
+        Insere um ESC antes de cada byte igual à flag ou ao escape, numa única passada.
+        Cada byte original vai para sua posição + (escapes inseridos até ele).
+        """
+        precisa_escape = (dados == flag) | (dados == esc)
+        deslocamento = np.cumsum(precisa_escape)
+        saida = np.empty(
+            len(dados) + (int(deslocamento[-1]) if len(dados) else 0), dtype=np.uint8
+        )
+        posicoes = np.arange(len(dados)) + deslocamento
+        saida[posicoes] = dados
+        saida[posicoes[precisa_escape] - 1] = esc
+        return saida
+
+    @staticmethod
+    def remover_byte_stuffing(dados, esc):
+        """
+        Remove os ESCs inseridos por byte_stuffing. Numa sequência de ESCs seguidos,
+        os de posição par (0, 2, 4...) são escapes e os de posição ímpar são dados.
+        """
+        eh_esc = dados == esc
+        indices = np.arange(len(dados))
+        inicio_sequencia = eh_esc & ~np.concatenate(([False], eh_esc[:-1]))
+        inicio = np.maximum.accumulate(np.where(inicio_sequencia, indices, 0))
+        eh_escape = eh_esc & ((indices - inicio) % 2 == 0)
+        return dados[~eh_escape]
+
+    @staticmethod
+    def contar_uns_seguidos(bits, antes=0):
+        """
+        Para cada posição, quantos 1s seguidos terminam nela (0 onde o bit é 0).
+        Ex: [1, 1, 0, 1, 1, 1] -> [1, 2, 0, 1, 2, 3]
+        `antes` são os uns que terminavam o trecho anterior (somados ao primeiro grupo).
+        """
+        uns = bits.astype(bool)
+        acumulado = np.cumsum(uns)
+        ultimo_zero = np.maximum.accumulate(np.where(uns, 0, acumulado))
+        seguidos = acumulado - ultimo_zero
+        if antes:
+            seguidos += antes * np.logical_and.accumulate(uns)
+        return seguidos
+
+    @staticmethod
+    def _uns_no_final(bits, antes=0):
+        """Uns seguidos no fim do trecho (mais os `antes` se o trecho for só de uns)."""
+        invertidos = bits[::-1]
+        primeiro_zero = int(np.argmin(invertidos))
+        if len(bits) == 0 or invertidos[primeiro_zero]:
+            return antes + len(bits)
+        return primeiro_zero
+
+    @staticmethod
+    def bit_stuffing(bits, antes=0):
+        """
+        Insere um 0 depois de cada 5 uns seguidos, em uma única passada.
+        `antes` continua a contagem de um trecho anterior (ver _uns_no_final).
+        """
+        seguidos = Utilitarios.contar_uns_seguidos(bits, antes)
+        insere_zero = (seguidos > 0) & (seguidos % 5 == 0)
+        inseridos_antes = np.cumsum(insere_zero) - insere_zero
+        saida = np.zeros(len(bits) + int(insere_zero.sum()), dtype=np.uint8)
+        saida[np.arange(len(bits)) + inseridos_antes] = bits
+        return saida
+
+    @staticmethod
+    def remover_bit_stuffing(bits, antes=0):
+        """
+        Descarta o bit seguinte a cada 5 uns seguidos. Como o contador zera após o
+        descarte, numa sequência de uns caem os de posição 6, 12, 18..., e o 0 que
+        termina uma sequência com 5, 11, 17... uns. `antes` é como em bit_stuffing.
+        """
+        seguidos = Utilitarios.contar_uns_seguidos(bits, antes)
+        anteriores = np.concatenate(([antes], seguidos[:-1]))
+        descarta = ((seguidos > 0) & (seguidos % 6 == 0)) | (
+            (seguidos == 0) & (anteriores % 6 == 5)
+        )
+        return bits[~descarta]
+
+    @staticmethod
+    def _em_trechos(bits, funcao):
+        """Aplica (remover_)bit_stuffing trecho a trecho, levando a contagem de uns."""
+        antes = 0
+        for trecho in bits.trechos():
+            yield funcao(trecho, antes)
+            antes = Utilitarios._uns_no_final(trecho, antes)
+
+    @staticmethod
+    def bit_stuffing_compactado(bits: BitsCompactados) -> BitsCompactados:
+        """bit_stuffing() sobre bits compactados, sem abrir o quadro inteiro."""
+        return BitsCompactados.de_trechos(
+            Utilitarios._em_trechos(bits, Utilitarios.bit_stuffing)
+        )
+
+    @staticmethod
+    def remover_bit_stuffing_compactado(bits: BitsCompactados) -> BitsCompactados:
+        """remover_bit_stuffing() sobre bits compactados, sem abrir o quadro inteiro."""
+        return BitsCompactados.de_trechos(
+            Utilitarios._em_trechos(bits, Utilitarios.remover_bit_stuffing)
+        )
+
     @staticmethod
     def get_nome_erro(i):
         return ["Paridade", "Checksum", "CRC-32", "Hamming"][i]
@@ -51,14 +581,28 @@ class Utilitarios:
 class TransmissorEnlace:
     """Classe responsável por transformar DADOS em QUADROS."""
 
+    def __init__(self, tamanho_bloco_hamming: int | None = None):
+        # None: todo o payload vira uma única palavra de Hamming.
+        # n (ex: 7, 15, 255): payload dividido em blocos (n, k) codificados em lote.
+        self.tamanho_bloco_hamming = tamanho_bloco_hamming
+
     def processar(
-        self, dados_bits: str, tipo_enquadramento: int, tipo_erro: int
+        self, dados_bits: str | BitsCompactados, tipo_enquadramento: int, tipo_erro: int
     ) -> dict:
+        # Strings de '0'/'1' são convertidas na entrada e na saída; internamente
+        # tudo trabalha sobre BitsCompactados
+        entrada_str = isinstance(dados_bits, str)
+        if entrada_str:
+            dados_bits = BitsCompactados.de_string(dados_bits)
+
         # 1. Adiciona Controle de Erro
         payload = self._aplicar_controle_erro(dados_bits, tipo_erro)
         # 2. Aplica Enquadramento
         quadro = self._aplicar_enquadramento(payload, tipo_enquadramento)
 
+        if entrada_str:
+            payload, quadro = payload.para_string(), quadro.para_string()
+
         return {
             "tipo": "TX",
             # AQUI ESTAVA O ERRO: Padronizado para 'payload_protegido'
@@ -71,39 +615,25 @@ class TransmissorEnlace:
     def _aplicar_controle_erro(self, bits, tipo):
         # 0:Paridade, 1:Checksum, 2:CRC, 3:Hamming
         if tipo == 0:
-            acc = 0
-            for b in bits:
-                acc ^= int(b)
-            return bits + str(acc)
+            return bits + BitsCompactados.de_array([bits.paridade()])
         elif tipo == 1:
             n = 16
             s = Utilitarios.checksum_math(bits, n)
             c = (~s) & ((1 << n) - 1)
-            return bits + format(c, f"0{n}b")
+            return bits + BitsCompactados(c.to_bytes(n // 8, "big"), n)
         elif tipo == 2:
-            d = int(bits, 2)
-            d_padded = d << 32
-            r = Utilitarios.divisao_crc(d_padded)
-            return bits + format(r, "032b")
+            r = Utilitarios.crc32(bits.bytes_alinhados_a_direita())
+            return bits + BitsCompactados(r.to_bytes(4, "big"), 32)
         elif tipo == 3:
-            m, r = len(bits), 0
-            while (2**r) < (m + r + 1):
-                r += 1
-            total = m + r
-            arr = ["0"] * (total + 1)
-            idx = 0
-            for i in range(1, total + 1):
-                if not Utilitarios.is_power_2(i):
-                    arr[i] = bits[idx]
-                    idx += 1
-            for i in range(r):
-                pos = 2**i
-                xor = 0
-                for j in range(1, total + 1):
-                    if j & pos:
-                        xor ^= int(arr[j])
-                arr[pos] = str(xor)
-            return "".join(arr[1:])
+            n = self.tamanho_bloco_hamming
+            if n is None:
+                return CodigoHamming.codificar_compactado(bits)
+            # Blocos (n, k) codificados em lote; a sobra vira uma palavra encurtada
+            codigo = CodigoHamming.para_tamanho(n)
+            completos = len(bits) // codigo.k * codigo.k
+            sobra = CodigoHamming.codificar_palavra(bits[completos:].para_array())
+            blocos = codigo.codificar_blocos(bits[:completos])
+            return blocos + BitsCompactados.de_array(sobra)
         return bits
 
     def _aplicar_enquadramento(self, bits, tipo):
@@ -112,48 +642,47 @@ class TransmissorEnlace:
             qtd = len(bits) // 8
             if len(bits) % 8 != 0:
                 qtd += 1
-            return format(qtd, "08b") + bits
+            return BitsCompactados.de_string(format(qtd, "08b")) + bits
         elif tipo == 1:
-            flag, esc = "01111110", "01111101"
-            out = ""
-            for i in range(0, len(bits), 8):
-                byte = bits[i : i + 8]
-                if byte == flag or byte == esc:
-                    out += esc + byte
-                else:
-                    out += byte
-            return flag + out + flag
+            completos = len(bits) // 8
+            out = Utilitarios.byte_stuffing(
+                bits.dados[:completos], FLAG.dados[0], ESC.dados[0]
+            )
+            # Um byte incompleto no final nunca é igual à flag ou ao escape
+            return FLAG + BitsCompactados(out) + bits[completos * 8 :] + FLAG
         elif tipo == 2:
-            out, cnt = "", 0
-            for b in bits:
-                if b == "1":
-                    cnt += 1
-                    out += "1"
-                    if cnt == 5:
-                        out += "0"
-                        cnt = 0
-                else:
-                    cnt = 0
-                    out += "0"
-            return "01111110" + out + "01111110"
+            return FLAG + Utilitarios.bit_stuffing_compactado(bits) + FLAG
         return bits
 
 
 class ReceptorEnlace:
     """Classe responsável por validar e limpar o quadro."""
 
-    def processar(self, quadro: str, tipo_enquadramento: int, tipo_erro: int) -> dict:
+    def __init__(self, tamanho_bloco_hamming: int | None = None):
+        # Deve ser o mesmo tamanho de bloco usado pelo transmissor
+        self.tamanho_bloco_hamming = tamanho_bloco_hamming
+
+    def processar(
+        self, quadro: str | BitsCompactados, tipo_enquadramento: int, tipo_erro: int
+    ) -> dict:
+        entrada_str = isinstance(quadro, str)
+        bits_quadro = BitsCompactados.de_string(quadro) if entrada_str else quadro
+
         # 1. Desenquadra
-        payload = self._remover_enquadramento(quadro, tipo_enquadramento)
+        payload = self._remover_enquadramento(bits_quadro, tipo_enquadramento)
 
         # 2. Verifica Erro
         res = self._verificar_controle_erro(payload, tipo_erro)
 
+        dados = res["dados"]
+        if entrada_str:
+            payload, dados = payload.para_string(), dados.para_string()
+
         return {
             "tipo": "RX",
             "quadro_bruto": quadro,
             "payload_extraido": payload,
-            "dados_finais": res["dados"],
+            "dados_finais": dados,
             "status": res["status"],
             "detalhes": res["msg"],
             "info_erro": Utilitarios.get_nome_erro(tipo_erro),
@@ -164,44 +693,21 @@ class ReceptorEnlace:
         if tipo == 0:
             return quadro[8:]
         elif tipo == 1:
-            esc = "01111101"
             miolo = quadro[8:-8]
-            out, i = "", 0
-            while i < len(miolo):
-                byte = miolo[i : i + 8]
-                if byte == esc:
-                    i += 8
-                    out += miolo[i : i + 8]
-                else:
-                    out += byte
-                i += 8
-            return out
+            completos = len(miolo) // 8
+            out = Utilitarios.remover_byte_stuffing(
+                miolo.dados[:completos], ESC.dados[0]
+            )
+            # Bits restantes (byte incompleto) são sempre dados
+            return BitsCompactados(out) + miolo[completos * 8 :]
         elif tipo == 2:
-            miolo = quadro[8:-8]
-            out, cnt, i = "", 0, 0
-            while i < len(miolo):
-                b = miolo[i]
-                if b == "1":
-                    cnt += 1
-                    out += "1"
-                    if cnt == 5:
-                        if (i + 1) < len(miolo):
-                            i += 1
-                        cnt = 0
-                else:
-                    cnt = 0
-                    out += "0"
-                i += 1
-            return out
+            return Utilitarios.remover_bit_stuffing_compactado(quadro[8:-8])
         return quadro
 
     def _verificar_controle_erro(self, bits, tipo):
         if tipo == 0:  # Paridade
             dados = bits[:-1]
-            acc = 0
-            for b in bits:
-                acc ^= int(b)
-            if acc == 0:
+            if bits.paridade() == 0:
                 return {"dados": dados, "status": "SUCESSO", "msg": "Paridade OK"}
             return {"dados": dados, "status": "ERRO", "msg": "Paridade Inválida"}
 
@@ -216,50 +722,52 @@ class ReceptorEnlace:
         elif tipo == 2:  # CRC
             dados = bits[:-32]
             if len(bits) < 32:
-                return {"dados": "", "status": "ERRO", "msg": "Curto demais"}
-            d = int(bits, 2)
-            if Utilitarios.divisao_crc(d) == 0:
+                return {
+                    "dados": BitsCompactados(),
+                    "status": "ERRO",
+                    "msg": "Curto demais",
+                }
+            # Resto de (dados * x^32 + crc): CRC dos dados XOR crc recebido
+            r = Utilitarios.crc32(dados.bytes_alinhados_a_direita())
+            if r ^ int.from_bytes(bits[-32:].dados.tobytes(), "big") == 0:
                 return {"dados": dados, "status": "SUCESSO", "msg": "CRC OK"}
             return {"dados": dados, "status": "ERRO", "msg": "CRC Falhou"}
 
         elif tipo == 3:  # Hamming
-            n = len(bits)
-            arr = ["X"] + list(bits)
-            erro_pos, r = 0, 0
-            while (2**r) <= n:
-                pos = 2**r
-                xor = 0
-                for j in range(1, n + 1):
-                    if j & pos:
-                        xor ^= int(arr[j])
-                if xor != 0:
-                    erro_pos += pos
-                r += 1
-
-            if erro_pos > 0:
-                if erro_pos <= n:
-                    arr[erro_pos] = "0" if arr[erro_pos] == "1" else "1"
-                    # Reconstrói dados
-                    dados = ""
-                    for i in range(1, n + 1):
-                        if not Utilitarios.is_power_2(i):
-                            dados += arr[i]
-                    return {
-                        "dados": dados,
-                        "status": "CORRIGIDO",
-                        "msg": f"Erro no bit {erro_pos} corrigido.",
-                    }
+            n = self.tamanho_bloco_hamming
+            if n is None:
+                dados, s = CodigoHamming.decodificar_compactado(bits)
+                erros = [s] if 0 < s <= len(bits) else []
+                fora_do_alcance = s > len(bits)
+            else:
+                codigo = CodigoHamming.para_tamanho(n)
+                completos = len(bits) // n * n
+                dados, erros, fora_do_alcance = codigo.decodificar_blocos(
+                    bits[:completos]
+                )
+                sobra, s = CodigoHamming.decodificar_palavra(
+                    bits[completos:].para_array()
+                )
+                dados = dados + BitsCompactados.de_array(sobra)
+                if s > len(bits) - completos:
+                    fora_do_alcance = True
+                elif s > 0:
+                    erros.append(completos + s)
+
+            if fora_do_alcance:
+                return {
+                    "dados": BitsCompactados(),
+                    "status": "ERRO",
+                    "msg": "Erro fora do alcance",
+                }
+            if erros:
+                if len(erros) == 1:
+                    msg = f"Erro no bit {erros[0]} corrigido."
                 else:
-                    return {
-                        "dados": "",
-                        "status": "ERRO",
-                        "msg": "Erro fora do alcance",
-                    }
-
-            dados = ""
-            for i in range(1, n + 1):
-                if not Utilitarios.is_power_2(i):
-                    dados += arr[i]
+                    msg = (
+                        f"Erros nos bits {', '.join(str(e) for e in erros)} corrigidos."
+                    )
+                return {"dados": dados, "status": "CORRIGIDO", "msg": msg}
             return {"dados": dados, "status": "SUCESSO", "msg": "Hamming OK"}
 
         return {"dados": bits, "status": "UNK", "msg": "?"}
@@ -1,6 +1,12 @@
+import functools
+import json
+import os
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
 
-from scipy.integrate import quad
 import numpy as np
 
 # ===================================================
@@ -9,8 +15,23 @@ import numpy as np
 
 
 class Ruido:
-    def __init__(self, sigma: float = 0.1):
+    """Ruído gaussiano aditivo (AWGN) com média 0 e desvio padrão sigma.
+    Cada instância tem o seu próprio gerador (np.random.Generator): com a mesma semente
+    o ruído se repete, e instâncias com sementes diferentes (ex: SeedSequence.spawn)
+    geram sequências independentes, sem depender do estado global do np.random.
+    """
+
+    def __init__(
+        self,
+        sigma: float = 0.1,
+        semente: int | np.random.SeedSequence | np.random.Generator | None = None,
+        dtype: np.dtype = np.float64,
+        amostras_por_bloco: int = 65536,
+    ):
         self.sigma = sigma
+        self.dtype = np.dtype(dtype)  # float32 gera na metade do tempo e da memória
+        self.amostras_por_bloco = amostras_por_bloco
+        self.gerador = np.random.default_rng(semente)
 
     def gerar_ruido(self, sinal: np.ndarray) -> np.ndarray:
         """
@@ -19,16 +40,73 @@ class Ruido:
         de entrada.
         Ou seja, será gerado um ruído para cada amostra do sinal.
         """
-        ruido = np.random.normal(0, self.sigma, sinal.shape)
+        return self.gerar_bloco(np.shape(sinal))
+
+    def gerar_bloco(self, formato: int | tuple[int, ...]) -> np.ndarray:
+        """Gera um novo array de ruído com o formato pedido (ex: um bloco do fluxo)."""
+        ruido = self.gerador.standard_normal(formato, dtype=self.dtype)
+        ruido *= self.sigma
         return ruido
 
+    def adicionar(self, sinal: np.ndarray) -> np.ndarray:
+        """
+        Soma o ruído no próprio sinal, sem criar um array de ruído do tamanho do sinal:
+        o ruído é gerado em blocos de amostras_por_bloco num buffer reaproveitado.
+        A sequência de ruído é a mesma de gerar_ruido, qualquer que seja o bloco.
+        Retorna o próprio sinal.
+        """
+        if self.sigma == 0:
+            return sinal
+        if not sinal.flags.c_contiguous:
+            sinal += self.gerar_ruido(sinal)
+            return sinal
+
+        amostras = sinal.reshape(-1)
+        buffer = np.empty(min(self.amostras_por_bloco, amostras.size), dtype=self.dtype)
+        for inicio in range(0, amostras.size, self.amostras_por_bloco):
+            bloco = amostras[inicio : inicio + self.amostras_por_bloco]
+            ruido = buffer[: bloco.size]
+            self.gerador.standard_normal(out=ruido, dtype=self.dtype)
+            ruido *= self.sigma
+            bloco += ruido
+        return sinal
+
+
+@functools.lru_cache(maxsize=None)
+def _pesos_binarios(bits_por_simbolo: int) -> np.ndarray:
+    """
+    Peso de cada bit de um símbolo, do mais para o menos significativo
+    -> [2^(k-1), ..., 2, 1].
+    """
+    pesos = 2 ** np.arange(bits_por_simbolo - 1, -1, -1)
+    pesos.setflags(write=False)
+    return pesos
+
+
+@functools.lru_cache(maxsize=None)
+def _tabela_de_bits(bits_por_simbolo: int) -> np.ndarray:
+    """
+    Tabela (2^k x k) com os bits de cada símbolo: a linha d é o decimal d em binário.
+    """
+    simbolos = np.arange(2**bits_por_simbolo)
+    tabela = (simbolos[:, np.newaxis] // _pesos_binarios(bits_por_simbolo)) % 2
+    tabela.setflags(write=False)
+    return tabela
+
 
 class Sinal:
     """Classe com métodos auxiliares para a criaçao e manipulação de sinais."""
 
-    def __init__(self, bits_por_simbolo: int = 1, taxa_amostragem: int = 1000):
+    def __init__(
+        self,
+        bits_por_simbolo: int = 1,
+        taxa_amostragem: int = 1000,
+        dtype: np.dtype = np.float64,
+    ):
         self._bits_por_simbolo = bits_por_simbolo
         self._taxa_amostragem = taxa_amostragem
+        # Tipo das formas de onda geradas (float64 ou float32)
+        self.dtype = np.dtype(dtype)
 
     @property
     def bits_por_simbolo(self) -> int:
@@ -42,6 +120,22 @@ class Sinal:
     def bits_por_simbolo(self, valor: int):
         self._bits_por_simbolo = valor
 
+    @property
+    def pesos(self) -> np.ndarray:
+        """
+        Pesos binários de cada bit do símbolo -> [2^(k-1), ..., 2, 1] (compartilhado,
+        somente leitura).
+        """
+        return _pesos_binarios(self._bits_por_simbolo)
+
+    @property
+    def tabela_de_bits(self) -> np.ndarray:
+        """
+        Bits de cada símbolo possível -> [[bits do 0], [bits do 1], ...] (compartilhada,
+        somente leitura).
+        """
+        return _tabela_de_bits(self._bits_por_simbolo)
+
     @staticmethod
     def gerar_sinal_binario(mensagem: str) -> np.ndarray:
         """
@@ -52,18 +146,33 @@ class Sinal:
         return bits
 
     def gerar_pulso_tensao_ideal(
-        self, simbolos_decimais: np.ndarray, tempo_de_simbolo: float = 1.0
+        self,
+        simbolos_decimais: np.ndarray,
+        tempo_de_simbolo: float = 1.0,
+        somente_leitura: bool = False,
     ) -> np.ndarray:
         """
         Gera uma curva de tensão **ideal** simulando um pulso elétrico.
         `simbolos_decimais` é um array com os símbolos em decimal -> [simbolo1, simbolo2, simbolo3, ...].
         O array numpy retornado tem a forma -> [[simbolo_1], [simbolo_2], [simbolo_3], ...].
+        Um array 2-D (lote) ganha uma dimensão a mais, como em gerar_pulso_tensao.
+        Com `somente_leitura`, retorna uma visão sem cópia (passo 0 nas amostras), para
+        quem só vai ler a forma de onda: não ocupa memória além dos próprios símbolos.
         """
-        sinal = []
-        for simbolo in simbolos_decimais:
-            sinal.append(np.full(int(tempo_de_simbolo * self.taxa_amostragem), simbolo))
+        simbolos_decimais = np.asarray(simbolos_decimais, dtype=self.dtype)
+        formato = simbolos_decimais.shape + (
+            int(tempo_de_simbolo * self.taxa_amostragem),
+        )
+
+        # Cada símbolo repetido ao longo das amostras
+        # -> [[s1, s1, ...], [s2, s2, ...], ...]
+        repetidos = np.broadcast_to(simbolos_decimais[..., np.newaxis], formato)
+        if somente_leitura:
+            return repetidos
 
-        return np.array(sinal)
+        sinal = np.empty(formato, dtype=self.dtype)
+        sinal[...] = repetidos
+        return sinal
 
     def gerar_pulso_tensao(
         self,
@@ -82,21 +191,48 @@ class Sinal:
         # faz sentido definir quantos símbolos serão representados até que seja considerado
         # que um período foi percorrido. Isso melhora o resultado para sequências muito extensas
         # de símbolos.
-        segmentos = np.split(
-            simbolos_decimais,
-            np.arange(
-                simbolos_por_periodo, len(simbolos_decimais), simbolos_por_periodo
-            ),  # [[s1], [s2], [s3], ...] -> [[s1, s2, s3, s4], [s5, s6, s7, s8], ...]
+        # Um array 2-D é tratado como um lote de sequências independentes, uma por
+        # linha, e a saída ganha uma dimensão a mais -> [[[forma_de_onda1], ...], ...].
+        simbolos_decimais = np.asarray(simbolos_decimais, dtype=self.dtype)
+        linhas = np.atleast_2d(simbolos_decimais)
+        num_linhas, num_simbolos = linhas.shape
+        num_completos = num_simbolos // simbolos_por_periodo
+        fim_completos = num_completos * simbolos_por_periodo
+        amostras_por_simbolo = (
+            int(tempo_de_simbolo * simbolos_por_periodo * self.taxa_amostragem)
+            // simbolos_por_periodo
         )
-        forma_de_onda = np.concatenate(
-            [
-                self.__serie_de_fourier(
-                    segmento, tempo_de_simbolo=tempo_de_simbolo, harmonicas=8
-                )
-                for segmento in segmentos
-            ]
+
+        # Cada parte da série é escrita direto no seu pedaço do array de saída
+        forma_de_onda = np.empty(
+            (num_linhas, num_simbolos, amostras_por_simbolo), dtype=self.dtype
         )
 
+        # Todos os segmentos completos compartilham o mesmo período, então são
+        # sintetizados de uma só vez -> [[s1, s2, s3, s4], [s5, s6, s7, s8], ...]
+        if num_completos > 0:
+            self.__serie_de_fourier(
+                linhas[:, :fim_completos].reshape(
+                    (num_linhas, num_completos, simbolos_por_periodo)
+                ),
+                tempo_de_simbolo=tempo_de_simbolo,
+                harmonicas=8,
+                out=forma_de_onda[:, :fim_completos].reshape(
+                    (num_linhas, num_completos, -1)
+                ),
+            )
+
+        # O último segmento pode ter menos símbolos (e portanto outro período)
+        if fim_completos < num_simbolos:
+            self.__serie_de_fourier(
+                linhas[:, fim_completos:].reshape((num_linhas, 1, -1)),
+                tempo_de_simbolo=tempo_de_simbolo,
+                harmonicas=8,
+                out=forma_de_onda[:, fim_completos:].reshape((num_linhas, 1, -1)),
+            )
+
+        if simbolos_decimais.ndim == 1:
+            return forma_de_onda[0]
         return forma_de_onda
 
     def sequencia_de_bits_para_simbolos(
@@ -112,17 +248,21 @@ class Sinal:
 
         num_simbolos = len(bits) // self.bits_por_simbolo
         bits_excedentes = len(bits) % self.bits_por_simbolo
-        
+
         bits_excedentes_array = bits[num_simbolos * self.bits_por_simbolo :]
         bits = bits[: num_simbolos * self.bits_por_simbolo]
-        
+
         simbolos = bits.reshape((num_simbolos, self.bits_por_simbolo))
 
         if bits_excedentes > 0:
-            simbolos_excedentes = np.concatenate((
-                bits_excedentes_array,
-                np.zeros(self.bits_por_simbolo - bits_excedentes_array.size, dtype=int),
-            ))
+            simbolos_excedentes = np.concatenate(
+                (
+                    bits_excedentes_array,
+                    np.zeros(
+                        self.bits_por_simbolo - bits_excedentes_array.size, dtype=int
+                    ),
+                )
+            )
             simbolos = np.append(simbolos, simbolos_excedentes)
             num_simbolos += 1
 
@@ -135,79 +275,97 @@ class Sinal:
         Retorna um array numpy com os símbolos em decimal -> [simbolo1_decimal, simbolo2_decimal, ...].
         A normalização é feita para facilitar a divisão da tensão quando bits_por_simbolo > 1.
         """
-        sinal = []
         passo_de_tensao = 1 / (2**self.bits_por_simbolo - 1)
+        bits = np.asarray(bits)
 
         if self.bits_por_simbolo > 1:
-            bits = bits.reshape((-1, self.bits_por_simbolo))
-            for simbolo in bits:
-                valor_simbolo = 0
-                for i, bit in enumerate(simbolo):
-                    valor_simbolo += bit * (2 ** (self.bits_por_simbolo - i - 1))
-                nivel_tensao = valor_simbolo * passo_de_tensao
-                sinal.append(nivel_tensao)
-        else:
-            for bit in bits:
-                nivel_tensao = bit * passo_de_tensao
-                sinal.append(nivel_tensao)
+            # Valor de cada símbolo em um único produto com os pesos binários
+            # (pesos no mesmo tipo dos bits, para um sinal float32 continuar float32)
+            pesos = (
+                self.pesos.astype(bits.dtype) if bits.dtype.kind == "f" else self.pesos
+            )
+            valores_simbolos = bits.reshape((-1, self.bits_por_simbolo)) @ pesos
+            return valores_simbolos * passo_de_tensao
 
-        return np.array(sinal)
+        return bits * passo_de_tensao
 
-    def decimal_para_binario(self, decimal: int) -> np.ndarray:
+    def decimal_para_binario(self, decimal: int | np.ndarray) -> np.ndarray:
         """
-        Converte um número decimal em sua representação binária com bits_por_simbolo bits.
+        Converte um número decimal (de 0 a 2^bits_por_simbolo - 1) em sua representação
+        binária com bits_por_simbolo bits.
         Retorna um array numpy com os bits do símbolo -> [b1, b2, b3, ...].
+        Também aceita um array de decimais, retornando um símbolo por linha
+        -> [[s1_b1, s1_b2, ...], ...].
         """
-        formato = (
-            "{0:0" + str(self.bits_por_simbolo) + "b}"
-        )  # Garante o número de bits com um padding de zeros à esquerda
-        binario_str = formato.format(decimal)
-        binario = np.array([int(bit) for bit in binario_str])
-        return binario
+        return np.take(self.tabela_de_bits, decimal, axis=0)
 
     def __serie_de_fourier(
-        self, simbolos: np.ndarray, tempo_de_simbolo: float, harmonicas: int
+        self,
+        segmentos: np.ndarray,
+        tempo_de_simbolo: float,
+        harmonicas: int,
+        out: np.ndarray,
     ) -> np.ndarray:
         """
-        Gera uma série de Fourier.
-        Retorna um array numpy com a forma de onda com taxa_amostragem * tempo_de_simbolo amostras ([amostras/s] * [s]).
+        Gera a série de Fourier de vários segmentos de mesmo tamanho de uma só vez.
+        `segmentos` é um array numpy com os símbolos de cada segmento
+        -> [[[s1, s2, s3, s4], [s5, s6, s7, s8], ...], ...].
+        `out` recebe a forma de onda de cada segmento, com taxa_amostragem *
+        tempo_de_simbolo amostras por símbolo ([amostras/s] * [s])
+        -> [[[forma_de_onda_s1_a_s4], [forma_de_onda_s5_a_s8], ...], ...].
         """
-        periodo = tempo_de_simbolo * len(simbolos)
+        simbolos_por_segmento = segmentos.shape[-1]
+        periodo = tempo_de_simbolo * simbolos_por_segmento
         t = np.linspace(0, periodo, int(periodo * self.taxa_amostragem), endpoint=False)
-        c = (
-            2
-            / periodo
-            * quad(
-                lambda t: simbolos[int(t // tempo_de_simbolo)],
-                0,
-                periodo,
-            )[0]
-        )
 
-        resultado = np.zeros_like(t) + c / 2
+        c, an, bn = self.__coeficientes_de_fourier(segmentos, harmonicas)
 
-        for n in range(1, harmonicas + 1):
-            y_an = lambda t: simbolos[int(t // tempo_de_simbolo)] * np.sin(
-                2 * np.pi * n * t / periodo
-            )
-            y_bn = lambda t: simbolos[int(t // tempo_de_simbolo)] * np.cos(
-                2 * np.pi * n * t / periodo
-            )
+        # Bases de seno e cosseno empilhadas
+        # -> [[sen(2πt/T)], [sen(4πt/T)], ..., [cos(2πt/T)], ...] (calculadas em float64
+        # e só então convertidas para o tipo da saída)
+        n = np.arange(1, harmonicas + 1)
+        angulos = 2 * np.pi * np.outer(n, t) / periodo
+        bases = np.concatenate((np.sin(angulos), np.cos(angulos))).astype(out.dtype)
 
-            an = (
-                np.sin(2 * np.pi * n * t / periodo)
-                * (2.0 / periodo)
-                * np.array(quad(y_an, 0, periodo))[0]  # descarta o valor do erro
-            )
-            bn = (
-                np.cos(2 * np.pi * n * t / periodo)
-                * (2.0 / periodo)
-                * np.array(quad(y_bn, 0, periodo))[0]  # descarta o valor do erro
-            )
+        # an·sen + bn·cos em um único produto de matrizes, já no array de saída
+        np.matmul(np.concatenate((an, bn), axis=-1), bases, out=out)
+        out += c[..., np.newaxis] / 2
 
-            resultado += an + bn
+        return out
 
-        return np.reshape(resultado, (len(simbolos), -1))
+    @staticmethod
+    def __coeficientes_de_fourier(
+        segmentos: np.ndarray, harmonicas: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calcula os coeficientes da série de Fourier de cada segmento.
+        Como o sinal é constante em cada símbolo, as integrais têm forma fechada:
+        para o símbolo k de um segmento com m símbolos, com θ_k = 2πnk/m,
+        - c  = 2/m * Σ s_k
+        - an = Σ s_k * (cos(θ_k) - cos(θ_k+1)) / (πn)
+        - bn = Σ s_k * (sen(θ_k+1) - sen(θ_k)) / (πn)
+        Retorna uma tupla (c, an, bn) com as formas -> [c1, c2, ...],
+        [[a1, a2, ...], ...], [[b1, b2, ...], ...].
+        """
+        simbolos_por_segmento = segmentos.shape[-1]
+        n = np.arange(1, harmonicas + 1)
+        bordas = np.arange(simbolos_por_segmento + 1)
+        theta = 2 * np.pi * np.outer(n, bordas) / simbolos_por_segmento
+
+        # Integral de cada símbolo em cada harmônica
+        # -> [[harmonica1_simbolo1, ...], ...]
+        integrais_seno = (np.cos(theta[:, :-1]) - np.cos(theta[:, 1:])) / (
+            np.pi * n[:, np.newaxis]
+        )
+        integrais_cosseno = (np.sin(theta[:, 1:]) - np.sin(theta[:, :-1])) / (
+            np.pi * n[:, np.newaxis]
+        )
+
+        c = 2 * segmentos.mean(axis=-1)
+        an = segmentos @ integrais_seno.T.astype(segmentos.dtype)
+        bn = segmentos @ integrais_cosseno.T.astype(segmentos.dtype)
+
+        return c, an, bn
 
 
 class Portadora:
@@ -218,53 +376,196 @@ class Portadora:
         fase: float,
         tempo_de_simbolo: float = 1.0,
         taxa_amostragem: int = 1000,
+        dtype: np.dtype = np.float64,
+        fase_continua: bool = False,
     ):
         self.amplitude = amplitude
         self.frequencia = frequencia
         self.fase = fase
         self.tempo_de_simbolo = tempo_de_simbolo
         self.taxa_amostragem = taxa_amostragem
+        self.dtype = np.dtype(dtype)  # Tipo do sinal modulado (float64 ou float32)
+        # Fase contínua: cada símbolo começa na fase em que o anterior terminou, como um
+        # único oscilador que só muda de frequência (sem saltos de fase no FSK, e
+        # portanto sem espalhamento espectral).
+        # Do contrário, todo símbolo recomeça em t=0.
+        self.fase_continua = fase_continua
+        self._fase_final = (
+            0.0  # Fase do oscilador no fim da última chamada (em radianos)
+        )
+        self._base_iq = None  # (configuração, tabelas de seno e cosseno de um símbolo)
 
     def modular(
-        self, amplitudes: np.ndarray, frequencias: np.ndarray, fases: np.ndarray
+        self,
+        amplitudes: np.ndarray,
+        frequencias: np.ndarray,
+        fases: np.ndarray,
+        out: np.ndarray | None = None,
+        continuar: bool = False,
     ) -> np.ndarray:
         """
         Modula a portadora conforme os parâmetros fornecidos.
         Amplitudes - array com as amplitudes de 0 a 1 para cada símbolo.
         Frequencias - array com as frequências de 1 a 2 para cada símbolo.
         Fases - array com as fases de 0 a 180 graus para cada símbolo.
+        Out - buffer opcional onde o sinal é escrito (reaproveita memória entre quadros)
+        Continuar - com fase contínua, começa na fase em que a chamada anterior parou.
+        Os parâmetros também podem vir em lote (quadros x símbolos): com fase
+        contínua, cada quadro começa na fase 0.
         Retorna o sinal modulado.
         """
-        numero_de_simbolos = len(amplitudes)
+        numero_de_simbolos = np.size(amplitudes)
+        amostras_por_simbolo = int(self.tempo_de_simbolo * self.taxa_amostragem)
         tempo_por_simbolo = np.linspace(
             0,
             self.tempo_de_simbolo,
-            int(self.tempo_de_simbolo * self.taxa_amostragem),
+            amostras_por_simbolo,
             endpoint=False,
+            dtype=self.dtype,
         )
 
-        sinal_modulado = np.array([])
-        for i in range(numero_de_simbolos):
-            amp = amplitudes[i]
-            freq = frequencias[i]
-            fase = fases[i]
+        out = self.__buffer_de_saida(numero_de_simbolos * amostras_por_simbolo, out)
+
+        # Amplitude varia entre 0 e a amplitude da portadora
+        amplitude = np.asarray(amplitudes) * self.amplitude
+
+        # Frequência varia entre f e 2f
+        frequencia = np.asarray(frequencias) * self.frequencia
 
-            # Amplitude varia entre 0 e a amplitude da portadora
-            amplitude = amp * self.amplitude
+        # Fase varia entre 0 e 180 graus
+        fase = np.deg2rad(np.asarray(fases) + self.fase)
+
+        if self.fase_continua:
+            fase = fase + self.__fase_inicial_dos_simbolos(frequencia, continuar)
+
+        amplitude, frequencia, fase = (
+            np.ravel(amplitude),
+            np.ravel(frequencia),
+            np.ravel(fase),
+        )
 
-            # Frequência varia entre f e 2fG
-            frequencia = freq * self.frequencia
+        # Cada linha é um símbolo, todas usando a mesma base de tempo
+        # -> [[ciclo1], [ciclo2], ...]
+        ciclos = out.reshape((numero_de_simbolos, amostras_por_simbolo))
+        np.multiply.outer(2 * np.pi * frequencia, tempo_por_simbolo, out=ciclos)
+        ciclos += fase[:, np.newaxis]
+        np.sin(ciclos, out=ciclos)
+        ciclos *= amplitude[:, np.newaxis]
 
-            # Fase varia entre 0 e 180 graus
-            fase = np.deg2rad(fase + self.fase)
+        return out
 
-            ciclo = amplitude * np.sin(
-                2 * np.pi * frequencia * tempo_por_simbolo + fase
+    def modular_iq(
+        self,
+        simbolos_complexos: np.ndarray,
+        out: np.ndarray | None = None,
+        continuar: bool = False,
+    ) -> np.ndarray:
+        """
+        Modula a portadora a partir dos símbolos em banda base complexa
+        -> [I1 + jQ1, I2 + jQ2, ...] (ou em lote, quadros x símbolos).
+        Mesmo sinal de modular() com amplitude |s| e fase ∠s, sem senos por amostra:
+        A·sen(ωt + φ) = A·cos(φ)·sen(ωt) + A·sen(φ)·cos(ωt) = I·sen(ωt) + Q·cos(ωt),
+        então o sinal inteiro é um único produto [I Q] @ [sen; cos] com as tabelas da
+        portadora de um símbolo.
+        Out e continuar funcionam como em modular().
+        """
+        simbolos_complexos = np.asarray(simbolos_complexos)
+        numero_de_simbolos = simbolos_complexos.size
+        base = self.base_iq()
+        out = self.__buffer_de_saida(numero_de_simbolos * base.shape[1], out)
+
+        if self.fase_continua:
+            frequencia = np.full(simbolos_complexos.shape, float(self.frequencia))
+            simbolos_complexos = simbolos_complexos * np.exp(
+                1j * self.__fase_inicial_dos_simbolos(frequencia, continuar)
             )
 
-            sinal_modulado = np.concatenate((sinal_modulado, ciclo))
+        # Pulso retangular em banda base: I e Q constantes durante o símbolo
+        componentes = np.empty((numero_de_simbolos, 2), dtype=self.dtype)
+        componentes[:, 0] = np.ravel(simbolos_complexos.real)
+        componentes[:, 1] = np.ravel(simbolos_complexos.imag)
 
-        return sinal_modulado
+        # Conversão para a frequência da portadora, direto no buffer de saída
+        np.matmul(componentes, base, out=out.reshape((numero_de_simbolos, -1)))
+        return out
+
+    def correlacionar_iq(self, sinal: np.ndarray) -> np.ndarray:
+        """
+        Caminho inverso de modular_iq: projeta cada símbolo recebido nas tabelas de seno
+        e cosseno e retorna o símbolo em banda base estimado (mínimos quadrados)
+        -> [I1 + jQ1, I2 + jQ2, ...].
+        Amostras que não completam um símbolo são ignoradas.
+        """
+        base = self.base_iq()
+        amostras = np.ravel(sinal)
+        numero_de_simbolos = len(amostras) // base.shape[1]
+        segmentos = amostras[: numero_de_simbolos * base.shape[1]].reshape(
+            (numero_de_simbolos, -1)
+        )
+
+        # Correlação com seno e cosseno, corrigida pela matriz de Gram (que é diagonal
+        # quando o símbolo tem um número inteiro de ciclos)
+        projecoes = segmentos @ base.T
+        componentes = np.linalg.solve(base @ base.T, projecoes.T)
+        return componentes[0] + 1j * componentes[1]
+
+    def base_iq(self) -> np.ndarray:
+        """
+        Tabelas da portadora em um símbolo -> [[Vp·sen(ωt + φ0)], [Vp·cos(ωt + φ0)]] (2
+        x amostras_por_simbolo).
+        Calculadas uma única vez para cada configuração da portadora.
+        """
+        configuracao = (
+            self.amplitude,
+            self.frequencia,
+            self.fase,
+            self.tempo_de_simbolo,
+            self.taxa_amostragem,
+            self.dtype,
+        )
+        if self._base_iq is None or self._base_iq[0] != configuracao:
+            amostras_por_simbolo = int(self.tempo_de_simbolo * self.taxa_amostragem)
+            t = np.linspace(
+                0, self.tempo_de_simbolo, amostras_por_simbolo, endpoint=False
+            )
+            angulo = 2 * np.pi * self.frequencia * t + np.deg2rad(self.fase)
+            base = (self.amplitude * np.stack((np.sin(angulo), np.cos(angulo)))).astype(
+                self.dtype
+            )
+            base.setflags(write=False)
+            self._base_iq = (configuracao, base)
+        return self._base_iq[1]
+
+    def __buffer_de_saida(
+        self, total_de_amostras: int, out: np.ndarray | None
+    ) -> np.ndarray:
+        if out is None:
+            return np.empty(total_de_amostras, dtype=self.dtype)
+        if out.shape != (total_de_amostras,) or not out.flags.c_contiguous:
+            raise ValueError(
+                f"Buffer de saída deve ser contíguo com forma ({total_de_amostras},), "
+                f"recebido {out.shape}."
+            )
+        return out
+
+    def __fase_inicial_dos_simbolos(
+        self, frequencia: np.ndarray, continuar: bool
+    ) -> np.ndarray:
+        """
+        Fase acumulada pelo oscilador até o início de cada símbolo: soma acumulada dos
+        giros 2π f T dos símbolos anteriores -> [0, 2πf1T, 2π(f1+f2)T, ...] (uma
+        sequência por linha no lote).
+        Reduzida a [0, 2π) para não perder precisão em sinais longos.
+        """
+        giros = 2 * np.pi * self.tempo_de_simbolo * frequencia
+        acumulado = np.cumsum(giros, axis=-1)
+        inicio = acumulado - giros
+        if continuar:
+            inicio += self._fase_final
+            acumulado += self._fase_final
+        if acumulado.size > 0:
+            self._fase_final = float(np.mod(np.ravel(acumulado)[-1], 2 * np.pi))
+        return np.mod(inicio, 2 * np.pi)
 
 
 class Gray:
@@ -319,6 +620,22 @@ class CodificacaoBase(ABC):
         """
         pass
 
+    def continuar(self, bits: np.ndarray) -> np.ndarray:
+        """
+        Codifica o próximo trecho de uma sequência longa, mantendo o estado deixado
+        pelo trecho anterior (ex: a alternância do bipolar).
+        Codificações sem estado apenas chamam codificar().
+        """
+        return self.codificar(bits)
+
+    def codificar_lote(self, simbolos: np.ndarray) -> np.ndarray:
+        """
+        codificar() de cada quadro de um lote (quadros x símbolos [x bits]), de uma só
+        vez: com os quadros no segundo eixo, cada um é uma coluna independente.
+        """
+        simbolos = np.swapaxes(np.asarray(simbolos), 0, 1)
+        return np.swapaxes(self.codificar(simbolos), 0, 1)
+
 
 class Bipolar(CodificacaoBase):
     """Codificação Bipolar ou AMI:
@@ -330,53 +647,62 @@ class Bipolar(CodificacaoBase):
         self._ultimo_sinal = 1.0  # alterna +1/-1 para bits 1
 
     def codificar(self, bits: np.ndarray) -> np.ndarray:
-        # Diferente de 0 somente quando clock é alto
+        # Toda mensagem começa com um pulso positivo
         self._ultimo_sinal = 1.0
-        clock = self.__clock(bits)
-        saida = []
-
-        for i, clk in enumerate(clock):
-            # Cada símbolo dura um ciclo de clock (rising + falling edges)
-            i_mensagem = i // 2
-            simbolo = bits[i_mensagem]
-            mais_de_um_bit_por_simbolo = (
-                simbolo.ndim > 0 if i_mensagem < len(bits) else False
-            )
+        return self.continuar(bits)
 
-            # Quando clock é alto, transmite 1 ou -1 de forma alternada
-            if clk == 1.0:
-                if mais_de_um_bit_por_simbolo and simbolo.any():
-                    simbolo_saida = simbolo * self._ultimo_sinal
-                    self._ultimo_sinal *= -1.0
-
-                    saida.append(simbolo_saida)
-                elif mais_de_um_bit_por_simbolo:
-                    saida.append([0.0] * len(simbolo))
-                else:
-                    if simbolo == 1:
-                        saida.append(self._ultimo_sinal)
-                        self._ultimo_sinal *= -1.0
-                    else:
-                        saida.append(0.0)
-            # Quando clock é baixo, transmite 0
-            else:
-                if mais_de_um_bit_por_simbolo:
-                    saida.append([0.0] * len(simbolo))
-                else:
-                    saida.append(0.0)
+    def continuar(self, bits: np.ndarray) -> np.ndarray:
+        bits = np.asarray(bits)
+        mais_de_um_bit_por_simbolo = bits.ndim > 1
 
-        return np.array(saida)
+        # Símbolos que geram pulso: bit 1, ou algum bit ligado (símbolos de vários bits)
+        if mais_de_um_bit_por_simbolo:
+            ativos = bits.any(axis=1)
+        else:
+            ativos = bits == 1
 
-    def __clock(self, bits: np.ndarray) -> np.ndarray:
-        clock = np.zeros(len(bits) * 2)
+        inicial = self._ultimo_sinal
+        saida = self._alternar(bits, ativos, inicial)
 
-        for i in range(len(clock)):
-            if i % 2 == 0:
-                clock[i] = 1.0
-            else:
-                clock[i] = 0.0
+        # Guarda o sinal do próximo pulso, para um eventual próximo trecho
+        if np.count_nonzero(ativos) % 2 == 1:
+            self._ultimo_sinal = -inicial
 
-        return clock
+        return saida
+
+    def codificar_lote(self, simbolos: np.ndarray) -> np.ndarray:
+        # Símbolos no eixo 0 e quadros no eixo 1: o XOR acumulado recomeça em cada
+        # quadro, que sempre começa com um pulso positivo
+        simbolos = np.swapaxes(np.asarray(simbolos), 0, 1)
+        if simbolos.ndim > 2:
+            ativos = simbolos.any(axis=2)
+        else:
+            ativos = simbolos == 1
+        return np.swapaxes(self._alternar(simbolos, ativos, 1.0), 0, 1)
+
+    @staticmethod
+    def _alternar(bits: np.ndarray, ativos: np.ndarray, inicial: float) -> np.ndarray:
+        """
+        Pulsos alternados ao longo do eixo 0 (símbolos), começando por `inicial`.
+        `ativos` marca os símbolos que geram pulso; quando `bits` tem um eixo a mais
+        que `ativos`, esse eixo são os bits de cada símbolo.
+        """
+        # Soma acumulada dos pulsos em módulo 2 (XOR acumulado): o k-ésimo pulso tem
+        # o sinal inicial se k for par, ou seja, se a contagem até ele for ímpar
+        paridade = np.logical_xor.accumulate(ativos, axis=0)
+
+        # Polaridade de cada símbolo, por uma tabela indexada por ativo + 2*paridade:
+        # inativo -> 0, ativo -> sinal inicial invertido ou não
+        indices = ativos.view(np.uint8) | (paridade.view(np.uint8) << 1)
+        polaridade = np.array([0.0, -inicial, 0.0, inicial])[indices]
+
+        # Quando clock é alto, transmite o pulso; quando é baixo, transmite 0
+        saida = np.zeros((2 * len(bits),) + bits.shape[1:])
+        if bits.ndim > ativos.ndim:
+            saida[0::2] = bits * polaridade[..., np.newaxis]
+        else:
+            saida[0::2] = polaridade
+        return saida
 
 
 class Manchester(CodificacaoBase):
@@ -385,55 +711,21 @@ class Manchester(CodificacaoBase):
     """
 
     def codificar(self, bits: np.ndarray) -> np.ndarray:
+        bits = np.asarray(bits)
         clock = self.__clock(bits)
-        saida = []
-        for i, clk in enumerate(clock):
-            i_mensagem = i // 2
 
-            mais_de_um_bit_por_simbolo = (
-                bits[i_mensagem].ndim > 0 if i_mensagem < len(bits) else False
-            )
+        # Cada bit dura um ciclo de clock (alto + baixo) -> [b1, b1, b2, b2, ...]
+        bits_repetidos = np.repeat(bits == 1, 2, axis=0)
 
-            if clk == 1.0:  # XOR com 1 === inverte bits
-                if mais_de_um_bit_por_simbolo:
-                    simbolo_saida = []
-                    for b in bits[i_mensagem]:
-                        if b == 1:
-                            simbolo_saida.append(0.0)
-                        else:
-                            simbolo_saida.append(1.0)
-                    saida.append(simbolo_saida)
-                else:
-                    if bits[i_mensagem] == 1:
-                        saida.append(0.0)
-                    else:
-                        saida.append(1.0)
-            else:  # XOR com 0 === mantém bits
-                if mais_de_um_bit_por_simbolo:
-                    simbolo_saida = []
-                    for b in bits[i_mensagem]:
-                        if b == 1:
-                            simbolo_saida.append(1.0)
-                        else:
-                            simbolo_saida.append(0.0)
-                    saida.append(simbolo_saida)
-                else:
-                    if bits[i_mensagem] == 1:
-                        saida.append(1.0)
-                    else:
-                        saida.append(0.0)
-
-        return np.array(saida)
+        # XOR com 1 === inverte bits, XOR com 0 === mantém bits
+        formato_do_clock = (-1,) + (1,) * (bits.ndim - 1)
+        saida = bits_repetidos ^ clock.reshape(formato_do_clock)
 
-    def __clock(self, bits: np.ndarray) -> np.ndarray:
-        clock = np.zeros(len(bits) * 2)
+        return saida.astype(float)
 
-        for i in range(len(clock)):
-            if i % 2 == 0:
-                clock[i] = 1.0
-            else:
-                clock[i] = 0.0
-        return clock
+    def __clock(self, bits: np.ndarray) -> np.ndarray:
+        # Alto (True) na primeira metade de cada bit e baixo (False) na segunda
+        return np.tile([True, False], len(bits))
 
 
 class NRZPolar(CodificacaoBase):
@@ -442,24 +734,8 @@ class NRZPolar(CodificacaoBase):
     """
 
     def codificar(self, bits: np.ndarray) -> np.ndarray:
-        saida = []
-        for simbolo in bits:
-            if simbolo.ndim > 0:
-                simbolo_saida = []
-                for b in simbolo:
-                    if b == 1:
-                        simbolo_saida.append(1.0)
-                    else:
-                        simbolo_saida.append(-1.0)
-
-                saida.append(simbolo_saida)
-            else:
-                if simbolo == 1:
-                    saida.append(1.0)
-                else:
-                    saida.append(-1.0)
-
-        return np.array(saida)
+        # 2*b - 1: 1 -> +1 e 0 -> -1 (qualquer valor diferente de 1 conta como 0)
+        return 2.0 * (np.asarray(bits) == 1) - 1.0
 
 
 CODIFICACOES = {
@@ -474,6 +750,50 @@ CODIFICACOES = {
 
 
 class ModulacaoBase(ABC):
+    """Base das modulações.
+    Cada modulação monta, uma única vez, uma tabela com os parâmetros da portadora
+    para cada símbolo possível -> [[amplitude, frequencia, fase] do símbolo 0, ...],
+    e gerar_parametros apenas busca as linhas dos símbolos recebidos nessa tabela.
+    Modulações que não mudam a frequência da portadora (ASK, PSK, QPSK, QAM) também
+    têm uma constelação: o símbolo complexo em banda base de cada símbolo,
+    I + jQ = amplitude * e^(j*fase).
+    """
+
+    # Bits por símbolo menores que o da ordem fixa que a modulação também aceita,
+    # usando só parte da constelação
+    bits_reduzidos: tuple[int, ...] = ()
+
+    def __init__(self, bits_por_simbolo: int | None = None):
+        self.bits_por_simbolo = bits_por_simbolo
+        self._tabela = None if bits_por_simbolo is None else self._gerar_tabela()
+        self._constelacao = None
+        if self._tabela is not None and np.all(self._tabela[:, 1] == 1):
+            self._constelacao = self._tabela[:, 0] * np.exp(
+                1j * np.deg2rad(self._tabela[:, 2])
+            )
+
+    @property
+    def tabela(self) -> np.ndarray | None:
+        """Tabela (2^bits_por_simbolo x 3) com amplitude, frequência e fase (graus)."""
+        return self._tabela
+
+    @property
+    def constelacao(self) -> np.ndarray | None:
+        """Símbolo complexo (I + jQ) de cada símbolo, ou None se a modulação for FSK."""
+        return self._constelacao
+
+    def gerar_simbolos_complexos(self, simbolos_decimais: np.ndarray) -> np.ndarray:
+        """
+        Recebe um array numpy com os símbolos em decimal -> [simbolo1, simbolo2, ...].
+        Retorna o ponto da constelação de cada símbolo -> [I1 + jQ1, I2 + jQ2, ...].
+        """
+        return self._constelacao[self._indices(simbolos_decimais)]
+
+    @abstractmethod
+    def _gerar_tabela(self) -> np.ndarray:
+        """Monta a tabela de parâmetros de todos os 2^bits_por_simbolo símbolos."""
+        pass
+
     @abstractmethod
     def gerar_parametros(self, simbolos_decimais: np.ndarray) -> np.ndarray:
         """
@@ -484,6 +804,19 @@ class ModulacaoBase(ABC):
         """
         pass
 
+    def _indices(self, simbolos_decimais: np.ndarray) -> np.ndarray:
+        """Converte os decimais normalizados (0 a 1) nos índices dos símbolos."""
+        maximo = 2**self.bits_por_simbolo - 1
+        return np.rint(np.asarray(simbolos_decimais) * maximo).astype(int)
+
+    def _niveis(self) -> np.ndarray:
+        """
+        Decimal normalizado de cada símbolo, calculado como em
+        Sinal.binario_para_decimal.
+        """
+        num_simbolos = 2**self.bits_por_simbolo
+        return np.arange(num_simbolos) * (1 / (num_simbolos - 1))
+
 
 class ASK(ModulacaoBase):
     """Modulação ASK (Amplitude Shift Keying).
@@ -492,18 +825,19 @@ class ASK(ModulacaoBase):
     Retorna um array com as amplitudes correspondentes a cada símbolo.
     """
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, bits_por_simbolo: int | None = None):
+        super().__init__(bits_por_simbolo)
 
-    def gerar_parametros(self, simbolos_decimais: np.ndarray) -> np.ndarray:
-        parametros = []
-
-        # Nota: simbolos_decimais já apresenta valores de 0 a 1
-        for simbolo in simbolos_decimais:
-            amplitude = simbolo
-            parametros.append(amplitude)
+    def _gerar_tabela(self) -> np.ndarray:
+        niveis = self._niveis()
+        return np.column_stack((niveis, np.ones_like(niveis), np.zeros_like(niveis)))
 
-        return np.array(parametros)
+    def gerar_parametros(self, simbolos_decimais: np.ndarray) -> np.ndarray:
+        # Nota: simbolos_decimais já apresenta valores de 0 a 1.
+        # Sem bits_por_simbolo não há tabela, mas o próprio valor já é a amplitude
+        if self.tabela is None:
+            return np.array(simbolos_decimais, dtype=float)
+        return self.tabela[self._indices(simbolos_decimais), 0]
 
 
 class FSK(ModulacaoBase):
@@ -513,17 +847,86 @@ class FSK(ModulacaoBase):
     Retorna um array com o multiplicador de frequência correspondentes a cada símbolo.
     """
 
-    def __init__(self):
-        super().__init__()
-
-    def gerar_parametros(self, simbolos_decimais: np.ndarray) -> np.ndarray:
-        parametros = []
+    def __init__(self, bits_por_simbolo: int | None = None):
+        super().__init__(bits_por_simbolo)
 
-        # Nota: simbolos_decimais já apresenta valores de 0 a 1
-        for simbolo in simbolos_decimais:
-            parametros.append(1 + simbolo)
+    def _gerar_tabela(self) -> np.ndarray:
+        niveis = self._niveis()
+        return np.column_stack(
+            (np.ones_like(niveis), 1 + niveis, np.zeros_like(niveis))
+        )
 
-        return np.array(parametros)
+    def gerar_parametros(self, simbolos_decimais: np.ndarray) -> np.ndarray:
+        # Nota: simbolos_decimais já apresenta valores de 0 a 1.
+        # Sem bits_por_simbolo não há tabela, mas a frequência é simplesmente 1 + valor
+        if self.tabela is None:
+            return 1 + np.array(simbolos_decimais, dtype=float)
+        return self.tabela[self._indices(simbolos_decimais), 1]
+
+
+@functools.lru_cache(maxsize=None)
+def _tabela_psk(bits_por_simbolo: int) -> np.ndarray:
+    """Tabela do M-PSK (M = 2^bits_por_simbolo), compartilhada e somente leitura."""
+    num_fases = 2**bits_por_simbolo
+    tabela_gray = Gray(bits_por_simbolo=bits_por_simbolo).tabela_gray
+
+    # O símbolo que está na posição i da sequência Gray recebe a i-ésima fase
+    tabela = np.zeros((num_fases, 3))
+    tabela[:, 0] = 1.0
+    tabela[:, 1] = 1.0
+    tabela[tabela_gray, 2] = np.arange(num_fases) * (360 / num_fases)
+    tabela.setflags(write=False)
+    return tabela
+
+
+@functools.lru_cache(maxsize=None)
+def _niveis_qam(ordem: int) -> np.ndarray:
+    """
+    Nível (de 0 a L-1, do mais negativo ao mais positivo) de I e de Q de cada símbolo do
+    M-QAM quadrado, com L = √M níveis por eixo
+    -> [[nivel_I do símbolo 0, nivel_Q do símbolo 0], ...].
+    Os bits do símbolo são intercalados entre os eixos (b0 b1 b2 b3 -> I = b0 b2, Q = b1
+    b3) e cada eixo usa um código Gray com o bit de sinal na frente, simétrico em torno
+    de zero (para L = 4: 01, 00, 10, 11).
+    Assim símbolos vizinhos na grade diferem em um único bit.
+    """
+    bits_por_eixo = int(np.log2(ordem)) // 2
+    num_niveis = 2**bits_por_eixo
+    codigos = Gray(bits_por_simbolo=bits_por_eixo).tabela_gray ^ (num_niveis // 2 - 1)
+    nivel_do_codigo = np.empty(num_niveis, dtype=int)
+    nivel_do_codigo[codigos] = np.arange(num_niveis)
+
+    bits = _tabela_de_bits(2 * bits_por_eixo)
+    pesos = _pesos_binarios(bits_por_eixo)
+    niveis = np.column_stack(
+        (nivel_do_codigo[bits[:, 0::2] @ pesos], nivel_do_codigo[bits[:, 1::2] @ pesos])
+    )
+    niveis.setflags(write=False)
+    return niveis
+
+
+@functools.lru_cache(maxsize=None)
+def _tabela_qam(ordem: int) -> np.ndarray:
+    """
+    Tabela de parâmetros do M-QAM quadrado, compartilhada e somente leitura.
+    I e Q assumem os valores ±1, ±3, ..., ±(L-1), normalizados para que os cantos tenham
+    amplitude 1 (para o 16QAM: ±1/(3√2) e ±1/√2).
+    """
+    num_niveis = int(round(np.sqrt(ordem)))
+    componentes = (2 * _niveis_qam(ordem) - (num_niveis - 1)) / (
+        (num_niveis - 1) * np.sqrt(2)
+    )
+    componente_i, componente_q = componentes[:, 0], componentes[:, 1]
+
+    tabela = np.column_stack(
+        (
+            np.sqrt(componente_i**2 + componente_q**2),
+            np.ones(ordem),
+            np.degrees(np.arctan2(componente_q, componente_i)) % 360,
+        )
+    )
+    tabela.setflags(write=False)
+    return tabela
 
 
 class PSK(ModulacaoBase):
@@ -534,114 +937,94 @@ class PSK(ModulacaoBase):
     """
 
     def __init__(self, bits_por_simbolo: int = 1):
-        self.bits_por_simbolo = bits_por_simbolo
-        super().__init__()
+        super().__init__(bits_por_simbolo)
 
-    def gerar_parametros(self, simbolos_decimais: np.ndarray) -> np.ndarray:
-        gray = Gray(
-            bits_por_simbolo=self.bits_por_simbolo, normalizado=True
-        )  # Codigo Gray com valores de 0 a 1
-        tabela_gray = gray.tabela_gray
-        parametros = []
-        num_fases = 2**self.bits_por_simbolo
+    def _gerar_tabela(self) -> np.ndarray:
+        return _tabela_psk(self.bits_por_simbolo)
 
+    def gerar_parametros(self, simbolos_decimais: np.ndarray) -> np.ndarray:
         # Nota: simbolos_decimais já apresenta valores de 0 a 1
-        for simbolo in simbolos_decimais:
-            indice = np.where(tabela_gray == simbolo)[0][0]
-            fase = indice * (360 / num_fases)
-            parametros.append(fase)
+        return self.tabela[self._indices(simbolos_decimais), 2]
+
 
-        return np.array(parametros)
+class MPSK(PSK):
+    """
+    Modulação M-PSK: o PSK descrito pelo número de símbolos M (2, 4, 8, 16...).
+    Ex: MPSK(8) é o 8-PSK, com 3 bits por símbolo.
+    """
 
+    def __init__(self, ordem: int = 8):
+        if ordem < 2 or ordem & (ordem - 1):
+            raise ValueError(f"M-PSK precisa de M potência de 2, recebido {ordem}.")
+        self.ordem = ordem
+        super().__init__(bits_por_simbolo=int(np.log2(ordem)))
 
-class QPSK(ModulacaoBase):
+
+class QPSK(MPSK):
     """Modulação QPSK (Quadrature Phase Shift Keying).
     A fase da portadora pode ser defasada de 0 a 360 graus
     em intervalos atrelados ao número de bits por símbolo (2 bits por símbolo para QPSK).
     Retorna um array com as fases correspondentes a cada símbolo.
     """
 
-    def __init__(self):
-        super().__init__()
-        self.psk = PSK(bits_por_simbolo=2)  # QPSK usa 2 bits por símbolo
+    # Com 1 bit por símbolo (padrão da interface) vira um BPSK
+    bits_reduzidos = (1,)
 
-    def gerar_parametros(self, simbolos_decimais: np.ndarray) -> np.ndarray:
-        return self.psk.gerar_parametros(simbolos_decimais)
+    def __init__(self):
+        super().__init__(ordem=4)  # QPSK usa 2 bits por símbolo
 
 
-class QAM16(ModulacaoBase):
-    """Modulação 16QAM (Quadrature Amplitude Modulation).
-    A fase da portadora pode ser defasada de 0 a 360 graus e ter sua amplitude variada entre 1/3√2 e 1√2
-    em intervalos atrelados ao número de bits por símbolo (2 bits por símbolo para QPSK).
+class MQAM(ModulacaoBase):
+    """
+    Modulação M-QAM (Quadrature Amplitude Modulation) quadrada: M = 4, 16, 64, 256...
+    Os símbolos formam uma grade √M x √M no plano I/Q, com mapeamento Gray (ver
+    _niveis_qam), e cada um é transmitido como uma amplitude e uma fase da portadora.
     Retorna um array com as amplitudes e fases correspondentes a cada símbolo.
     """
 
-    def __init__(self):
-        super().__init__()
-
-        self._gray_16qam_decimal = np.array(
-            [
-                [7, 5, 13, 15],  # [0, 1, 1, 1], [0, 1, 0, 1], [1,1,0,1], [1,1,1,1]
-                [6, 4, 12, 14],  # [0, 1, 1, 0], [0, 1, 0, 0], [1,1,0,0], [1,1,1,0]
-                [2, 0, 8, 10],  # [0, 0, 1, 0], [0, 0, 0, 0], [1,0,0,0], [1,0,1,0]
-                [3, 1, 9, 11],  # [0, 0, 1, 1], [0, 0, 0, 1], [1,0,0,1], [1,0,1,1]
-            ]
-        ) / (
-            2**4 - 1
-        )  # Normalizado entre 0 e 1
+    def __init__(self, ordem: int = 16):
+        bits_por_simbolo = int(np.log2(ordem)) if ordem >= 4 else 0
+        if 2**bits_por_simbolo != ordem or bits_por_simbolo % 2:
+            raise ValueError(
+                f"M-QAM quadrado precisa de M potência de 4, recebido {ordem}."
+            )
+        self.ordem = ordem
+        super().__init__(bits_por_simbolo=bits_por_simbolo)
 
     @property
     def tabela_gray(self) -> np.ndarray:
-        """Retorna a tabela Gray utilizada na modulação 16QAM."""
-        return self._gray_16qam_decimal
+        """
+        Símbolos (normalizados entre 0 e 1) na posição que ocupam na constelação:
+        linhas de Q decrescente, colunas de I crescente.
+        """
+        num_niveis = int(round(np.sqrt(self.ordem)))
+        niveis = _niveis_qam(self.ordem)
+        grade = np.empty((num_niveis, num_niveis))
+        grade[num_niveis - 1 - niveis[:, 1], niveis[:, 0]] = np.arange(self.ordem)
+        return grade / (self.ordem - 1)
+
+    def _gerar_tabela(self) -> np.ndarray:
+        return _tabela_qam(self.ordem)
 
     def gerar_parametros(self, simbolos_decimais: np.ndarray) -> np.ndarray:
-        amplitudes = np.zeros_like(simbolos_decimais, dtype=float)
-        fases = np.zeros_like(simbolos_decimais, dtype=float)
-
-        # Q > 0 === X1XX
-        # Q < 0 === X0XX
-        # I > 0 === 1XXX
-        # I < 0 === 0XXX
-        # I = 1/(3*sqrt(2)) === XX0X
-        # I = 1/sqrt(2) === XX1X
-        # Q = 1/(3*sqrt(2)) === XXX0
-        # Q = 1/sqrt(2) === XXX1
-        # 45deg === XX00 e XX11
-        # 75deg === XX01
-        # 15deg === XX10
-        for i, simbolo in enumerate(simbolos_decimais):
-            linha, coluna = np.where(self._gray_16qam_decimal == simbolo)
-            linha = linha[0]
-            coluna = coluna[0]
-
-            # Determina componente I
-            if coluna in [0, 1]:  # I < 0 (Quadrantes 2 e 3)
-                componente_i = -1 / (3 * np.sqrt(2))
-            else:  # I > 0
-                componente_i = 1 / (3 * np.sqrt(2))
-
-            if coluna in [1, 2]:  # I = 1/3sqrt(2)
-                componente_i *= 1
-            else:  # I = 1/sqrt(2)
-                componente_i *= 3
-
-            # Determina componente Q
-            if linha in [0, 1]:  # Q > 0 (Quadrantes 1 e 2)
-                componente_q = 1 / (3 * np.sqrt(2))
-            else:  # Q < 0
-                componente_q = -1 / (3 * np.sqrt(2))
-            if linha in [1, 2]:  # Q = 1/3sqrt(2)
-                componente_q *= 1
-            else:  # Q = 1/sqrt(2)
-                componente_q *= 3
-
-            amplitude = np.sqrt(componente_i**2 + componente_q**2)
-            fase = np.degrees(np.arctan2(componente_q, componente_i)) % 360
-            amplitudes[i] = amplitude
-            fases[i] = fase
-
-        return amplitudes, fases
+        indices = self._indices(simbolos_decimais)
+        return self.tabela[indices, 0], self.tabela[indices, 2]
+
+
+class QAM16(MQAM):
+    """Modulação 16QAM (Quadrature Amplitude Modulation).
+    A fase da portadora pode ser defasada de 0 a 360 graus e ter sua amplitude
+    variada entre 1/3√2 e 1√2 em intervalos atrelados ao número de bits por símbolo
+    (4 bits por símbolo para 16QAM).
+    Retorna um array com as amplitudes e fases correspondentes a cada símbolo.
+    """
+
+    # Com 1 ou 2 bits por símbolo usa só parte dos pontos da grade (como um BPSK ou
+    # um QPSK); com 3 os pontos não formariam uma constelação de 8 pontos com Gray
+    bits_reduzidos = (1, 2)
+
+    def __init__(self):
+        super().__init__(ordem=16)
 
 
 MODULACOES = {
@@ -650,6 +1033,10 @@ MODULACOES = {
     "psk": PSK,
     "qpsk": QPSK,
     "16-qam": QAM16,
+    # Famílias genéricas: o Modulador/Demodulador exige bits_por_simbolo = log2(M)
+    "8-psk": functools.partial(MPSK, 8),
+    "64-qam": functools.partial(MQAM, 64),
+    "256-qam": functools.partial(MQAM, 256),
 }
 
 # ===================================================
@@ -673,7 +1060,7 @@ class TransmissorBase(ABC):
         """
         debug_backup = self.debug
         self.debug = True  # Ativa o modo debug para evitar ruído
-        sinal = Sinal(self.bits_por_simbolo, self.taxa_amostragem)
+        sinal = Sinal(self.bits_por_simbolo, self.taxa_amostragem, dtype=self.dtype)
         num_simbolos = 2**self.bits_por_simbolo
         simbolos = np.arange(num_simbolos)
         dicionario: dict[int, np.ndarray] = {}
@@ -687,6 +1074,140 @@ class TransmissorBase(ABC):
 
         return dicionario
 
+    def processar_fluxo(
+        self,
+        fonte: Iterable[int] | np.ndarray,
+        amostras_por_bloco: int = 65536,
+        bits_por_leitura: int = 4096,
+    ) -> Iterator[np.ndarray]:
+        """
+        Versão em fluxo de processar_sinal, para mensagens que não cabem na memória.
+        `fonte` pode ser um iterável de bits, um array numpy de bits ou um arquivo
+        aberto (modo binário: cada byte vira 8 bits, do mais para o menos significativo;
+        modo texto: caracteres '0' e '1').
+        Gera blocos de `amostras_por_bloco` amostras (o último pode ser menor)
+        -> [a1, a2, ..., aN], [aN+1, ...], ...
+        Os blocos concatenados equivalem ao sinal de processar_sinal com a mensagem
+        inteira (o ruído continua sendo sorteado do mesmo gerador, na mesma ordem).
+        """
+        if amostras_por_bloco <= 0:
+            raise ValueError(
+                f"amostras_por_bloco deve ser positivo, recebido {amostras_por_bloco}."
+            )
+
+        # Cada leitura tem um número inteiro de grupos de 4 símbolos (o período da
+        # série de Fourier da banda base), e os trechos se emendam sem mudar o sinal
+        bits_por_grupo = 4 * self.bits_por_simbolo
+        bits_por_leitura = (
+            max(1, -(-bits_por_leitura // bits_por_grupo)) * bits_por_grupo
+        )
+
+        # Só o resto de cada trecho (menos de um bloco) é copiado para o bloco seguinte
+        pendentes = np.empty(0, dtype=self.dtype)
+        for i, bits in enumerate(self._ler_bits(fonte, bits_por_leitura)):
+            amostras = np.ravel(self._processar_trecho(bits, primeiro=i == 0))
+            inicio = 0
+            if len(pendentes) > 0:
+                inicio = min(amostras_por_bloco - len(pendentes), len(amostras))
+                pendentes = np.concatenate((pendentes, amostras[:inicio]))
+                if len(pendentes) < amostras_por_bloco:
+                    continue
+                yield pendentes
+            # Os blocos inteiros saem como fatias do trecho, sem cópia
+            fim = len(amostras) - (len(amostras) - inicio) % amostras_por_bloco
+            for j in range(inicio, fim, amostras_por_bloco):
+                yield amostras[j : j + amostras_por_bloco]
+            pendentes = amostras[fim:]
+
+        if len(pendentes) > 0:
+            yield pendentes
+
+    def _processar_trecho(self, bits: np.ndarray, primeiro: bool) -> np.ndarray:
+        """Processa um trecho do fluxo. Sem estado, os trechos são independentes."""
+        return self.processar_sinal(bits)
+
+    @staticmethod
+    def _ler_bits(fonte, bits_por_leitura: int) -> Iterator[np.ndarray]:
+        """Lê a fonte em trechos de `bits_por_leitura` bits (exceto o último)."""
+        if hasattr(fonte, "read"):
+            pedacos = TransmissorBase._ler_arquivo(fonte, max(1, bits_por_leitura // 8))
+        elif isinstance(fonte, np.ndarray):
+            fonte = fonte.ravel()
+            pedacos = (
+                fonte[i : i + bits_por_leitura]
+                for i in range(0, len(fonte), bits_por_leitura)
+            )
+        else:
+            pedacos = TransmissorBase._ler_iteravel(iter(fonte), bits_por_leitura)
+
+        restantes = np.empty(0, dtype=np.uint8)
+        for pedaco in pedacos:
+            restantes = np.concatenate((restantes, pedaco))
+            while len(restantes) >= bits_por_leitura:
+                yield restantes[:bits_por_leitura]
+                restantes = restantes[bits_por_leitura:]
+
+        if len(restantes) > 0:
+            yield restantes
+
+    @staticmethod
+    def _ler_iteravel(
+        iterador: Iterator[int], tamanho_da_leitura: int
+    ) -> Iterator[np.ndarray]:
+        """Agrupa os bits de um iterador em arrays de até `tamanho_da_leitura` bits."""
+        while (
+            len(
+                pedaco := np.fromiter(
+                    islice(iterador, tamanho_da_leitura), dtype=np.uint8
+                )
+            )
+            > 0
+        ):
+            yield pedaco
+
+    @staticmethod
+    def _ler_arquivo(arquivo, tamanho_da_leitura: int) -> Iterator[np.ndarray]:
+        """Converte as leituras de um arquivo em arrays de bits."""
+        while dados := arquivo.read(tamanho_da_leitura):
+            if isinstance(dados, str):
+                caracteres = np.frombuffer(dados.encode(), dtype=np.uint8)
+                yield caracteres[
+                    (caracteres == ord("0")) | (caracteres == ord("1"))
+                ] - ord("0")
+            else:
+                yield np.unpackbits(np.frombuffer(dados, dtype=np.uint8))
+
+    def _quadros_em_simbolos(self, quadros: np.ndarray | list) -> np.ndarray:
+        """
+        Empilha um lote de quadros e agrupa os bits de cada um em símbolos.
+        `quadros` é uma matriz (quadros x bits) ou uma lista de quadros, todos com o
+        mesmo número de bits.
+        Retorna um array numpy -> [[simbolo1, simbolo2, ...], ...] (um quadro por
+        linha, cada símbolo com bits_por_simbolo bits quando maior que 1).
+        Como em Sinal.sequencia_de_bits_para_simbolos, o último símbolo de cada
+        quadro é completado com zeros.
+        """
+        if not isinstance(quadros, np.ndarray):
+            if len({np.size(quadro) for quadro in quadros}) > 1:
+                raise ValueError(
+                    "Todos os quadros do lote devem ter o mesmo número de bits."
+                )
+            quadros = np.array([np.ravel(quadro) for quadro in quadros])
+        if quadros.ndim != 2 or quadros.shape[0] == 0:
+            raise ValueError(
+                "Lote deve ser uma matriz (quadros x bits) não vazia, "
+                f"recebido {quadros.shape}."
+            )
+
+        if self.bits_por_simbolo == 1:
+            return quadros
+
+        num_quadros, num_bits = quadros.shape
+        bits_faltantes = -num_bits % self.bits_por_simbolo
+        if bits_faltantes > 0:
+            quadros = np.pad(quadros, ((0, 0), (0, bits_faltantes)))
+        return quadros.reshape((num_quadros, -1, self.bits_por_simbolo))
+
 
 class TransmissorBandaBase(TransmissorBase):
     def __init__(
@@ -698,16 +1219,21 @@ class TransmissorBandaBase(TransmissorBase):
         taxa_amostragem: int = 1000,
         sigma: float = 0.1,
         debug: bool = False,
+        semente: int | np.random.SeedSequence | np.random.Generator | None = None,
+        dtype: np.dtype = np.float64,
     ):
         super().__init__()
         if codificacao.lower() not in CODIFICACOES:
             raise ValueError(f"Codificação '{codificacao}' não implementada.")
+        self.codificacao = codificacao.lower()
         self.codificador = CODIFICACOES[codificacao]()
         self.bits_por_simbolo = bits_por_simbolo
         self.frequencia_de_simbolo = frequencia_de_simbolo
         self.tensao_pico = tensao_pico
         self.taxa_amostragem = taxa_amostragem
-        self.ruido = Ruido(sigma=sigma)
+        # Float32 gasta metade da memória em todo o caminho do sinal
+        self.dtype = np.dtype(dtype)
+        self.ruido = Ruido(sigma=sigma, semente=semente, dtype=self.dtype)
         self.debug = (
             debug  # Flag para printar sinal intermediário e pular adição de ruído
         )
@@ -722,12 +1248,28 @@ class TransmissorBandaBase(TransmissorBase):
         4 - Gera a forma de onda do sinal codificado
         5 - Adiciona ruído ao sinal codificado (se debug=False)
         """
+        return self._gerar_sinal(bits, self.codificador.codificar)
+
+    def _processar_trecho(self, bits: np.ndarray, primeiro: bool) -> np.ndarray:
+        # A partir do segundo trecho, a codificação continua o estado do anterior
+        codificar = (
+            self.codificador.codificar if primeiro else self.codificador.continuar
+        )
+        return self._gerar_sinal(bits, codificar)
+
+    def _gerar_sinal(
+        self, bits: np.ndarray, codificar: Callable[[np.ndarray], np.ndarray]
+    ) -> np.ndarray:
         bits = bits.flatten()
-        sinal = Sinal(self.bits_por_simbolo, taxa_amostragem=self.taxa_amostragem)
+        sinal = Sinal(
+            self.bits_por_simbolo,
+            taxa_amostragem=self.taxa_amostragem,
+            dtype=self.dtype,
+        )
         bits = sinal.sequencia_de_bits_para_simbolos(bits)
 
         # Codifica os bits usando o esquema de codificação selecionado
-        sinal_codificado = self.codificador.codificar(bits)
+        sinal_codificado = codificar(bits)
 
         # Aplica valor decimal de cada símbolo
         sinal_codificado = sinal.binario_para_decimal(sinal_codificado)
@@ -746,9 +1288,44 @@ class TransmissorBandaBase(TransmissorBase):
             )
 
         if not self.debug:
-            sinal_codificado += self.ruido.gerar_ruido(
-                sinal_codificado
-            )  # Adiciona ruído ao sinal codificado
+            self.ruido.adicionar(sinal_codificado)  # Adiciona ruído ao sinal codificado
+
+        return sinal_codificado
+
+    def processar_lote(self, quadros: np.ndarray | list) -> np.ndarray:
+        """
+        Mesmo que processar_sinal, mas para vários quadros de uma só vez.
+        Recebe uma matriz com um quadro por linha -> [[q1_b1, q1_b2, ...], ...] ou uma
+        lista de quadros com o mesmo número de bits.
+        Retorna um array numpy com as formas de onda empilhadas
+        -> [[[forma_de_onda1], ...], ...] (quadros x símbolos x amostras).
+        """
+        simbolos = self._quadros_em_simbolos(quadros)
+        num_quadros = len(simbolos)
+        sinal = Sinal(
+            self.bits_por_simbolo,
+            taxa_amostragem=self.taxa_amostragem,
+            dtype=self.dtype,
+        )
+
+        # Todos os quadros codificados juntos (a alternância do bipolar recomeça a
+        # cada quadro)
+        sinal_codificado = self.codificador.codificar_lote(simbolos)
+        sinal_codificado = sinal.binario_para_decimal(sinal_codificado.ravel())
+        sinal_codificado = (
+            sinal_codificado.reshape((num_quadros, -1)) * self.tensao_pico
+        )
+
+        tempo_de_simbolo = 1 / self.frequencia_de_simbolo
+        if not self.debug:
+            sinal_codificado = sinal.gerar_pulso_tensao(
+                sinal_codificado, tempo_de_simbolo=tempo_de_simbolo
+            )
+            self.ruido.adicionar(sinal_codificado)
+        else:
+            sinal_codificado = sinal.gerar_pulso_tensao_ideal(
+                sinal_codificado, tempo_de_simbolo=tempo_de_simbolo
+            )
 
         return sinal_codificado
 
@@ -763,6 +1340,9 @@ class Modulador(TransmissorBase):
         taxa_amostragem: int = 1000,
         sigma: float = 0.1,
         debug: bool = False,
+        semente: int | np.random.SeedSequence | np.random.Generator | None = None,
+        dtype: np.dtype = np.float64,
+        fase_continua: bool = False,
     ):
         super().__init__()
         if modulacao.lower() not in MODULACOES:
@@ -770,14 +1350,32 @@ class Modulador(TransmissorBase):
         self.modulador = MODULACOES[modulacao]
         self.bits_por_simbolo = bits_por_simbolo
         self.modulacao = modulacao
+        # Instância da modulação, criada uma única vez com as suas tabelas
+        if modulacao in ("ask", "fsk", "psk"):
+            self.esquema = self.modulador(bits_por_simbolo)
+        else:
+            self.esquema = self.modulador()
+        bits_do_esquema = self.esquema.bits_por_simbolo
+        if (
+            bits_por_simbolo != bits_do_esquema
+            and bits_por_simbolo not in self.esquema.bits_reduzidos
+        ):
+            raise ValueError(
+                f"Modulação '{modulacao}' transmite {bits_do_esquema} bits por "
+                f"símbolo, recebido bits_por_simbolo={bits_por_simbolo}."
+            )
         self.portadora = Portadora(
             amplitude=tensao_pico,
             frequencia=frequencia_portadora,
             fase=0,
             tempo_de_simbolo=1 / frequencia_portadora,
             taxa_amostragem=taxa_amostragem,
+            dtype=dtype,
+            # Com fase contínua, o sinal deve ser recebido por um
+            # Demodulador(fase_continua=True)
+            fase_continua=fase_continua,
         )
-        self.ruido = Ruido(sigma=sigma)
+        self.ruido = Ruido(sigma=sigma, semente=semente, dtype=dtype)
         self.debug = (
             debug  # Flag para printar sinal intermediário e pular adição de ruído
         )
@@ -786,10 +1384,18 @@ class Modulador(TransmissorBase):
     def taxa_amostragem(self) -> int:
         return self.portadora.taxa_amostragem
 
-    def processar_sinal(self, bits: np.ndarray) -> np.ndarray:
+    @property
+    def dtype(self) -> np.dtype:
+        return self.portadora.dtype
+
+    def processar_sinal(
+        self, bits: np.ndarray, out: np.ndarray | None = None
+    ) -> np.ndarray:
         """
         Recebe um array numpy com a sequência de bits -> [b1, b2, b3, ...] ou [[simbolo1_b1, simbolo1_b2, ...], [simbolo2_b1, simbolo2_b2, ...], ...].
         Retorna um array numpy com a forma de onda do sinal modulado -> [[forma_de_onda1], [forma_de_onda2], [forma_de_onda3], ...].
+        Se `out` for fornecido, o sinal é escrito nele em vez de alocar um novo array
+        (ver Portadora.modular).
         1 - Agrupa os bits em símbolos de acordo com bits_por_simbolo
         2 - Converte os símbolos para decimal
         3 - Gera os parâmetros de modulação conforme a modulação selecionada
@@ -797,38 +1403,110 @@ class Modulador(TransmissorBase):
         5 - Adiciona ruído ao sinal modulado (se debug=False)
 
         """
+        return self._gerar_sinal(bits, out=out)
+
+    def _processar_trecho(self, bits: np.ndarray, primeiro: bool) -> np.ndarray:
+        # Com fase contínua, cada trecho começa na fase em que o anterior terminou
+        return self._gerar_sinal(bits, continuar=not primeiro)
+
+    def _gerar_sinal(
+        self, bits: np.ndarray, out: np.ndarray | None = None, continuar: bool = False
+    ) -> np.ndarray:
         bits = bits.flatten()
-        sinal = Sinal(self.bits_por_simbolo, self.taxa_amostragem)
+        sinal = Sinal(self.bits_por_simbolo, self.taxa_amostragem, dtype=self.dtype)
         bits = sinal.sequencia_de_bits_para_simbolos(bits)
 
         simbolos_decimais = sinal.binario_para_decimal(bits)
 
-        amplitudes = np.ones_like(simbolos_decimais)
-        frequencias = np.ones_like(simbolos_decimais)
-        fases = np.zeros_like(simbolos_decimais)
-
-        if self.modulacao == "ask":
-            ask = self.modulador()
-            amplitudes = ask.gerar_parametros(simbolos_decimais)
-        elif self.modulacao == "fsk":
-            fsk = self.modulador()
-            frequencias = fsk.gerar_parametros(simbolos_decimais)
-        elif self.modulacao == "psk":
-            psk = self.modulador(self.bits_por_simbolo)
-            fases = psk.gerar_parametros(simbolos_decimais)
-        elif self.modulacao == "qpsk":
-            qpsk = self.modulador()
-            fases = qpsk.gerar_parametros(simbolos_decimais)
-        elif self.modulacao == "16-qam":
-            qam16 = self.modulador()
-            amplitudes, fases = qam16.gerar_parametros(simbolos_decimais)
-
-        sinal_modulado = self.portadora.modular(amplitudes, frequencias, fases)
+        if self.esquema.constelacao is not None:
+            # Símbolos complexos em banda base e uma única conversão para a portadora
+            sinal_modulado = self.portadora.modular_iq(
+                self.esquema.gerar_simbolos_complexos(simbolos_decimais),
+                out=out,
+                continuar=continuar,
+            )
+        else:
+            amplitudes, frequencias, fases = self._gerar_parametros(simbolos_decimais)
+            sinal_modulado = self.portadora.modular(
+                amplitudes, frequencias, fases, out=out, continuar=continuar
+            )
 
         if not self.debug:
-            sinal_modulado += self.ruido.gerar_ruido(sinal_modulado)
+            self.ruido.adicionar(sinal_modulado)
         return sinal_modulado
 
+    def processar_lote(
+        self, quadros: np.ndarray | list, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """
+        Mesmo que processar_sinal, mas para vários quadros de uma só vez.
+        Recebe uma matriz com um quadro por linha -> [[q1_b1, q1_b2, ...], ...] ou uma
+        lista de quadros com o mesmo número de bits.
+        Retorna um array numpy com o sinal modulado de cada quadro
+        -> [[sinal_quadro1], [sinal_quadro2], ...].
+        Se `out` for fornecido (contíguo, quadros x amostras), o lote é escrito nele.
+        """
+        simbolos = self._quadros_em_simbolos(quadros)
+        num_quadros = len(simbolos)
+        sinal = Sinal(self.bits_por_simbolo, self.taxa_amostragem, dtype=self.dtype)
+
+        # Só existem 2^bits_por_simbolo símbolos diferentes: cada um que aparece no
+        # lote é convertido e parametrizado uma única vez e depois espalhado pelo lote
+        indices = (
+            simbolos.reshape((-1, self.bits_por_simbolo)).astype(int) @ sinal.pesos
+        )
+        if out is not None and not out.flags.c_contiguous:
+            raise ValueError("Buffer de saída do lote deve ser contíguo.")
+        buffer = None if out is None else out.reshape(-1)
+
+        if self.esquema.constelacao is not None:
+            # Com constelação, o índice do símbolo aponta direto para o seu ponto I + jQ
+            # (QPSK e 16QAM com menos bits por símbolo só usam parte da constelação)
+            num_simbolos = 2**self.bits_por_simbolo
+            pontos = self.esquema.gerar_simbolos_complexos(
+                np.arange(num_simbolos) / (num_simbolos - 1)
+            )
+            simbolos_complexos = pontos[indices].reshape((num_quadros, -1))
+            sinal_modulado = self.portadora.modular_iq(simbolos_complexos, out=buffer)
+            if not self.debug:
+                self.ruido.adicionar(sinal_modulado)
+            return sinal_modulado.reshape((num_quadros, -1))
+
+        presentes = np.flatnonzero(np.bincount(indices))
+        bits_presentes = sinal.decimal_para_binario(presentes)
+        parametros = self._gerar_parametros(
+            sinal.binario_para_decimal(bits_presentes.ravel())
+        )
+        posicao = np.zeros(2**self.bits_por_simbolo, dtype=int)
+        posicao[presentes] = np.arange(len(presentes))
+        # Um quadro por linha (com fase contínua, cada quadro começa na fase 0)
+        amplitudes, frequencias, fases = (
+            p[posicao[indices]].reshape((num_quadros, -1)) for p in parametros
+        )
+
+        # Todos os símbolos do lote são modulados juntos em um único buffer
+        sinal_modulado = self.portadora.modular(
+            amplitudes, frequencias, fases, out=buffer
+        )
+
+        if not self.debug:
+            self.ruido.adicionar(sinal_modulado)
+        return sinal_modulado.reshape((num_quadros, -1))
+
+    def _gerar_parametros(
+        self, simbolos_decimais: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Gera as amplitudes, frequências e fases de cada símbolo das modulações sem
+        constelação (FSK), que mudam a frequência da portadora. As demais são moduladas
+        por Portadora.modular_iq.
+        Retorna uma tupla -> ([amplitude1, ...], [frequencia1, ...], [fase1, ...]).
+        """
+        amplitudes = np.ones_like(simbolos_decimais)
+        frequencias = self.esquema.gerar_parametros(simbolos_decimais)
+        fases = np.zeros_like(simbolos_decimais)
+        return amplitudes, frequencias, fases
+
 
 # ====================================================
 # =-=-=-=-=-=-=-=-=-=-= RECEPTOR =-=-=-=-=-=-=-=-=-=-=
@@ -841,6 +1519,294 @@ class ReceptorBase(ABC):
         """Processa o sinal recebido e retorna a mensagem decodificada"""
         pass
 
+    def processar_fluxo(self, blocos: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+        """
+        Versão em fluxo de processar_sinal: recebe os blocos de amostras um a um (ex: os
+        gerados por TransmissorBase.processar_fluxo) e gera os bits de cada bloco.
+        """
+        receptor = ReceptorEmFluxo(self)
+        for bloco in blocos:
+            yield receptor.alimentar(bloco)
+
+    def _processar_trecho(self, amostras: np.ndarray, primeiro: bool) -> np.ndarray:
+        """
+        Processa um trecho do fluxo. Trechos de receptores sem estado são independentes.
+        """
+        return self.processar_sinal(amostras)
+
+
+class ReceptorEmFluxo:
+    """
+    Recebe o sinal aos poucos, em blocos de qualquer tamanho, usando um Decodificador ou
+    Demodulador.
+    Cada chamada de alimentar() devolve os bits dos símbolos que ficaram completos e
+    guarda as amostras do símbolo incompleto para a próxima chamada. Na banda base com
+    clock (manchester e bipolar) um símbolo só é completo com as suas duas metades.
+    """
+
+    def __init__(self, receptor: ReceptorBase):
+        self.receptor = receptor
+        self.amostras_por_simbolo = receptor.detector.amostras_por_template
+        self._pendentes = np.empty(0, dtype=receptor.dtype)
+        self._primeiro = True  # O próximo trecho é o primeiro do sinal
+
+    @property
+    def amostras_pendentes(self) -> int:
+        """Amostras recebidas que ainda não formam um símbolo completo."""
+        return len(self._pendentes)
+
+    def alimentar(self, amostras: np.ndarray) -> np.ndarray:
+        """
+        Recebe o próximo bloco de amostras -> [a1, a2, a3, ...] ou
+        [[forma_de_onda1], [forma_de_onda2], ...].
+        Retorna os bits dos símbolos completados (pode ser vazio), no mesmo formato de
+        processar_sinal.
+        Só a sobra do bloco anterior é copiada: os símbolos inteiros do bloco vão
+        direto para o receptor como uma fatia, sem cópia e no tipo do bloco (ex: o
+        float32 de uma captura em disco).
+        """
+        amostras = np.ravel(amostras)
+        partes = []
+
+        if len(self._pendentes) > 0:
+            # Completa o símbolo que ficou pela metade no bloco anterior
+            faltam = self.amostras_por_simbolo - len(self._pendentes)
+            if len(amostras) < faltam:
+                self._pendentes = np.concatenate((self._pendentes, amostras))
+                return self._processar(amostras[:0])
+            partes.append(
+                self._processar(np.concatenate((self._pendentes, amostras[:faltam])))
+            )
+            amostras = amostras[faltam:]
+
+        fim_completos = (
+            len(amostras) // self.amostras_por_simbolo * self.amostras_por_simbolo
+        )
+        partes.append(self._processar(amostras[:fim_completos]))
+
+        # Cópia para não manter o bloco inteiro vivo só por causa da sobra
+        self._pendentes = amostras[fim_completos:].copy()
+
+        return partes[0] if len(partes) == 1 else np.concatenate(partes)
+
+    def _processar(self, completos: np.ndarray) -> np.ndarray:
+        if len(completos) == 0:
+            return self.receptor.processar_sinal(completos)
+        bits = self.receptor._processar_trecho(completos, self._primeiro)
+        self._primeiro = False
+        return bits
+
+    def reiniciar(self):
+        """Descarta o símbolo incompleto, para começar um novo sinal."""
+        self._pendentes = self._pendentes[:0]
+        self._primeiro = True
+
+
+class CacheDeFormasDeOnda:
+    """
+    Cache LRU, compartilhado pelo processo, dos dicionários de formas de onda ideais
+    dos receptores.
+    Gerar o dicionário roda o transmissor inteiro uma vez por símbolo possível, então
+    receptores com a mesma configuração reaproveitam o mesmo dicionário. As formas de
+    onda são somente leitura, pois são compartilhadas por todos os receptores.
+    """
+
+    def __init__(self, capacidade: int = 32):
+        self.capacidade = capacidade
+        self.acertos = 0
+        self.falhas = 0
+        self._entradas: OrderedDict[tuple, dict[int, np.ndarray]] = OrderedDict()
+        self._trava = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def obter(
+        self, chave: tuple, gerar: Callable[[], dict[int, np.ndarray]]
+    ) -> dict[int, np.ndarray]:
+        """
+        Retorna o dicionário da configuração `chave`, chamando `gerar()` somente se
+        ele não estiver no cache.
+        `chave` identifica a configuração -> (esquema, bits_por_simbolo, frequencia,
+        tensao_pico, taxa_amostragem, dtype).
+        O dicionário retornado é uma cópia, mas as formas de onda (somente leitura)
+        são compartilhadas.
+        """
+        with self._trava:
+            if chave in self._entradas:
+                self._entradas.move_to_end(chave)  # Mais recente vai para o fim
+                self.acertos += 1
+                return dict(self._entradas[chave])
+
+            self.falhas += 1
+            dicionario = gerar()
+            for forma_de_onda in dicionario.values():
+                forma_de_onda.setflags(write=False)
+            self._entradas[chave] = dicionario
+
+            # Descarta as configurações usadas há mais tempo
+            while len(self._entradas) > self.capacidade:
+                self._entradas.popitem(last=False)
+
+            return dict(dicionario)
+
+    def limpar(self):
+        """Esvazia o cache e zera os contadores."""
+        with self._trava:
+            self._entradas.clear()
+            self.acertos = 0
+            self.falhas = 0
+
+
+CACHE_DE_FORMAS_DE_ONDA = CacheDeFormasDeOnda()
+
+
+class BancoDeDetectores:
+    """Banco de filtros casados para detecção de símbolos por distância euclidiana.
+    Empilha as formas de onda ideais em uma matriz de templates
+    -> [[forma_de_onda_simbolo0], [forma_de_onda_simbolo1], ...] e compara todos os
+    símbolos recebidos com todos os templates de uma só vez.
+    """
+
+    def __init__(self, dicionario_de_formas_de_onda: dict[int, np.ndarray]):
+        self.simbolos = np.array(list(dicionario_de_formas_de_onda.keys()))
+        self.templates = np.array(
+            [
+                forma_onda.flatten()
+                for forma_onda in dicionario_de_formas_de_onda.values()
+            ]
+        )
+        if self.templates.dtype.kind != "f":
+            self.templates = self.templates.astype(float)  # float32 continua float32
+        self._energias = np.sum(self.templates**2, axis=1)  # ||t||²
+
+    @property
+    def amostras_por_template(self) -> int:
+        return self.templates.shape[1]
+
+    def detectar(self, segmentos: np.ndarray) -> np.ndarray:
+        """
+        Recebe um array numpy com um símbolo recebido por linha
+        -> [[segmento1], [segmento2], ...].
+        Retorna um array numpy com o símbolo de menor distância euclidiana a cada
+        segmento -> [simbolo1, simbolo2, ...].
+        Usa ||x - t||² = ||x||² - 2x·t + ||t||². Como ||x||² é o mesmo para todos os
+        templates de uma linha, basta minimizar ||t||² - 2x·t (um produto de matrizes).
+        """
+        distancias = self._energias - 2 * (segmentos @ self.templates.T)
+        return self.simbolos[np.argmin(distancias, axis=1)]
+
+
+class DetectorIQ:
+    """Detector coerente para as modulações com constelação (ASK, PSK, QPSK, QAM...).
+    Todo símbolo dessas modulações é uma combinação I·sen + Q·cos da portadora, então em
+    vez de comparar o símbolo recebido com M templates basta projetá-lo nas duas tabelas
+    da portadora e decidir pelo ponto da constelação mais próximo no plano I/Q. O
+    trabalho por amostra não depende de M e a memória é só a da base (2 x
+    amostras_por_simbolo) e da constelação.
+    """
+
+    def __init__(self, base: np.ndarray, constelacao: np.ndarray):
+        self.base = base  # [[Vp·sen(ωt)], [Vp·cos(ωt)]] (ver Portadora.base_iq)
+        self.simbolos = np.arange(len(constelacao))
+        # [[I...], [Q...]]
+        self.pontos = np.stack((constelacao.real, constelacao.imag)).astype(base.dtype)
+        # Com templates t = I·b1 + Q·b2 -> ||t||² = [I Q]·G·[I Q] e x·t =
+        # [I Q]·(base·x), onde G = base·baseᵀ é a matriz de Gram (diagonal quando o
+        # símbolo tem um número inteiro de ciclos)
+        gram = base.astype(float) @ base.T.astype(float)
+        pontos = np.stack((constelacao.real, constelacao.imag))
+        self._energias = np.einsum("im,ij,jm->m", pontos, gram, pontos).astype(
+            base.dtype
+        )
+
+    @property
+    def amostras_por_template(self) -> int:
+        return self.base.shape[1]
+
+    def projetar(self, segmentos: np.ndarray) -> np.ndarray:
+        """Correlação de cada símbolo com as duas tabelas -> [[x·b1, x·b2], ...]."""
+        return segmentos @ self.base.T
+
+    def detectar(self, segmentos: np.ndarray) -> np.ndarray:
+        """
+        Mesma decisão do BancoDeDetectores (menor ||x - t||²), escrita no plano I/Q:
+        ||t||² - 2x·t = [I Q]·G·[I Q] - 2[I Q]·(base·x), um produto (N x 2) @ (2 x M).
+        """
+        distancias = self._energias - 2 * (self.projetar(segmentos) @ self.pontos)
+        return self.simbolos[np.argmin(distancias, axis=1)]
+
+
+class DetectorDeFaseContinua:
+    """Detector para o FSK de fase contínua (Portadora com fase_continua=True).
+    Cada símbolo começa na fase em que o anterior terminou, então a forma de onda
+    ideal do símbolo m depende da fase φ acumulada até ele:
+    Vp·sen(θm + φ) = cos(φ)·Vp·sen(θm) + sen(φ)·Vp·cos(θm).
+    As correlações com os senos e cossenos de todos os tons são calculadas de uma só
+    vez; a decisão é feita símbolo a símbolo, pois φ depende dos símbolos já decididos
+    (como `continuar` no transmissor).
+    """
+
+    def __init__(self, portadora: Portadora, frequencias: np.ndarray):
+        amostras_por_simbolo = int(
+            portadora.tempo_de_simbolo * portadora.taxa_amostragem
+        )
+        t = np.linspace(
+            0, portadora.tempo_de_simbolo, amostras_por_simbolo, endpoint=False
+        )
+        # θm(t) = 2π fm t, com fm = multiplicador do símbolo m * frequência da portadora
+        frequencias = np.asarray(frequencias) * portadora.frequencia
+        angulos = 2 * np.pi * np.outer(frequencias, t) + np.deg2rad(portadora.fase)
+        senos = portadora.amplitude * np.sin(angulos)
+        cossenos = portadora.amplitude * np.cos(angulos)
+
+        self.simbolos = np.arange(len(frequencias))
+        # 2M x amostras
+        self.base = np.concatenate((senos, cossenos)).astype(portadora.dtype)
+        # ||t(φ)||² = cos²φ·||sen||² + sen²φ·||cos||² + 2·cosφ·senφ·(sen·cos)
+        self._energia_seno = np.sum(senos**2, axis=1)
+        self._energia_cosseno = np.sum(cossenos**2, axis=1)
+        self._cruzada = np.sum(senos * cossenos, axis=1)
+        # Giro da fase do oscilador durante cada símbolo
+        self._giros = np.mod(
+            2 * np.pi * frequencias * portadora.tempo_de_simbolo, 2 * np.pi
+        )
+        self.fase = 0.0  # Fase no fim do último símbolo detectado (em radianos)
+
+    @property
+    def amostras_por_template(self) -> int:
+        return self.base.shape[1]
+
+    def detectar(self, segmentos: np.ndarray, continuar: bool = False) -> np.ndarray:
+        """
+        Recebe um array numpy com um símbolo recebido por linha
+        -> [[segmento1], [segmento2], ...].
+        Retorna o símbolo de menor distância euclidiana a cada segmento
+        -> [simbolo1, simbolo2, ...].
+        O primeiro símbolo começa na fase 0, ou, com continuar=True, na fase em que a
+        chamada anterior terminou.
+        """
+        num_tons = len(self.simbolos)
+        projecoes = (segmentos @ self.base.T).astype(float)
+        correlacoes_seno = projecoes[:, :num_tons]
+        correlacoes_cosseno = projecoes[:, num_tons:]
+
+        fase = self.fase if continuar else 0.0
+        detectados = np.empty(len(segmentos), dtype=int)
+        for k in range(len(segmentos)):
+            cosseno, seno = np.cos(fase), np.sin(fase)
+            distancias = (
+                cosseno**2 * self._energia_seno
+                + seno**2 * self._energia_cosseno
+                + 2 * cosseno * seno * self._cruzada
+                - 2 * (cosseno * correlacoes_seno[k] + seno * correlacoes_cosseno[k])
+            )
+            detectados[k] = np.argmin(distancias)
+            fase = (fase + self._giros[detectados[k]]) % (2 * np.pi)
+
+        self.fase = fase
+        return self.simbolos[detectados]
+
 
 class Decodificador(ReceptorBase):
     def __init__(
@@ -850,6 +1816,7 @@ class Decodificador(ReceptorBase):
         bits_por_simbolo: int = 1,
         tensao_pico: float = 3.3,
         taxa_amostragem: int = 1000,
+        dtype: np.dtype = np.float64,
     ):
         super().__init__()
         if codificacao.lower() not in CODIFICACOES:
@@ -859,14 +1826,30 @@ class Decodificador(ReceptorBase):
         self.bits_por_simbolo = bits_por_simbolo
         self.tensao_pico = tensao_pico
         self.taxa_amostragem = taxa_amostragem
-        self.dicionario_de_formas_de_onda = TransmissorBandaBase(
-            codificacao=self.codificacao,
-            frequencia_de_simbolo=self.frequencia_de_simbolo,
-            bits_por_simbolo=self.bits_por_simbolo,
-            tensao_pico=self.tensao_pico,
-            taxa_amostragem=self.taxa_amostragem,
-            debug=True,
-        ).gerar_dicionario_de_formas_de_onda()
+        self.dtype = np.dtype(dtype)  # Tipo das formas de onda de referência
+        self.dicionario_de_formas_de_onda = CACHE_DE_FORMAS_DE_ONDA.obter(
+            (
+                self.codificacao,
+                self.bits_por_simbolo,
+                self.frequencia_de_simbolo,
+                self.tensao_pico,
+                self.taxa_amostragem,
+                self.dtype.str,
+            ),
+            lambda: TransmissorBandaBase(
+                codificacao=self.codificacao,
+                frequencia_de_simbolo=self.frequencia_de_simbolo,
+                bits_por_simbolo=self.bits_por_simbolo,
+                tensao_pico=self.tensao_pico,
+                taxa_amostragem=self.taxa_amostragem,
+                debug=True,
+                dtype=self.dtype,
+            ).gerar_dicionario_de_formas_de_onda(),
+        )
+        self.detector = BancoDeDetectores(self.dicionario_de_formas_de_onda)
+        self._tabela_de_bits = Sinal(
+            self.bits_por_simbolo, self.taxa_amostragem
+        ).tabela_de_bits
 
     def processar_sinal(self, bits: np.ndarray) -> np.ndarray:
         """
@@ -877,47 +1860,30 @@ class Decodificador(ReceptorBase):
         3 - Seleciona o símbolo com a menor distância euclidiana ao símbolo recebido
         4 - Converte os símbolos decimais obtidos da comparação para binário
         """
-        bits = bits.flatten()
+        # Sem cópia quando possível (ex: fatias de uma captura em disco)
+        bits = np.ravel(bits)
 
-        sinal = Sinal(self.bits_por_simbolo, self.taxa_amostragem)
         tempo_de_simbolo = 1 / self.frequencia_de_simbolo
         amostras_por_simbolo = int(self.taxa_amostragem * tempo_de_simbolo)
         numero_de_simbolos = len(bits) // amostras_por_simbolo
         tem_clock = self.codificacao == "manchester" or self.codificacao == "bipolar"
 
-        simbolos_demodulados = []
-
         if self.codificacao == "bipolar":
             bits = np.abs(bits)
 
-        for i in range(numero_de_simbolos):
-            inicio = i * amostras_por_simbolo
-            fim = inicio + amostras_por_simbolo
-            if tem_clock:
-                if i % 2 == 1:
-                    continue
-
-                fim = inicio + amostras_por_simbolo * 2
-
-            segmento = bits[inicio:fim]
-
-            menor_distancia = -np.inf
-            simbolo_deteccao = None
-
-            for simbolo, forma_onda in self.dicionario_de_formas_de_onda.items():
-                distancia = np.abs(
-                    np.sum((segmento - forma_onda.flatten()) ** 2)
-                )  # Distância Euclidiana
-                if menor_distancia == -np.inf or distancia < menor_distancia:
-                    menor_distancia = distancia
-                    simbolo_deteccao = simbolo
+        # Com clock, cada símbolo ocupa dois períodos (clock alto + clock baixo)
+        if tem_clock:
+            numero_de_simbolos //= 2
+            amostras_por_simbolo *= 2
 
-            simbolos_demodulados.append(sinal.decimal_para_binario(simbolo_deteccao))
+        segmentos = bits[: numero_de_simbolos * amostras_por_simbolo].reshape(
+            (numero_de_simbolos, amostras_por_simbolo)
+        )
+        simbolos_detectados = self.detector.detectar(segmentos)
+        simbolos_demodulados = self._tabela_de_bits[simbolos_detectados]
 
-        if self.bits_por_simbolo > 1:
-            simbolos_demodulados = np.array(simbolos_demodulados)
-        else:
-            simbolos_demodulados = np.array(simbolos_demodulados).flatten()
+        if self.bits_por_simbolo == 1:
+            simbolos_demodulados = simbolos_demodulados.flatten()
 
         return simbolos_demodulados
 
@@ -930,6 +1896,8 @@ class Demodulador(ReceptorBase):
         bits_por_simbolo: int = 1,
         tensao_pico: float = 3.3,
         taxa_amostragem: int = 1000,
+        dtype: np.dtype = np.float64,
+        fase_continua: bool = False,
     ):
         super().__init__()
         if modulacao.lower() not in MODULACOES:
@@ -939,52 +1907,319 @@ class Demodulador(ReceptorBase):
         self.bits_por_simbolo = bits_por_simbolo
         self.tensao_pico = tensao_pico
         self.taxa_amostragem = taxa_amostragem
-        self.dicionario_de_formas_de_onda = Modulador(
+        self.dtype = np.dtype(dtype)  # Tipo das formas de onda de referência
+        # Deve ser igual ao do Modulador que gerou o sinal
+        self.fase_continua = fase_continua
+        referencia = self._criar_modulador()
+        sinal = Sinal(self.bits_por_simbolo, self.taxa_amostragem)
+        decimais = np.ravel(sinal.binario_para_decimal(sinal.tabela_de_bits))
+        if referencia.esquema.constelacao is not None:
+            # Detecção coerente no plano I/Q, sem gerar as formas de onda dos símbolos.
+            # Os pontos são os que o Modulador usa com bits_por_simbolo bits (QPSK e
+            # 16QAM com menos bits só usam parte da constelação).
+            # Com fase contínua nada muda: todo símbolo tem ciclos inteiros da portadora
+            pontos = referencia.esquema.gerar_simbolos_complexos(decimais)
+            self.detector = DetectorIQ(referencia.portadora.base_iq(), pontos)
+        elif self.fase_continua:
+            # FSK com fase contínua: a forma de onda depende da fase do símbolo anterior
+            frequencias = referencia.esquema.gerar_parametros(decimais)
+            self.detector = DetectorDeFaseContinua(referencia.portadora, frequencias)
+        else:
+            self.detector = BancoDeDetectores(self.dicionario_de_formas_de_onda)
+        self._tabela_de_bits = sinal.tabela_de_bits
+
+    def _criar_modulador(self) -> Modulador:
+        """Modulador sem ruído com a mesma configuração, para gerar as referências."""
+        return Modulador(
             modulacao=self.modulacao,
             frequencia_portadora=self.frequencia_portadora,
             bits_por_simbolo=self.bits_por_simbolo,
             tensao_pico=self.tensao_pico,
             taxa_amostragem=self.taxa_amostragem,
             debug=True,
-        ).gerar_dicionario_de_formas_de_onda()
+            dtype=self.dtype,
+            fase_continua=self.fase_continua,
+        )
 
-    def processar_sinal(self, bits: np.ndarray) -> np.ndarray:
+    @property
+    def dicionario_de_formas_de_onda(self) -> dict[int, np.ndarray]:
+        """
+        Formas de onda ideais de cada símbolo, compartilhadas pelo
+        CACHE_DE_FORMAS_DE_ONDA.
+        Só são geradas quando usadas (as modulações com constelação não precisam delas).
+        """
+        return CACHE_DE_FORMAS_DE_ONDA.obter(
+            (
+                self.modulacao,
+                self.bits_por_simbolo,
+                self.frequencia_portadora,
+                self.tensao_pico,
+                self.taxa_amostragem,
+                self.dtype.str,
+            ),
+            lambda: self._criar_modulador().gerar_dicionario_de_formas_de_onda(),
+        )
+
+    def processar_sinal(self, bits: np.ndarray, continuar: bool = False) -> np.ndarray:
         """
         Recebe um array numpy com a forma de onda do sinal recebido -> [[forma_de_onda1], [forma_de_onda2], [forma_de_onda3], ...].
         Retorna um array numpy com a sequência de bits demodulada -> [b1, b2, b3, ...]
+        Continuar - com fase contínua, o primeiro símbolo começa na fase em que a
+        chamada anterior terminou.
         1 - Divide o sinal recebido em simbolos
-        2 - Compara cada símbolo recebido com as formas de onda ideais do dicionário de formas de onda
+        2 - Compara cada símbolo recebido com as formas de onda ideais (FSK) ou, nas
+            modulações com constelação, com os pontos no plano I/Q (ver DetectorIQ)
         3 - Seleciona o símbolo com a menor distância euclidiana ao símbolo recebido
         4 - Converte os símbolos decimais obtidos da comparação para binário
         """
-        sinal = Sinal(self.bits_por_simbolo, self.taxa_amostragem)
+        # Sem cópia quando possível (ex: fatias de uma captura em disco)
+        bits = np.ravel(bits)
+
         tempo_de_simbolo = 1 / self.frequencia_portadora
         amostras_por_simbolo = int(self.taxa_amostragem * tempo_de_simbolo)
         numero_de_simbolos = len(bits) // amostras_por_simbolo
 
-        simbolos_demodulados = []
+        segmentos = bits[: numero_de_simbolos * amostras_por_simbolo].reshape(
+            (numero_de_simbolos, amostras_por_simbolo)
+        )
+        if isinstance(self.detector, DetectorDeFaseContinua):
+            simbolos_detectados = self.detector.detectar(segmentos, continuar=continuar)
+        else:
+            simbolos_detectados = self.detector.detectar(segmentos)
+        simbolos_demodulados = self._tabela_de_bits[simbolos_detectados]
 
-        for i in range(numero_de_simbolos):
-            inicio = i * amostras_por_simbolo
-            fim = inicio + amostras_por_simbolo
-            segmento = bits[inicio:fim]
+        if self.bits_por_simbolo == 1:
+            simbolos_demodulados = simbolos_demodulados.flatten()
 
-            menor_distancia = -np.inf
-            simbolo_deteccao = None
+        return simbolos_demodulados
 
-            for simbolo, forma_onda in self.dicionario_de_formas_de_onda.items():
-                distancia = np.abs(
-                    np.sum((segmento - forma_onda) ** 2)
-                )  # Distância Euclidiana
-                if menor_distancia == -np.inf or distancia < menor_distancia:
-                    menor_distancia = distancia
-                    simbolo_deteccao = simbolo
+    def _processar_trecho(self, amostras: np.ndarray, primeiro: bool) -> np.ndarray:
+        # Com fase contínua, cada trecho começa na fase em que o anterior terminou
+        return self.processar_sinal(amostras, continuar=not primeiro)
+
+
+def criar_transmissor_e_receptor(
+    esquema: str,
+    bits_por_simbolo: int = 1,
+    frequencia: float = 1.0,
+    tensao_pico: float = 3.3,
+    taxa_amostragem: int = 1000,
+    sigma: float = 0.1,
+    debug: bool = False,
+    semente: int | np.random.SeedSequence | np.random.Generator | None = None,
+    dtype: np.dtype = np.float64,
+    fase_continua: bool = False,
+) -> tuple[TransmissorBase, ReceptorBase]:
+    """
+    Cria o par transmissor/receptor de um esquema da camada física, configurados igual:
+    Modulador/Demodulador para as MODULACOES (frequencia é a da portadora) ou
+    TransmissorBandaBase/Decodificador para as CODIFICACOES (frequencia é a de símbolo).
+    Fase contínua só existe nas modulações.
+    """
+    esquema = esquema.lower()
+    if esquema in MODULACOES:
+        transmissor = Modulador(
+            esquema,
+            frequencia,
+            bits_por_simbolo,
+            tensao_pico,
+            taxa_amostragem,
+            sigma,
+            debug,
+            semente,
+            dtype,
+            fase_continua,
+        )
+        receptor = Demodulador(
+            esquema,
+            frequencia,
+            bits_por_simbolo,
+            tensao_pico,
+            taxa_amostragem,
+            dtype,
+            fase_continua,
+        )
+    elif fase_continua:
+        raise ValueError(f"Fase contínua não se aplica à codificação '{esquema}'.")
+    elif esquema in CODIFICACOES:
+        transmissor = TransmissorBandaBase(
+            esquema,
+            bits_por_simbolo,
+            frequencia,
+            tensao_pico,
+            taxa_amostragem,
+            sigma,
+            debug,
+            semente,
+            dtype,
+        )
+        receptor = Decodificador(
+            esquema, frequencia, bits_por_simbolo, tensao_pico, taxa_amostragem, dtype
+        )
+    else:
+        raise ValueError(f"Esquema '{esquema}' não implementado.")
+    return transmissor, receptor
 
-            simbolos_demodulados.append(sinal.decimal_para_binario(simbolo_deteccao))
 
-        if self.bits_por_simbolo > 1:
-            simbolos_demodulados = np.array(simbolos_demodulados)
+# ====================================================
+# =-=-=-=-=-=-=-=-=-=-= CAPTURA =-=-=-=-=-=-=-=-=-=-=-
+# ====================================================
+
+# Formato da captura em disco:
+# - Cabeçalho de TAMANHO_CABECALHO bytes: MAGICA_CAPTURA + JSON com a configuração,
+#   completado com espaços
+# - Amostras float32 little-endian, uma atrás da outra, até o fim do arquivo
+# O número de amostras vem do tamanho do arquivo: mais blocos não mexem no cabeçalho.
+MAGICA_CAPTURA = b"CAPTURA1"
+TAMANHO_CABECALHO = 512
+TIPO_AMOSTRA_CAPTURA = np.dtype("<f4")
+
+
+class GravadorDeCaptura:
+    """Grava em disco a saída de um Modulador ou TransmissorBandaBase, bloco a bloco.
+    O cabeçalho guarda o esquema, a taxa de amostragem, os bits por símbolo, o sigma, o
+    tipo das amostras e se a fase é contínua, o suficiente para o LeitorDeCaptura montar
+    o receptor certo depois.
+    Pode ser usado com `with`, que fecha o arquivo no final.
+    """
+
+    def __init__(self, caminho: str | os.PathLike, transmissor: TransmissorBase):
+        self.caminho = caminho
+        self.cabecalho = self._cabecalho_do_transmissor(transmissor)
+        self.amostras_gravadas = 0
+
+        cabecalho = MAGICA_CAPTURA + json.dumps(self.cabecalho).encode("utf-8")
+        if len(cabecalho) > TAMANHO_CABECALHO:
+            raise ValueError("Cabeçalho da captura maior que o espaço reservado.")
+        self._arquivo = open(caminho, "wb")
+        self._arquivo.write(cabecalho.ljust(TAMANHO_CABECALHO, b" "))
+
+    @staticmethod
+    def _cabecalho_do_transmissor(transmissor: TransmissorBase) -> dict:
+        if isinstance(transmissor, Modulador):
+            return {
+                "tipo": "modulacao",
+                "esquema": transmissor.modulacao.lower(),
+                "frequencia": float(transmissor.portadora.frequencia),
+                "bits_por_simbolo": int(transmissor.bits_por_simbolo),
+                "tensao_pico": float(transmissor.portadora.amplitude),
+                "taxa_amostragem": int(transmissor.taxa_amostragem),
+                "sigma": float(transmissor.ruido.sigma),
+                "tipo_amostra": TIPO_AMOSTRA_CAPTURA.str,
+                "fase_continua": bool(transmissor.portadora.fase_continua),
+            }
+        if isinstance(transmissor, TransmissorBandaBase):
+            return {
+                "tipo": "codificacao",
+                "esquema": transmissor.codificacao,
+                "frequencia": float(transmissor.frequencia_de_simbolo),
+                "bits_por_simbolo": int(transmissor.bits_por_simbolo),
+                "tensao_pico": float(transmissor.tensao_pico),
+                "taxa_amostragem": int(transmissor.taxa_amostragem),
+                "sigma": float(transmissor.ruido.sigma),
+                "tipo_amostra": TIPO_AMOSTRA_CAPTURA.str,
+            }
+        raise TypeError(
+            f"Transmissor '{type(transmissor).__name__}' não suportado na captura."
+        )
+
+    def escrever(self, amostras: np.ndarray):
+        """Acrescenta um bloco de amostras (qualquer formato) no fim, como float32."""
+        amostras = np.ravel(amostras).astype(TIPO_AMOSTRA_CAPTURA, copy=False)
+        amostras.tofile(self._arquivo)
+        self.amostras_gravadas += len(amostras)
+
+    def escrever_fluxo(self, blocos: Iterable[np.ndarray]):
+        """Grava os blocos (ex: de TransmissorBase.processar_fluxo) sem juntá-los."""
+        for bloco in blocos:
+            self.escrever(bloco)
+
+    def fechar(self):
+        self._arquivo.close()
+
+    def __enter__(self) -> "GravadorDeCaptura":
+        return self
+
+    def __exit__(self, *_):
+        self.fechar()
+
+
+class LeitorDeCaptura:
+    """Abre uma captura gravada pelo GravadorDeCaptura sem carregá-la na memória.
+    As amostras ficam num np.memmap, então as fatias entregues ao receptor são apenas
+    janelas sobre o arquivo e só as páginas usadas são lidas do disco.
+    """
+
+    def __init__(self, caminho: str | os.PathLike):
+        self.caminho = caminho
+        with open(caminho, "rb") as arquivo:
+            cabecalho = arquivo.read(TAMANHO_CABECALHO)
+        if len(cabecalho) < TAMANHO_CABECALHO or not cabecalho.startswith(
+            MAGICA_CAPTURA
+        ):
+            raise ValueError(f"'{caminho}' não é uma captura válida.")
+        self.cabecalho = json.loads(cabecalho[len(MAGICA_CAPTURA) :].decode("utf-8"))
+        # Capturas sem o campo são anteriores a ele, e sempre foram float32
+        tipo_amostra = np.dtype(
+            self.cabecalho.get("tipo_amostra", TIPO_AMOSTRA_CAPTURA.str)
+        )
+
+        numero_de_amostras = (
+            os.path.getsize(caminho) - TAMANHO_CABECALHO
+        ) // tipo_amostra.itemsize
+        if numero_de_amostras == 0:
+            # Memmap não aceita arquivo vazio
+            self.amostras = np.empty(0, dtype=tipo_amostra)
         else:
-            simbolos_demodulados = np.array(simbolos_demodulados).flatten()
+            self.amostras = np.memmap(
+                caminho,
+                dtype=tipo_amostra,
+                mode="r",
+                offset=TAMANHO_CABECALHO,
+                shape=(numero_de_amostras,),
+            )
 
-        return simbolos_demodulados
+    def __len__(self) -> int:
+        return len(self.amostras)
+
+    def criar_receptor(self) -> ReceptorBase:
+        """
+        Monta o Demodulador ou Decodificador com a mesma configuração do transmissor
+        gravado, no tipo das amostras da captura (float32), para não converter os
+        blocos lidos do disco.
+        """
+        cabecalho = self.cabecalho
+        if cabecalho["tipo"] == "modulacao":
+            return Demodulador(
+                modulacao=cabecalho["esquema"],
+                frequencia_portadora=cabecalho["frequencia"],
+                bits_por_simbolo=cabecalho["bits_por_simbolo"],
+                tensao_pico=cabecalho["tensao_pico"],
+                taxa_amostragem=cabecalho["taxa_amostragem"],
+                dtype=self.amostras.dtype,
+                fase_continua=cabecalho.get("fase_continua", False),
+            )
+        return Decodificador(
+            codificacao=cabecalho["esquema"],
+            frequencia_de_simbolo=cabecalho["frequencia"],
+            bits_por_simbolo=cabecalho["bits_por_simbolo"],
+            tensao_pico=cabecalho["tensao_pico"],
+            taxa_amostragem=cabecalho["taxa_amostragem"],
+            dtype=self.amostras.dtype,
+        )
+
+    def blocos(self, amostras_por_bloco: int = 1 << 20) -> Iterator[np.ndarray]:
+        """Gera fatias (sem cópia) de até amostras_por_bloco amostras da captura."""
+        for inicio in range(0, len(self.amostras), amostras_por_bloco):
+            yield self.amostras[inicio : inicio + amostras_por_bloco]
+
+    def processar(
+        self, receptor: ReceptorBase | None = None, amostras_por_bloco: int = 1 << 20
+    ) -> Iterator[np.ndarray]:
+        """
+        Reproduz a captura no receptor (por padrão o de criar_receptor), bloco a bloco.
+        Gera os bits de cada bloco, como ReceptorBase.processar_fluxo.
+        """
+        if receptor is None:
+            receptor = self.criar_receptor()
+        return receptor.processar_fluxo(self.blocos(amostras_por_bloco))
@@ -1,8 +1,12 @@
 """
 CRC-32 (IEEE 802).
 Método: Divisão Polinomial usando Bitwise Shift e XOR.
+Para entender a divisão byte a byte há a versão com tabela pré-calculada (crc_por_tabela);
+para mensagens grandes o cálculo é feito pelo zlib (crc_rapido), com o mesmo resultado.
 """
 
+import zlib
+
 # Polinômio padrão IEEE 802: x^32 + x^26 + ... + 1
 # Em Hex: 0x104C11DB7 (Representação binária de 33 bits)
 POLINOMIO_HEX = 0x104C11DB7
@@ -43,20 +47,77 @@ def __executar_divisao_binaria(numero_alvo: int) -> int:
     # O que sobrar no 'dividendo' quando o loop acabar é o RESTO.
     return dividendo
 
+def __gerar_tabela_crc() -> tuple:
+    """
+    Pré-calcula, para cada um dos 256 bytes possíveis, o resto da divisão
+    desse byte (alinhado no topo de um registrador de 32 bits) pelo polinômio.
+    É exatamente a mesma divisão longa de cima, só que feita UMA vez por byte.
+    """
+    tabela = []
+    for byte in range(256):
+        resto = byte << (GRAU_CRC - 8)
+        for _ in range(8):
+            # Se o bit do topo é 1, "cabe" o polinômio: shift + XOR
+            if resto & (1 << (GRAU_CRC - 1)):
+                resto = ((resto << 1) ^ POLINOMIO_HEX) & 0xFFFFFFFF
+            else:
+                resto = (resto << 1) & 0xFFFFFFFF
+        tabela.append(resto)
+    return tuple(tabela)
+
+TABELA_CRC = __gerar_tabela_crc()
+
+def crc_por_tabela(dados, crc: int = 0) -> int:
+    """
+    Calcula o CRC-32 de bytes/bytearray/memoryview consultando a tabela
+    (8 bits por passo em vez de 1). Dá o mesmo resto que dividir (dados * x^32)
+    pelo polinômio com __executar_divisao_binaria.
+    """
+    for byte in memoryview(dados).cast("B"):
+        # O byte que "sai" pelo topo do registrador decide qual resto aplicar
+        crc = ((crc << 8) & 0xFFFFFFFF) ^ TABELA_CRC[(crc >> 24) ^ byte]
+    return crc
+
+# Cópia proposital de _BITS_INVERTIDOS e _inverter_32_bits do CamadaEnlace.py da raiz:
+# os scripts desta pasta rodam sozinhos, a partir dela, sem o módulo da raiz no caminho.
+# Cada byte com a ordem dos bits invertida (0b00000001 -> 0b10000000)
+BITS_INVERTIDOS = bytes(int(format(byte, '08b')[::-1], 2) for byte in range(256))
+
+def __inverter_32_bits(valor: int) -> int:
+    """Inverte a ordem dos 32 bits (o bit 31 vira o bit 0 e vice-versa)."""
+    return int.from_bytes(valor.to_bytes(4, "big").translate(BITS_INVERTIDOS), "little")
+
+def crc_rapido(dados, crc: int = 0) -> int:
+    """
+    Mesmo resultado de crc_por_tabela, mas calculado em C pelo zlib.crc32.
+    O zlib usa o mesmo polinômio na versão "refletida": lê os bits do menos para o
+    mais significativo e inverte o registrador (XOR com 0xFFFFFFFF) no início e no fim.
+    Então basta espelhar os bits de cada byte na entrada, desfazer as inversões
+    e espelhar os 32 bits do resultado.
+    """
+    refletidos = bytes(memoryview(dados).cast("B")).translate(BITS_INVERTIDOS)
+    registrador = zlib.crc32(refletidos, __inverter_32_bits(crc) ^ 0xFFFFFFFF) ^ 0xFFFFFFFF
+    return __inverter_32_bits(registrador)
+
+def __bits_para_bytes(bits_str: str) -> bytes:
+    """
+    Converte a string de bits em bytes, completando com zeros à esquerda
+    (zeros à esquerda não mudam o resto da divisão).
+    """
+    num_bytes = (len(bits_str) + 7) // 8
+    if num_bytes == 0:
+        return b""
+    return int(bits_str, 2).to_bytes(num_bytes, "big")
+
 def calcular_crc(bits_str: str) -> str:
     """
     1. Adiciona 32 zeros ao final da mensagem.
     2. Calcula o resto da divisão pelo polinômio.
     3. Retorna Mensagem Original + Resto (CRC).
     """
-    # Converte string de bits para inteiro
-    dados_int = int(bits_str, 2)
-    
-    # Passo 1: Shift Left de 32 posições (equivale a adicionar 32 zeros)
-    dados_com_padding = dados_int << GRAU_CRC
-    
-    # Passo 2: Calcula o resto
-    resto = __executar_divisao_binaria(dados_com_padding)
+    # Passos 1 e 2: o cálculo por tabela (e o do zlib) já considera os 32 zeros anexados ao final
+    # (equivale a __executar_divisao_binaria(int(bits_str, 2) << GRAU_CRC))
+    resto = crc_rapido(__bits_para_bytes(bits_str))
     
     # Formata o resto para garantir que tenha 32 caracteres (com zeros a esquerda)
     crc_formatado = format(resto, '032b')
@@ -72,11 +133,12 @@ def verificar_crc(quadro_completo: str) -> bool:
     if len(quadro_completo) < 32:
         return False
         
-    dados_int = int(quadro_completo, 2)
-    
     # Na matemática do CRC, se dividirmos (Mensagem + CRC) pelo Polinômio,
     # o resto OBRIGATORIAMENTE deve ser zero.
-    resto_final = __executar_divisao_binaria(dados_int)
+    # (Mensagem + CRC) = Mensagem * x^32 + CRC, então o resto é o CRC da
+    # mensagem XOR o CRC recebido.
+    crc_recebido = int(quadro_completo[-GRAU_CRC:], 2)
+    resto_final = crc_rapido(__bits_para_bytes(quadro_completo[:-GRAU_CRC])) ^ crc_recebido
     
     # Verifica se o resto é zero
     return resto_final == 0
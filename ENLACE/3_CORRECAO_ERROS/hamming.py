@@ -3,6 +3,10 @@ Código de Hamming (7,4) e genéricos.
 Capacidade: Detecta e CORRIGE erro de 1 bit.
 """
 
+import functools
+
+import numpy as np
+
 def _eh_potencia_de_2(n):
     """
     Verifica se um número é potência de 2 (1, 2, 4, 8...)
@@ -11,6 +15,42 @@ def _eh_potencia_de_2(n):
     """
     return n > 0 and (n & (n - 1)) == 0
 
+@functools.lru_cache(maxsize=None)
+def _matrizes_hamming(n):
+    """
+    Monta (uma única vez para cada tamanho n) as matrizes do código:
+    - H (r x n): a coluna j é o número j escrito em binário. Assim H·c já dá a
+      posição do bit errado!
+    - G (k x n): cada linha põe um bit de dados na sua posição e liga as
+      paridades que cobrem essa posição.
+    - tabela de síndromes: síndrome -> posição do erro (0 = sem erro, -1 = fora do alcance)
+    """
+    r = n.bit_length()  # paridades nas posições 1, 2, 4... até n
+    posicoes = np.arange(1, n + 1)
+    eh_paridade = (posicoes & (posicoes - 1)) == 0
+    idx_dados = np.flatnonzero(~eh_paridade)
+    idx_paridade = np.flatnonzero(eh_paridade)
+
+    H = ((posicoes >> np.arange(r)[:, None]) & 1).astype(np.uint8)
+
+    G = np.zeros((len(idx_dados), n), dtype=np.uint8)
+    G[np.arange(len(idx_dados)), idx_dados] = 1
+    G[:, idx_paridade] = H[:, idx_dados].T
+
+    tabela_sindrome = np.arange(2**r)
+    tabela_sindrome[tabela_sindrome > n] = -1
+    return G, H, tabela_sindrome, idx_dados
+
+def _produto_gf2(a, b):
+    """Produto de matrizes em GF(2): soma normal e depois resto da divisão por 2."""
+    return (a.astype(np.int64) @ b.astype(np.int64)) % 2
+
+def _para_array(bits: str):
+    return np.frombuffer(bits.encode(), dtype=np.uint8) - ord('0')
+
+def _para_string(arr) -> str:
+    return (np.asarray(arr, dtype=np.uint8) + ord('0')).tobytes().decode()
+
 def codificar_hamming(dados_bits: str) -> str:
     """
     Recebe bits de dados (ex: '1001') e retorna o quadro Hamming completo.
@@ -21,82 +61,60 @@ def codificar_hamming(dados_bits: str) -> str:
     # Fórmula de Hamming: 2^r >= m + r + 1
     while (2**r) < (m + r + 1):
         r += 1
-        
-    tamanho_total = m + r
-    lista_quadro = ['?'] * (tamanho_total + 1) # +1 pois Hamming usa índice 1-based
-    
-    # 2. Preencher os DADOS nas posições que NÃO são potência de 2
-    idx_dados = 0
-    for i in range(1, tamanho_total + 1):
-        if not _eh_potencia_de_2(i):
-            lista_quadro[i] = dados_bits[idx_dados]
-            idx_dados += 1
-        else:
-            lista_quadro[i] = '0' # Placeholder para paridade
-            
-    # 3. Calcular os bits de Paridade
-    # Para cada bit de paridade (posições 1, 2, 4...)
-    for i in range(r):
-        posicao_paridade = 2**i
-        xor_acumulado = 0
-        
-        # Percorre o quadro verificando quem esse bit de paridade cobre
-        # Regra: Se o bit J tem o bit da posição_paridade "ligado", ele entra na conta.
-        for j in range(1, tamanho_total + 1):
-            # Ex: Se estamos calculando P4 (100), olhamos para 4, 5, 6, 7...
-            # Isso é feito com o E bit a bit (&)
-            if j & posicao_paridade:
-                xor_acumulado ^= int(lista_quadro[j])
-                
-        # Salva o resultado (0 ou 1) na posição da paridade
-        lista_quadro[posicao_paridade] = str(xor_acumulado)
-        
-    # Retorna string (ignorando o índice 0 que usamos só pra facilitar a matemática)
-    return "".join(lista_quadro[1:])
+
+    # 2. Quadro = dados x G (em GF(2)). A matriz G já coloca os dados nas posições
+    #    que NÃO são potência de 2 e calcula os bits de paridade (1, 2, 4...)
+    G, _, _, _ = _matrizes_hamming(m + r)
+    return _para_string(_produto_gf2(_para_array(dados_bits), G))
 
 def decodificar_hamming(quadro_recebido: str) -> str:
     """
     Recebe o quadro, verifica paridades, CORRIGE se necessário
     e retorna APENAS os dados originais.
     """
-    # Trabalhamos com lista para poder alterar (corrigir) o bit errado
-    # Adicionamos um dummy no índice 0 para alinhar com a matemática (1..N)
-    lista_bits = ['X'] + list(quadro_recebido)
     n = len(quadro_recebido)
-    
-    # Vamos calcular a "Síndrome" do erro
-    posicao_erro = 0
-    
-    # Quantos bits de paridade existem? Vamos checar as potências de 2.
-    r = 0
-    while (2**r) <= n:
-        posicao_paridade = 2**r
-        xor_verificacao = 0
-        
-        # Recalcula o XOR para essa posição (incluindo o próprio bit de paridade recebido)
-        for j in range(1, n + 1):
-            if j & posicao_paridade:
-                xor_verificacao ^= int(lista_bits[j])
-        
-        # Se o xor der 1, significa que a paridade não bateu (erro detectado!)
-        if xor_verificacao != 0:
-            # A mágica: somamos o valor da paridade à posição do erro
-            posicao_erro += posicao_paridade
-            
-        r += 1
-        
+    quadro = _para_array(quadro_recebido).copy()
+    _, H, tabela_sindrome, idx_dados = _matrizes_hamming(n)
+
+    # Síndrome = H x quadro (em GF(2)). Cada bit diz se uma paridade não bateu;
+    # lido como número binário, ele É a posição do erro
+    bits_sindrome = _produto_gf2(H, quadro)
+    sindrome = int(bits_sindrome @ (1 << np.arange(len(bits_sindrome))))
+
     # Se a posição do erro for > 0, temos que corrigir!
-    if posicao_erro > 0:
-        print(f"   [HAMMING] Correção Automática: Erro detectado e corrigido no bit {posicao_erro}.")
-        if posicao_erro <= n:
+    if sindrome > 0:
+        print(f"   [HAMMING] Correção Automática: Erro detectado e corrigido no bit {sindrome}.")
+        posicao_erro = tabela_sindrome[sindrome]
+        if posicao_erro > 0:
             # Inverte o bit (0->1 ou 1->0)
-            bit_atual = lista_bits[posicao_erro]
-            lista_bits[posicao_erro] = '0' if bit_atual == '1' else '1'
-            
+            quadro[posicao_erro - 1] ^= 1
+
     # Extrair apenas os dados (removendo as potências de 2)
-    dados_limpos = ""
-    for i in range(1, n + 1):
-        if not _eh_potencia_de_2(i):
-            dados_limpos += lista_bits[i]
-            
-    return dados_limpos
\ No newline at end of file
+    return _para_string(quadro[idx_dados])
+
+def codificar_blocos_hamming(dados_bits: str, n: int = 7) -> str:
+    """
+    Divide os dados em blocos (n, k), ex: (7,4), (15,11), (255,247), e codifica
+    todos de uma vez: cada linha da matriz de blocos é multiplicada por G.
+    O tamanho dos dados precisa ser múltiplo de k.
+    """
+    G, _, _, _ = _matrizes_hamming(n)
+    k = G.shape[0]
+    if len(dados_bits) % k != 0:
+        raise ValueError(f"Os dados precisam ter um múltiplo de {k} bits para o código ({n},{k}).")
+    blocos = _para_array(dados_bits).reshape(-1, k)
+    return _para_string(_produto_gf2(blocos, G).ravel())
+
+def decodificar_blocos_hamming(quadro_recebido: str, n: int = 7) -> str:
+    """
+    Corrige até 1 erro em CADA bloco de n bits e devolve os dados concatenados.
+    """
+    _, H, tabela_sindrome, idx_dados = _matrizes_hamming(n)
+    blocos = _para_array(quadro_recebido).reshape(-1, n).copy()
+
+    # Uma síndrome por bloco, todas calculadas no mesmo produto de matrizes
+    sindromes = _produto_gf2(blocos, H.T) @ (1 << np.arange(H.shape[0]))
+    posicao_erro = tabela_sindrome[sindromes]
+    com_erro = np.flatnonzero(posicao_erro > 0)
+    blocos[com_erro, posicao_erro[com_erro] - 1] ^= 1
+    return _para_string(blocos[:, idx_dados].ravel())
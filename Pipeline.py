@@ -0,0 +1,118 @@
+import time
+
+import numpy as np
+
+from CamadaEnlace import BitsCompactados, ReceptorEnlace, TransmissorEnlace
+from CamadaFisica import criar_transmissor_e_receptor
+
+# Etapas da cadeia, na ordem em que são executadas
+ETAPAS = ("enlace_tx", "fisica_tx", "fisica_rx", "enlace_rx")
+
+
+class Pipeline:
+    """Cadeia completa TX -> canal -> RX, sem interface gráfica:
+    mensagem -> TransmissorEnlace -> transmissor físico (com ruído) ->
+    receptor físico -> ReceptorEnlace -> mensagem.
+
+    É configurada uma vez e processa quantas mensagens forem necessárias. Entre as
+    etapas os bits circulam como BitsCompactados (enlace) ou arrays uint8 (física), sem
+    passar por strings de '0'/'1'.
+    O tempo gasto em cada etapa é acumulado em `tempos` (segundos).
+    """
+
+    def __init__(
+        self,
+        esquema: str = "qpsk",
+        bits_por_simbolo: int = 2,
+        frequencia: float = 1.0,
+        tensao_pico: float = 3.3,
+        taxa_amostragem: int = 100,
+        sigma: float = 0.1,
+        tipo_enquadramento: int = 0,
+        tipo_erro: int = 2,
+        tamanho_bloco_hamming: int | None = None,
+        semente: int | np.random.SeedSequence | np.random.Generator | None = None,
+        dtype: np.dtype = np.float64,
+    ):
+        # 0:Contagem, 1:Byte, 2:Bit (ver Utilitarios.get_nome_enq)
+        self.tipo_enquadramento = tipo_enquadramento
+        # 0:Paridade, 1:Checksum, 2:CRC, 3:Hamming (ver Utilitarios.get_nome_erro)
+        self.tipo_erro = tipo_erro
+        self.transmissor_enlace = TransmissorEnlace(tamanho_bloco_hamming)
+        self.receptor_enlace = ReceptorEnlace(tamanho_bloco_hamming)
+        self.transmissor, self.receptor = criar_transmissor_e_receptor(
+            esquema,
+            bits_por_simbolo=bits_por_simbolo,
+            frequencia=frequencia,
+            tensao_pico=tensao_pico,
+            taxa_amostragem=taxa_amostragem,
+            sigma=sigma,
+            semente=semente,
+            dtype=dtype,
+        )
+        self.tempos = dict.fromkeys(ETAPAS, 0.0)
+        self.mensagens_processadas = 0
+
+    def processar(self, mensagem: str | bytes) -> dict:
+        """
+        Transmite uma mensagem pela cadeia inteira.
+        Texto é convertido em bytes UTF-8; bytes são transmitidos como estão.
+        Retorna um dicionário com a mensagem recebida (do mesmo tipo da enviada), o
+        status do controle de erro, os erros de bit do canal e os tempos de cada etapa.
+        """
+        texto = isinstance(mensagem, str)
+        dados = BitsCompactados(mensagem.encode("utf-8") if texto else mensagem)
+        tempos = {}
+
+        inicio = time.perf_counter()
+        quadro = self.transmissor_enlace.processar(
+            dados, self.tipo_enquadramento, self.tipo_erro
+        )["quadro_final"]
+        bits_quadro = quadro.para_array()
+        tempos["enlace_tx"] = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        sinal = self.transmissor.processar_sinal(bits_quadro)
+        tempos["fisica_tx"] = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        # O último símbolo pode ter sido completado com zeros no transmissor
+        bits_recebidos = self.receptor.processar_sinal(sinal).ravel()
+        bits_recebidos = bits_recebidos[: len(bits_quadro)]
+
+        tempos["fisica_rx"] = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        resultado = self.receptor_enlace.processar(
+            BitsCompactados.de_array(bits_recebidos),
+            self.tipo_enquadramento,
+            self.tipo_erro,
+        )
+        # Bits que não completam um byte são descartados
+        dados_finais = resultado["dados_finais"]
+        recebida = dados_finais.dados[: len(dados_finais) // 8].tobytes()
+        tempos["enlace_rx"] = time.perf_counter() - inicio
+
+        for etapa, duracao in tempos.items():
+            self.tempos[etapa] += duracao
+        self.mensagens_processadas += 1
+
+        return {
+            "mensagem": (
+                recebida.decode("utf-8", errors="replace") if texto else recebida
+            ),
+            "status": resultado["status"],
+            "detalhes": resultado["detalhes"],
+            "bits_no_canal": len(bits_quadro),
+            "erros_de_bit": int(np.count_nonzero(bits_recebidos != bits_quadro)),
+            "amostras": sinal.size,
+            "tempos": tempos,
+        }
+
+    def processar_varias(self, mensagens) -> list[dict]:
+        """Processa uma sequência de mensagens com a mesma configuração."""
+        return [self.processar(mensagem) for mensagem in mensagens]
+
+    def reiniciar_tempos(self):
+        self.tempos = dict.fromkeys(ETAPAS, 0.0)
+        self.mensagens_processadas = 0
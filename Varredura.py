@@ -0,0 +1,167 @@
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+
+import numpy as np
+
+from CamadaFisica import Ruido, criar_transmissor_e_receptor
+
+# Colunas da tabela de resultados, na ordem em que são salvas
+COLUNAS = ("esquema", "bits_por_simbolo", "sigma", "ebn0_db", "bits", "erros", "ber")
+
+
+def _montar_enlace(ponto: dict):
+    """Cria o transmissor (sem ruído, somado depois) e o receptor de um ponto."""
+    return criar_transmissor_e_receptor(
+        ponto["esquema"],
+        bits_por_simbolo=ponto["bits_por_simbolo"],
+        frequencia=ponto.get("frequencia", 1.0),
+        taxa_amostragem=ponto.get("taxa_amostragem", 100),
+        debug=True,
+    )
+
+
+def sigma_para_ebn0(sigma: float, energia_por_bit: float) -> float:
+    """
+    Eb/N0 em dB de um ruído com desvio padrão sigma por amostra.
+    Com N0/2 = sigma², Eb/N0 = Eb / (2 sigma²), onde Eb é a soma das amostras² de
+    um símbolo dividida pelos bits.
+    """
+    return 10 * np.log10(energia_por_bit / (2 * sigma**2))
+
+
+def ebn0_para_sigma(ebn0_db: float, energia_por_bit: float) -> float:
+    """Inverso de sigma_para_ebn0."""
+    return np.sqrt(energia_por_bit / (2 * 10 ** (ebn0_db / 10)))
+
+
+def _simular_ponto(argumentos: tuple) -> dict:
+    """
+    Mede a BER de um ponto da grade.
+    Fica no nível do módulo para poder ser executada em outro processo.
+    Transmite lotes de bits aleatórios até ver erros_alvo erros ou chegar a max_bits.
+    """
+    ponto, semente, erros_alvo, max_bits, bits_por_lote = argumentos
+    transmissor, receptor = _montar_enlace(ponto)
+    gerador = np.random.default_rng(semente)
+
+    # Energia média de um símbolo ideal, dividida pelos bits de cada símbolo
+    energias = [
+        np.sum(forma_de_onda**2)
+        for forma_de_onda in receptor.dicionario_de_formas_de_onda.values()
+    ]
+    energia_por_bit = np.mean(energias) / ponto["bits_por_simbolo"]
+    if "sigma" in ponto:
+        sigma = ponto["sigma"]
+        ebn0_db = sigma_para_ebn0(sigma, energia_por_bit) if sigma > 0 else np.inf
+    else:
+        ebn0_db = ponto["ebn0_db"]
+        sigma = ebn0_para_sigma(ebn0_db, energia_por_bit)
+    ruido = Ruido(sigma, semente=gerador)
+
+    # Lotes com um número inteiro de símbolos
+    bits_por_lote -= bits_por_lote % ponto["bits_por_simbolo"]
+    bits_transmitidos = 0
+    erros = 0
+    while erros < erros_alvo and bits_transmitidos < max_bits:
+        bits = gerador.integers(0, 2, bits_por_lote, dtype=np.uint8)
+        sinal = transmissor.processar_sinal(bits)
+        ruido.adicionar(sinal)
+        bits_recebidos = receptor.processar_sinal(sinal)
+
+        erros += int(np.count_nonzero(bits_recebidos.ravel() != bits))
+        bits_transmitidos += bits_por_lote
+
+    return {
+        "esquema": ponto["esquema"],
+        "bits_por_simbolo": ponto["bits_por_simbolo"],
+        "sigma": float(sigma),
+        "ebn0_db": float(ebn0_db),
+        "bits": bits_transmitidos,
+        "erros": erros,
+        "ber": erros / bits_transmitidos,
+    }
+
+
+class VarreduraBER:
+    """
+    Levanta curvas de BER (taxa de erro de bit) variando o ruído de cada esquema.
+    Cada ponto da grade é simulado num processo separado, com sua própria semente
+    derivada da semente da varredura: o resultado não depende da ordem nem do número
+    de processos.
+    """
+
+    def __init__(
+        self,
+        erros_alvo: int = 100,
+        max_bits: int = 1_000_000,
+        bits_por_lote: int = 10_000,
+        semente: int | None = None,
+        processos: int | None = None,
+    ):
+        self.erros_alvo = erros_alvo  # Para o ponto assim que vê esse número de erros
+        self.max_bits = max_bits  # ...ou quando transmite esse número de bits
+        self.bits_por_lote = bits_por_lote
+        self.semente = semente
+        self.processos = processos if processos is not None else os.cpu_count()
+
+    @staticmethod
+    def grade(
+        esquemas: list[str],
+        bits_por_simbolo: list[int],
+        sigmas: list[float] | None = None,
+        ebn0_db: list[float] | None = None,
+    ) -> list[dict]:
+        """
+        Produto cartesiano esquema x bits_por_simbolo x ruído.
+        O ruído é dado por sigmas (desvio padrão do Ruido) ou por ebn0_db (Eb/N0, em
+        decibéis), não pelos dois.
+        """
+        if (sigmas is None) == (ebn0_db is None):
+            raise ValueError("Informe sigmas ou ebn0_db.")
+        chave, valores = (
+            ("sigma", sigmas) if sigmas is not None else ("ebn0_db", ebn0_db)
+        )
+        return [
+            {"esquema": esquema, "bits_por_simbolo": bps, chave: valor}
+            for esquema, bps, valor in product(esquemas, bits_por_simbolo, valores)
+        ]
+
+    def executar(self, grade: list[dict]) -> list[dict]:
+        """Simula todos os pontos da grade e retorna uma linha de resultado cada."""
+        # Um lote menor que um símbolo seria arredondado para zero bits
+        for ponto in grade:
+            if self.bits_por_lote < ponto["bits_por_simbolo"]:
+                raise ValueError(
+                    f"bits_por_lote={self.bits_por_lote} é menor que um símbolo de "
+                    f"{ponto['bits_por_simbolo']} bits."
+                )
+        sementes = np.random.SeedSequence(self.semente).spawn(len(grade))
+        argumentos = [
+            (ponto, semente, self.erros_alvo, self.max_bits, self.bits_por_lote)
+            for ponto, semente in zip(grade, sementes)
+        ]
+        if self.processos == 1:
+            return [_simular_ponto(argumento) for argumento in argumentos]
+
+        with ProcessPoolExecutor(max_workers=self.processos) as executor:
+            return list(executor.map(_simular_ponto, argumentos))
+
+    @staticmethod
+    def salvar_csv(resultados: list[dict], caminho: str | os.PathLike):
+        with open(caminho, "w", newline="") as arquivo:
+            escritor = csv.DictWriter(arquivo, fieldnames=COLUNAS)
+            escritor.writeheader()
+            escritor.writerows(resultados)
+
+    @staticmethod
+    def salvar_npz(resultados: list[dict], caminho: str | os.PathLike):
+        """Salva uma coluna por campo (np.load(caminho)["ber"], ...)."""
+        np.savez(
+            caminho,
+            **{
+                coluna: np.array([linha[coluna] for linha in resultados])
+                for coluna in COLUNAS
+            },
+        )
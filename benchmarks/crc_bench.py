@@ -0,0 +1,60 @@
+"""
+Benchmark do CRC-32 da camada de enlace.
+Compara a divisão longa bit a bit (implementação original de Utilitarios.divisao_crc)
+com Utilitarios.crc32, calculado em C pelo zlib, em payloads de 1 KB a 10 MB.
+
+A divisão bit a bit tem custo quadrático, então só é executada até --limite-bit-a-bit.
+
+Uso: python benchmarks/crc_bench.py [--limite-bit-a-bit 100000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from CamadaEnlace import Utilitarios
+
+TAMANHOS = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+
+
+def divisao_crc_bit_a_bit(numero_alvo):
+    """Implementação original: divisão longa sobre um inteiro Python."""
+    divisor = Utilitarios.POLINOMIO_CRC32
+    dividendo = numero_alvo
+    num_bits = dividendo.bit_length()
+    while num_bits >= (Utilitarios.GRAU_CRC + 1):
+        shift = num_bits - (Utilitarios.GRAU_CRC + 1)
+        dividendo ^= divisor << shift
+        num_bits = dividendo.bit_length()
+    return dividendo
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--limite-bit-a-bit", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'payload':>12} {'bit a bit (s)':>14} {'zlib (s)':>12} {'MB/s zlib':>12}")
+    for tamanho in TAMANHOS:
+        payload = os.urandom(tamanho)
+
+        inicio = time.perf_counter()
+        crc_zlib = Utilitarios.crc32(memoryview(payload))
+        tempo_zlib = time.perf_counter() - inicio
+
+        tempo_bit = "-"
+        if tamanho <= args.limite_bit_a_bit:
+            inicio = time.perf_counter()
+            crc_bit = divisao_crc_bit_a_bit(int.from_bytes(payload, "big") << 32)
+            tempo_bit = f"{time.perf_counter() - inicio:.4f}"
+            assert crc_bit == crc_zlib, "Motores divergem!"
+
+        vazao = tamanho / tempo_zlib / 1e6
+        print(f"{tamanho:>12} {tempo_bit:>14} {tempo_zlib:>12.4f} {vazao:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark da geração de pulsos por série de Fourier (Sinal.gerar_pulso_tensao).
+Compara a integração numérica original (scipy.integrate.quad) com os coeficientes
+em forma fechada, para quadros de 10 mil símbolos.
+
+Uso: python benchmarks/pulso_tensao_bench.py [--simbolos 10000] [--taxa 1000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+from scipy.integrate import quad
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from CamadaFisica import Sinal
+
+
+def serie_de_fourier_quad(simbolos, tempo_de_simbolo, harmonicas, taxa_amostragem):
+    """Implementação original, integrando cada coeficiente com quad."""
+    periodo = tempo_de_simbolo * len(simbolos)
+    t = np.linspace(0, periodo, int(periodo * taxa_amostragem), endpoint=False)
+    c = (
+        2
+        / periodo
+        * quad(lambda t: simbolos[int(t // tempo_de_simbolo)], 0, periodo)[0]
+    )
+    resultado = np.zeros_like(t) + c / 2
+    for n in range(1, harmonicas + 1):
+        y_an = lambda t: simbolos[int(t // tempo_de_simbolo)] * np.sin(
+            2 * np.pi * n * t / periodo
+        )
+        y_bn = lambda t: simbolos[int(t // tempo_de_simbolo)] * np.cos(
+            2 * np.pi * n * t / periodo
+        )
+        an = (
+            np.sin(2 * np.pi * n * t / periodo)
+            * (2.0 / periodo)
+            * quad(y_an, 0, periodo)[0]
+        )
+        bn = (
+            np.cos(2 * np.pi * n * t / periodo)
+            * (2.0 / periodo)
+            * quad(y_bn, 0, periodo)[0]
+        )
+        resultado += an + bn
+    return np.reshape(resultado, (len(simbolos), -1))
+
+
+def pulso_tensao_quad(
+    simbolos, taxa_amostragem, tempo_de_simbolo=1.0, simbolos_por_periodo=4
+):
+    segmentos = np.split(
+        simbolos, np.arange(simbolos_por_periodo, len(simbolos), simbolos_por_periodo)
+    )
+    return np.concatenate(
+        [
+            serie_de_fourier_quad(segmento, tempo_de_simbolo, 8, taxa_amostragem)
+            for segmento in segmentos
+        ]
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--simbolos", type=int, default=10_000)
+    parser.add_argument("--taxa", type=int, default=1000)
+    args = parser.parse_args()
+
+    sinal = Sinal(bits_por_simbolo=1, taxa_amostragem=args.taxa)
+    bits = np.random.default_rng(0).integers(0, 2, args.simbolos)
+    simbolos = sinal.binario_para_decimal(bits) * 3.3
+
+    inicio = time.perf_counter()
+    referencia = pulso_tensao_quad(simbolos, args.taxa)
+    tempo_quad = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    forma_de_onda = sinal.gerar_pulso_tensao(simbolos)
+    tempo_fechado = time.perf_counter() - inicio
+
+    erro = np.max(np.abs(forma_de_onda - referencia))
+    print(f"Símbolos: {args.simbolos} | Amostras por símbolo: {args.taxa}")
+    print(f"quad (original):    {tempo_quad:10.4f} s")
+    print(f"forma fechada:      {tempo_fechado:10.4f} s")
+    print(f"speedup:            {tempo_quad / tempo_fechado:10.1f}x")
+    print(f"erro máximo:        {erro:.3e} V")
+
+
+if __name__ == "__main__":
+    main()
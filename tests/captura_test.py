@@ -0,0 +1,129 @@
+import os
+import tempfile
+import tracemalloc
+import unittest
+
+import numpy as np
+import numpy.testing as npt
+
+from CamadaFisica import (
+    Demodulador,
+    GravadorDeCaptura,
+    LeitorDeCaptura,
+    Modulador,
+    ReceptorEmFluxo,
+    TransmissorBandaBase,
+    TAMANHO_CABECALHO,
+)
+
+
+class TestCaptura(unittest.TestCase):
+
+    def setUp(self):
+        self.pasta = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.pasta.name, "captura.bin")
+
+    def tearDown(self):
+        self.pasta.cleanup()
+
+    def test_modulador_gravar_e_reproduzir(self):
+        bits = np.random.default_rng(0).integers(0, 2, 2000)
+        modulador = Modulador(
+            "qpsk", 10, bits_por_simbolo=2, taxa_amostragem=100, sigma=0.5
+        )
+
+        with GravadorDeCaptura(self.caminho, modulador) as gravador:
+            gravador.escrever_fluxo(
+                modulador.processar_fluxo(bits, amostras_por_bloco=1000)
+            )
+        self.assertEqual(
+            os.path.getsize(self.caminho),
+            TAMANHO_CABECALHO + 4 * gravador.amostras_gravadas,
+        )
+
+        leitor = LeitorDeCaptura(self.caminho)
+        self.assertEqual(leitor.cabecalho["esquema"], "qpsk")
+        self.assertEqual(leitor.cabecalho["sigma"], 0.5)
+        self.assertEqual(len(leitor), 10 * len(bits) // 2)
+        self.assertIsInstance(leitor.amostras, np.memmap)
+        self.assertEqual(leitor.amostras.dtype, np.float32)
+
+        bits_recebidos = np.concatenate(list(leitor.processar(amostras_por_bloco=777)))
+        npt.assert_array_equal(bits_recebidos.flatten(), bits)
+
+    def test_banda_base_gravar_e_reproduzir(self):
+        bits = np.random.default_rng(1).integers(0, 2, 500)
+        transmissor = TransmissorBandaBase("manchester", taxa_amostragem=40, debug=True)
+        sinal = transmissor.processar_sinal(bits)
+
+        with GravadorDeCaptura(self.caminho, transmissor) as gravador:
+            gravador.escrever(sinal[:123])
+            gravador.escrever(sinal[123:])
+
+        leitor = LeitorDeCaptura(self.caminho)
+        npt.assert_array_equal(leitor.amostras, sinal.flatten().astype(np.float32))
+        npt.assert_array_equal(
+            leitor.criar_receptor().processar_sinal(leitor.amostras), bits
+        )
+
+    def test_receptor_no_tipo_e_fase_da_captura(self):
+        bits = np.random.default_rng(3).integers(0, 2, 900)
+        modulador = Modulador(
+            "fsk",
+            10,
+            bits_por_simbolo=3,
+            taxa_amostragem=1000,
+            sigma=0.3,
+            fase_continua=True,
+        )
+        with GravadorDeCaptura(self.caminho, modulador) as gravador:
+            gravador.escrever_fluxo(
+                modulador.processar_fluxo(bits, amostras_por_bloco=1000)
+            )
+
+        leitor = LeitorDeCaptura(self.caminho)
+        self.assertTrue(leitor.cabecalho["fase_continua"])
+        receptor = leitor.criar_receptor()
+        self.assertTrue(receptor.fase_continua)
+        self.assertEqual(receptor.detector.base.dtype, np.float32)
+
+        bits_recebidos = np.concatenate(
+            list(leitor.processar(receptor, amostras_por_bloco=777))
+        )
+        npt.assert_array_equal(bits_recebidos.flatten(), bits)
+
+    def test_reproducao_sem_copiar_os_blocos(self):
+        bits = np.random.default_rng(2).integers(0, 2, 20000)
+        modulador = Modulador(
+            "qpsk", 10, bits_por_simbolo=2, taxa_amostragem=1000, sigma=0.3, semente=0
+        )
+        with GravadorDeCaptura(self.caminho, modulador) as gravador:
+            gravador.escrever(modulador.processar_sinal(bits))
+        leitor = LeitorDeCaptura(self.caminho)
+
+        fluxo = ReceptorEmFluxo(
+            Demodulador(
+                "qpsk", 10, bits_por_simbolo=2, taxa_amostragem=1000, dtype=np.float32
+            )
+        )
+        recebidos = [fluxo.alimentar(leitor.amostras[:50])]
+
+        # Bloco grande começando no meio de um símbolo: só a sobra é copiada
+        bloco = leitor.amostras[50:]
+        tracemalloc.start()
+        recebidos.append(fluxo.alimentar(bloco))
+        pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        self.assertLess(pico, bloco.nbytes / 4)
+        npt.assert_array_equal(np.concatenate(recebidos).flatten(), bits)
+
+    def test_arquivo_invalido(self):
+        with open(self.caminho, "wb") as arquivo:
+            arquivo.write(b"nada")
+        with self.assertRaises(ValueError):
+            LeitorDeCaptura(self.caminho)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,7 @@ from matplotlib import pyplot as plt
 
 from CamadaFisica import Bipolar, Manchester, NRZPolar
 
+
 class TestCodificacoes(unittest.TestCase):
     def test_nrz_polar(self):
         codificador = NRZPolar()
@@ -197,6 +198,32 @@ class TestCodificacoes(unittest.TestCase):
         plt.savefig("images/tests/camada_fisica/codificacao_manchester.png")
         plt.close()
 
+    def test_codificacoes_vetorizadas_igual_laco(self):
+        rng = np.random.default_rng(4)
+        for formato in [(200,), (50, 3)]:
+            bits = rng.integers(0, 2, formato)
+
+            # Referências símbolo a símbolo
+            nrz = [np.where(simbolo == 1, 1.0, -1.0) for simbolo in bits]
+            manchester, bipolar, sinal = [], [], 1.0
+            for simbolo in bits:
+                manchester += [
+                    np.where(simbolo == 1, 0.0, 1.0),
+                    np.where(simbolo == 1, 1.0, 0.0),
+                ]
+                if np.any(simbolo == 1):
+                    bipolar.append(simbolo * sinal)
+                    sinal *= -1.0
+                else:
+                    bipolar.append(np.zeros_like(simbolo, dtype=float))
+                bipolar.append(np.zeros_like(simbolo, dtype=float))
+
+            npt.assert_array_equal(NRZPolar().codificar(bits), np.array(nrz))
+            npt.assert_array_equal(Manchester().codificar(bits), np.array(manchester))
+            codificado = Bipolar().codificar(bits)
+            npt.assert_array_equal(codificado, np.array(bipolar))
+            npt.assert_array_equal(np.signbit(codificado), np.signbit(bipolar))
+
 
 if __name__ == "__main__":
     unittest.main()
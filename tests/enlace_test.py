@@ -0,0 +1,271 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+import numpy.testing as npt
+
+from CamadaEnlace import (
+    BitsCompactados,
+    CodigoHamming,
+    ReceptorEnlace,
+    TransmissorEnlace,
+    Utilitarios,
+)
+
+
+def divisao_crc_bit_a_bit(numero_alvo):
+    """Divisão longa de referência, um bit por passo."""
+    dividendo = numero_alvo
+    num_bits = dividendo.bit_length()
+    while num_bits >= Utilitarios.GRAU_CRC + 1:
+        dividendo ^= Utilitarios.POLINOMIO_CRC32 << (
+            num_bits - Utilitarios.GRAU_CRC - 1
+        )
+        num_bits = dividendo.bit_length()
+    return dividendo
+
+
+def checksum_palavra_a_palavra(bits, n_bits):
+    """Soma de referência: uma palavra por vez, dobrando o vai-um a cada soma."""
+    mascara = (1 << n_bits) - 1
+    bits = "0" * (-len(bits) % n_bits) + bits
+    soma = 0
+    for i in range(0, len(bits), n_bits):
+        soma += int(bits[i : i + n_bits], 2)
+        while soma > mascara:
+            soma = (soma & mascara) + (soma >> n_bits)
+    return soma
+
+
+class TestEnlace(unittest.TestCase):
+    def test_crc32_igual_divisao_longa(self):
+        for mensagem in (b"", b"U", b"The quick brown fox", bytes(range(256)) * 4):
+            numero = int.from_bytes(mensagem, "big") << 32
+            self.assertEqual(Utilitarios.crc32(mensagem), divisao_crc_bit_a_bit(numero))
+            self.assertEqual(
+                Utilitarios.crc32(memoryview(bytearray(mensagem))),
+                divisao_crc_bit_a_bit(numero),
+            )
+            self.assertEqual(
+                Utilitarios.crc32(np.frombuffer(mensagem, dtype=np.uint8)),
+                divisao_crc_bit_a_bit(numero),
+            )
+            self.assertEqual(
+                Utilitarios.divisao_crc(numero + 12345),
+                divisao_crc_bit_a_bit(numero + 12345),
+            )
+
+        # Continuar de um bloco anterior dá o mesmo CRC da mensagem inteira
+        mensagem = bytes(range(256)) * 3
+        self.assertEqual(
+            Utilitarios.crc32(mensagem[100:], Utilitarios.crc32(mensagem[:100])),
+            Utilitarios.crc32(mensagem),
+        )
+
+    def test_crc32_quadro(self):
+        tx, rx = TransmissorEnlace(), ReceptorEnlace()
+        bits = "0101010001101000"  # "Th"
+
+        quadro = tx.processar(bits, 0, 2)["quadro_final"]
+        crc = int(quadro[-32:], 2)
+        self.assertEqual(crc, divisao_crc_bit_a_bit(int(bits, 2) << 32))
+
+        resultado = rx.processar(quadro, 0, 2)
+        self.assertEqual(resultado["status"], "SUCESSO")
+        self.assertEqual(resultado["dados_finais"], bits)
+
+        corrompido = quadro[:10] + ("1" if quadro[10] == "0" else "0") + quadro[11:]
+        self.assertEqual(rx.processar(corrompido, 0, 2)["status"], "ERRO")
+
+    def test_bits_compactados_conversoes(self):
+        bits = "0101010001101000011"
+        compactados = BitsCompactados.de_string(bits)
+
+        self.assertEqual(len(compactados), len(bits))
+        self.assertEqual(compactados.para_string(), bits)
+        npt.assert_array_equal(compactados.para_array(), [int(b) for b in bits])
+        npt.assert_array_equal(compactados.dados, [0b01010100, 0b01101000, 0b01100000])
+        self.assertEqual(
+            compactados.bytes_alinhados_a_direita().tobytes(),
+            int(bits, 2).to_bytes(3, "big"),
+        )
+        self.assertEqual(compactados[1], 1)
+        self.assertEqual(compactados[-1], 1)
+
+    def test_bits_compactados_fatias_e_concatenacao(self):
+        rng = np.random.default_rng(0)
+        bits = "".join(rng.choice(["0", "1"], 77))
+        compactados = BitsCompactados.de_string(bits)
+
+        for inicio, fim in ((0, 77), (3, 50), (8, -8), (13, 14), (70, 77), (40, 40)):
+            self.assertEqual(compactados[inicio:fim].para_string(), bits[inicio:fim])
+
+        for corte in (0, 5, 8, 31, 77):
+            juntos = compactados[:corte] + compactados[corte:]
+            self.assertEqual(juntos, compactados)
+
+        invertido = compactados.inverter_bit(10)
+        self.assertEqual(invertido.para_string()[10], "1" if bits[10] == "0" else "0")
+        self.assertEqual(compactados.paridade(), bits.count("1") % 2)
+
+    def test_processar_bits_compactados_igual_string(self):
+        tx, rx = TransmissorEnlace(), ReceptorEnlace()
+        bits = "0111111001111101" + "1111111" + "0110100"
+
+        for tipo_enquadramento in range(3):
+            for tipo_erro in range(4):
+                res_str = tx.processar(bits, tipo_enquadramento, tipo_erro)
+                res_bits = tx.processar(
+                    BitsCompactados.de_string(bits), tipo_enquadramento, tipo_erro
+                )
+                self.assertEqual(
+                    res_bits["quadro_final"].para_string(), res_str["quadro_final"]
+                )
+
+                rx_bits = rx.processar(
+                    res_bits["quadro_final"], tipo_enquadramento, tipo_erro
+                )
+                self.assertEqual(rx_bits["status"], "SUCESSO")
+                self.assertEqual(rx_bits["dados_finais"].para_string(), bits)
+
+    def test_stuffing_igual_laco_bit_a_bit(self):
+        rng = np.random.default_rng(1)
+        for _ in range(50):
+            bits = rng.choice([0, 1], int(rng.integers(0, 200)), p=[0.1, 0.9]).astype(
+                np.uint8
+            )
+
+            # Referência: laço original bit a bit
+            esperado, cnt = [], 0
+            for b in bits:
+                esperado.append(b)
+                cnt = cnt + 1 if b == 1 else 0
+                if cnt == 5:
+                    esperado.append(0)
+                    cnt = 0
+
+            enchido = Utilitarios.bit_stuffing(bits)
+            npt.assert_array_equal(enchido, esperado)
+            npt.assert_array_equal(Utilitarios.remover_bit_stuffing(enchido), bits)
+
+        flag, esc = 0x7E, 0x7D
+        dados = rng.choice([flag, esc, 0x00, 0xFF], 300).astype(np.uint8)
+        esperado = []
+        for byte in dados:
+            if byte in (flag, esc):
+                esperado.append(esc)
+            esperado.append(byte)
+        enchido = Utilitarios.byte_stuffing(dados, flag, esc)
+        npt.assert_array_equal(enchido, esperado)
+        npt.assert_array_equal(Utilitarios.remover_byte_stuffing(enchido, esc), dados)
+
+    def test_checksum_vetorizado(self):
+        rng = np.random.default_rng(3)
+        for n_bits in (8, 16, 32, 64, 12, 5):
+            for tamanho in (0, 7, 64, 1001):
+                bits = "".join(map(str, rng.integers(0, 2, tamanho)))
+                esperado = checksum_palavra_a_palavra(bits, n_bits)
+                self.assertEqual(Utilitarios.checksum_math(bits, n_bits), esperado)
+                self.assertEqual(
+                    Utilitarios.checksum_math(BitsCompactados.de_string(bits), n_bits),
+                    esperado,
+                )
+        # Só uns: a soma é "tudo 1" (nunca dobra para 0)
+        self.assertEqual(Utilitarios.checksum_math("1" * 64, 16), 0xFFFF)
+
+    def test_hamming_matrizes(self):
+        codigo = CodigoHamming.para_tamanho(7)
+        self.assertIs(codigo, CodigoHamming.para_tamanho(7))
+        self.assertEqual((codigo.n, codigo.k, codigo.r), (7, 4, 3))
+        # Toda palavra gerada por G tem síndrome nula
+        npt.assert_array_equal((codigo.G.astype(int) @ codigo.H.T) % 2, 0)
+
+        # Um erro por bloco, em todas as posições possíveis, é corrigido pela tabela
+        rng = np.random.default_rng(2)
+        for n in (7, 15, 255):
+            codigo = CodigoHamming.para_tamanho(n)
+            dados = rng.integers(0, 2, (n, codigo.k), dtype=np.uint8)
+            palavras = codigo.codificar(dados)
+            npt.assert_array_equal(
+                palavras[0], CodigoHamming.codificar_palavra(dados[0])
+            )
+            palavras[np.arange(n), np.arange(n)] ^= 1
+            corrigidos, posicao_erro = codigo.decodificar(palavras)
+            npt.assert_array_equal(corrigidos, dados)
+            npt.assert_array_equal(posicao_erro, np.arange(1, n + 1))
+
+    @mock.patch("CamadaEnlace.BITS_POR_TRECHO", 13)
+    def test_hamming_e_bit_stuffing_em_trechos(self):
+        # Trechos pequenos: palavras, blocos e sequências de uns cruzam as fronteiras
+        rng = np.random.default_rng(4)
+        for tamanho in (0, 1, 4, 26, 57, 300):
+            for p in (0.5, 0.95):
+                bits = (rng.random(tamanho) < p).astype(np.uint8)
+                compactados = BitsCompactados.de_array(bits)
+
+                enchido = Utilitarios.bit_stuffing(bits)
+                npt.assert_array_equal(
+                    Utilitarios.bit_stuffing_compactado(compactados).para_array(),
+                    enchido,
+                )
+                self.assertEqual(
+                    Utilitarios.remover_bit_stuffing_compactado(
+                        BitsCompactados.de_array(enchido)
+                    ),
+                    compactados,
+                )
+
+                palavra = CodigoHamming.codificar_palavra(bits)
+                self.assertEqual(
+                    CodigoHamming.codificar_compactado(compactados),
+                    BitsCompactados.de_array(palavra),
+                )
+                for erro in range(len(palavra) + 1):
+                    recebida = BitsCompactados.de_array(palavra)
+                    if erro:
+                        recebida = recebida.inverter_bit(erro - 1)
+                    self.assertEqual(
+                        CodigoHamming.decodificar_compactado(recebida),
+                        (compactados, erro),
+                    )
+
+                codigo = CodigoHamming.para_tamanho(7)
+                completos = tamanho // 4 * 4
+                blocos = codigo.codificar(bits[:completos].reshape(-1, 4)).ravel()
+                codificados = codigo.codificar_blocos(compactados[:completos])
+                npt.assert_array_equal(codificados.para_array(), blocos)
+                if completos > 4:  # um erro no primeiro e outro no último bloco
+                    errados = codificados.inverter_bits([0, len(blocos) - 1])
+                    dados, erros, fora = codigo.decodificar_blocos(errados)
+                    self.assertEqual(dados, compactados[:completos])
+                    self.assertEqual(erros[0], 1)
+                    self.assertEqual(erros[-1], len(blocos))
+                    self.assertFalse(fora)
+
+    def test_hamming_quadro_em_blocos(self):
+        bits = "0101010001101000011001"  # 5 blocos (7,4) e sobra de 2 bits
+        tx, rx = TransmissorEnlace(tamanho_bloco_hamming=7), ReceptorEnlace(
+            tamanho_bloco_hamming=7
+        )
+        enviado = tx.processar(bits, 0, 3)
+        self.assertEqual(len(enviado["payload_protegido"]), 5 * 7 + 5)
+
+        resultado = rx.processar(enviado["quadro_final"], 0, 3)
+        self.assertEqual(resultado["status"], "SUCESSO")
+        self.assertEqual(resultado["dados_finais"], bits)
+
+        quadro = list(enviado["quadro_final"])
+        for i in (
+            8 + 2,
+            8 + 7 * 3 + 6,
+            8 + 35 + 4,
+        ):  # bit 3, bit 28 e bit 40 do payload
+            quadro[i] = "1" if quadro[i] == "0" else "0"
+        resultado = rx.processar("".join(quadro), 0, 3)
+        self.assertEqual(resultado["status"], "CORRIGIDO")
+        self.assertEqual(resultado["detalhes"], "Erros nos bits 3, 28, 40 corrigidos.")
+        self.assertEqual(resultado["dados_finais"], bits)
+
+
+if __name__ == "__main__":
+    unittest.main()
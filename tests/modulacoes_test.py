@@ -4,7 +4,8 @@ import numpy as np
 import numpy.testing as npt
 from matplotlib import pyplot as plt
 
-from CamadaFisica import ASK, FSK, PSK, QPSK, QAM16, Gray, Sinal
+from CamadaFisica import ASK, FSK, MODULACOES, MPSK, MQAM, PSK, QPSK, QAM16, Gray, Sinal
+
 
 class TestModulacoes(unittest.TestCase):
     def test_ask_gerar_parametros(self):
@@ -299,3 +300,84 @@ class TestModulacoes(unittest.TestCase):
         plt.tight_layout()
         plt.savefig("images/tests/camada_fisica/modulacao_16qam.png")
         plt.close()
+
+    def test_tabelas_de_parametros(self):
+        # Uma linha por símbolo -> [amplitude, frequência, fase]
+        for modulacao in [ASK(3), FSK(3), PSK(3), QPSK(), QAM16()]:
+            self.assertEqual(modulacao.tabela.shape, (2**modulacao.bits_por_simbolo, 3))
+
+        # 8-PSK: todas as fases, inclusive as de símbolos cujo decimal normalizado
+        # não bate exatamente com a tabela Gray normalizada
+        sinal = Sinal(bits_por_simbolo=3)
+        simbolos = sinal.binario_para_decimal(sinal.tabela_de_bits)
+        fases = PSK(bits_por_simbolo=3).gerar_parametros(simbolos)
+        tabela_gray = Gray(bits_por_simbolo=3).tabela_gray
+        fases_esperadas = [list(tabela_gray).index(s) * 45 for s in range(8)]
+        npt.assert_array_equal(fases, fases_esperadas)
+
+        # Com a tabela, ASK e FSK dão o mesmo resultado que sem ela
+        npt.assert_array_equal(
+            ASK(3).gerar_parametros(simbolos), ASK().gerar_parametros(simbolos)
+        )
+        npt.assert_array_equal(FSK(3).gerar_parametros(simbolos), 1 + simbolos)
+
+    def test_constelacoes(self):
+        # FSK muda a frequência, então não tem constelação em banda base
+        self.assertIsNone(FSK(2).constelacao)
+        npt.assert_allclose(ASK(2).constelacao, [0, 1 / 3, 2 / 3, 1])
+
+        # QPSK: quatro pontos no círculo unitário, vizinhos Gray a 90 graus
+        qpsk = QPSK().constelacao
+        npt.assert_allclose(np.abs(qpsk), 1)
+        npt.assert_allclose(qpsk[[0, 1, 3, 2]], [1, 1j, -1, -1j], atol=1e-12)
+
+        # 16QAM: grade 4x4 de I, Q em {±1, ±3}/(3√2)
+        # I > 0 === 1XXX e Q > 0 === X1XX
+        qam = QAM16().constelacao * 3 * np.sqrt(2)
+        npt.assert_allclose(np.sort(np.unique(np.round(qam.real, 9))), [-3, -1, 1, 3])
+        npt.assert_allclose(np.sort(np.unique(np.round(qam.imag, 9))), [-3, -1, 1, 3])
+        simbolos = np.arange(16)
+        npt.assert_array_equal(qam.real > 0, simbolos >= 8)
+        npt.assert_array_equal(qam.imag > 0, (simbolos & 4) > 0)
+
+        sinal = Sinal(bits_por_simbolo=4)
+        decimais = sinal.binario_para_decimal(sinal.tabela_de_bits)
+        npt.assert_array_equal(
+            QAM16().gerar_simbolos_complexos(decimais), QAM16().constelacao
+        )
+
+    def test_familias_mqam_mpsk(self):
+        # 16QAM e QPSK são casos particulares das famílias genéricas
+        npt.assert_array_equal(MQAM(16).tabela, QAM16().tabela)
+        npt.assert_array_equal(
+            MQAM(16).tabela_gray * 15,
+            [[7, 5, 13, 15], [6, 4, 12, 14], [2, 0, 8, 10], [3, 1, 9, 11]],
+        )
+        npt.assert_array_equal(MPSK(4).tabela, QPSK().tabela)
+        npt.assert_array_equal(MPSK(8).tabela, PSK(3).tabela)
+
+        for ordem in [64, 256]:
+            modulacao = MQAM(ordem)
+            self.assertEqual(modulacao.bits_por_simbolo, np.log2(ordem))
+            # Tabela gerada uma única vez e compartilhada entre as instâncias
+            self.assertIs(modulacao.tabela, MQAM(ordem).tabela)
+
+            # Grade √M x √M com cantos de amplitude 1 e vizinhos Gray (um bit diferente)
+            constelacao = modulacao.constelacao * (np.sqrt(ordem) - 1) * np.sqrt(2)
+            niveis = np.arange(-np.sqrt(ordem) + 1, np.sqrt(ordem), 2)
+            npt.assert_allclose(np.unique(np.round(constelacao.real, 9)), niveis)
+            npt.assert_allclose(np.unique(np.round(constelacao.imag, 9)), niveis)
+            npt.assert_allclose(np.max(np.abs(modulacao.constelacao)), 1)
+            distancias = np.abs(constelacao[:, np.newaxis] - constelacao)
+            vizinhos = np.argwhere(np.isclose(distancias, 2))
+            diferencas = [bin(a ^ b).count("1") for a, b in vizinhos]
+            self.assertEqual(set(diferencas), {1})
+
+        self.assertEqual(
+            len(np.unique(np.round(MODULACOES["8-psk"]().tabela[:, 2], 9))), 8
+        )
+        for ordem in [2, 8, 32]:
+            with self.assertRaises(ValueError):
+                MQAM(ordem)
+        with self.assertRaises(ValueError):
+            MPSK(6)
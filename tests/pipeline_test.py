@@ -0,0 +1,62 @@
+import os
+import subprocess
+import sys
+import unittest
+
+from Pipeline import ETAPAS, Pipeline
+
+
+class TestPipeline(unittest.TestCase):
+
+    def test_mensagens_atravessam_a_cadeia(self):
+        configuracoes = [
+            dict(esquema="qpsk", bits_por_simbolo=2, tipo_enquadramento=0, tipo_erro=2),
+            dict(
+                esquema="16-qam", bits_por_simbolo=4, tipo_enquadramento=1, tipo_erro=1
+            ),
+            dict(
+                esquema="manchester",
+                bits_por_simbolo=2,
+                tipo_enquadramento=2,
+                tipo_erro=3,
+            ),
+            dict(
+                esquema="bipolar", bits_por_simbolo=1, tipo_enquadramento=0, tipo_erro=0
+            ),
+        ]
+        for configuracao in configuracoes:
+            pipeline = Pipeline(sigma=0.1, semente=0, **configuracao)
+            resultados = pipeline.processar_varias(
+                ["Olá, mundo!", "quick", b"\x7e\x7d\x00\xff"]
+            )
+
+            self.assertEqual(
+                [r["mensagem"] for r in resultados],
+                ["Olá, mundo!", "quick", b"\x7e\x7d\x00\xff"],
+            )
+            self.assertTrue(
+                all(
+                    r["status"] == "SUCESSO" and r["erros_de_bit"] == 0
+                    for r in resultados
+                )
+            )
+            self.assertEqual(pipeline.mensagens_processadas, 3)
+            self.assertEqual(set(pipeline.tempos), set(ETAPAS))
+            self.assertTrue(all(tempo > 0 for tempo in pipeline.tempos.values()))
+
+    def test_ruido_forte_e_detectado(self):
+        pipeline = Pipeline("psk", 1, sigma=20, tipo_erro=2, semente=1)
+        resultado = pipeline.processar("mensagem longa o bastante para ter erros")
+        self.assertGreater(resultado["erros_de_bit"], 0)
+        self.assertEqual(resultado["status"], "ERRO")
+
+    def test_nao_importa_gtk(self):
+        codigo = "import sys, Pipeline; sys.exit('gi' in sys.modules)"
+        raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.assertEqual(
+            subprocess.run([sys.executable, "-c", codigo], cwd=raiz).returncode, 0
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
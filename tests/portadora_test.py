@@ -103,3 +103,109 @@ class PortadoraTest(unittest.TestCase):
             "images/tests/camada_fisica/portadora_modulacao_amplitude_alta_frequencia.png"
         )
         plt.close()
+
+    def test_modular_buffer_de_saida(self):
+        p = Portadora(
+            amplitude=3.3,
+            frequencia=10.0,
+            fase=30.0,
+            tempo_de_simbolo=0.1,
+            taxa_amostragem=1000,
+        )
+
+        amplitudes = np.array([0.5, 1.0, 0.25])
+        frequencias = np.array([1.0, 1.5, 2.0])
+        fases = np.array([0.0, 90.0, 180.0])
+
+        # Referência: um ciclo por símbolo, concatenados
+        t = np.linspace(0, 0.1, 100, endpoint=False)
+        esperado = np.concatenate(
+            [
+                a * 3.3 * np.sin(2 * np.pi * f * 10.0 * t + np.deg2rad(fase + 30.0))
+                for a, f, fase in zip(amplitudes, frequencias, fases)
+            ]
+        )
+
+        buffer = np.zeros(300)
+        sinal_modulado = p.modular(amplitudes, frequencias, fases, out=buffer)
+
+        self.assertIs(sinal_modulado, buffer)
+        np.testing.assert_allclose(sinal_modulado, esperado)
+
+        with self.assertRaises(ValueError):
+            p.modular(amplitudes, frequencias, fases, out=np.zeros(200))
+
+    def test_modular_fase_continua(self):
+        p = Portadora(
+            amplitude=1.0,
+            frequencia=10.0,
+            fase=0.0,
+            tempo_de_simbolo=0.1,
+            taxa_amostragem=1000,
+            fase_continua=True,
+        )
+        frequencias = np.random.default_rng(0).choice([1.0, 4 / 3, 5 / 3, 2.0], 50)
+        uns, zeros = np.ones(50), np.zeros(50)
+
+        # Um único oscilador: a fase é a integral da frequência instantânea
+        frequencia_instantanea = np.repeat(frequencias * 10.0, 100)
+        esperado = np.sin(
+            2
+            * np.pi
+            * np.concatenate(([0], np.cumsum(frequencia_instantanea)[:-1]))
+            / 1000
+        )
+        sinal = p.modular(uns, frequencias, zeros)
+        np.testing.assert_allclose(sinal, esperado, atol=1e-9)
+
+        # Em trechos, cada um continua de onde o anterior parou
+        trechos = [p.modular(uns[:20], frequencias[:20], zeros[:20])]
+        trechos.append(
+            p.modular(uns[20:], frequencias[20:], zeros[20:], continuar=True)
+        )
+        np.testing.assert_allclose(np.concatenate(trechos), sinal, atol=1e-9)
+
+        # Em lote, cada quadro recomeça na fase 0
+        lote = p.modular(
+            uns.reshape((2, 25)), frequencias.reshape((2, 25)), zeros.reshape((2, 25))
+        )
+        np.testing.assert_allclose(
+            lote[2500:], p.modular(uns[25:], frequencias[25:], zeros[25:]), atol=1e-9
+        )
+
+    def test_modular_iq(self):
+        for fase_continua in [False, True]:
+            p = Portadora(
+                amplitude=3.3,
+                frequencia=10.0,
+                fase=30.0,
+                tempo_de_simbolo=0.125,
+                taxa_amostragem=1000,
+                fase_continua=fase_continua,
+            )
+            rng = np.random.default_rng(0)
+            amplitudes = rng.random(40)
+            fases = rng.random(40) * 360
+            simbolos_complexos = amplitudes * np.exp(1j * np.deg2rad(fases))
+
+            # Mesmo sinal da modulação por amplitude e fase, símbolo a símbolo
+            esperado = p.modular(amplitudes, np.ones(40), fases)
+            np.testing.assert_allclose(
+                p.modular_iq(simbolos_complexos), esperado, atol=1e-12
+            )
+
+            # A correlação com seno e cosseno recupera os símbolos em banda base
+            sem_fase_continua = Portadora(
+                amplitude=3.3,
+                frequencia=10.0,
+                fase=30.0,
+                tempo_de_simbolo=0.125,
+                taxa_amostragem=1000,
+            )
+            np.testing.assert_allclose(
+                sem_fase_continua.correlacionar_iq(
+                    sem_fase_continua.modular_iq(simbolos_complexos)
+                ),
+                simbolos_complexos,
+                atol=1e-12,
+            )
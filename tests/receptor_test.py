@@ -1,6 +1,19 @@
 import unittest
 
-from CamadaFisica import Demodulador, Modulador, Decodificador, TransmissorBandaBase, Sinal
+from CamadaFisica import (
+    BancoDeDetectores,
+    CacheDeFormasDeOnda,
+    CACHE_DE_FORMAS_DE_ONDA,
+    Demodulador,
+    DetectorDeFaseContinua,
+    DetectorIQ,
+    Modulador,
+    Decodificador,
+    ReceptorEmFluxo,
+    TransmissorBandaBase,
+    Sinal,
+    criar_transmissor_e_receptor,
+)
 
 import numpy as np
 import numpy.testing as npt
@@ -708,5 +721,278 @@ class TestReceptor(unittest.TestCase):
         npt.assert_array_equal(bits_decodificados, expected_bits)
         
 
+    def test_banco_de_detectores_menor_distancia(self):
+        modulador = Modulador(
+            modulacao="16-qam",
+            frequencia_portadora=1000,
+            bits_por_simbolo=4,
+            tensao_pico=3.3,
+            taxa_amostragem=100 * 1000,
+        )
+        dicionario = modulador.gerar_dicionario_de_formas_de_onda()
+        detector = BancoDeDetectores(dicionario)
+
+        rng = np.random.default_rng(0)
+        simbolos = rng.integers(0, 16, 50)
+        segmentos = np.array([dicionario[s] for s in simbolos])
+        segmentos = segmentos + rng.normal(0, 2.0, segmentos.shape)
+
+        # Referência: distância euclidiana calculada símbolo a símbolo
+        esperado = [
+            min(dicionario, key=lambda s: np.sum((segmento - dicionario[s]) ** 2))
+            for segmento in segmentos
+        ]
+
+        npt.assert_array_equal(detector.detectar(segmentos), esperado)
+
+    def test_detector_iq(self):
+        rng = np.random.default_rng(1)
+        for modulacao, bits_por_simbolo in [
+            ("ask", 2),
+            ("psk", 3),
+            ("qpsk", 2),
+            ("16-qam", 4),
+        ]:
+            demodulador = Demodulador(
+                modulacao, 10, bits_por_simbolo=bits_por_simbolo, taxa_amostragem=330
+            )
+            self.assertIsInstance(demodulador.detector, DetectorIQ)
+
+            # Mesmas decisões da busca pelos templates, símbolo a símbolo
+            dicionario = demodulador.dicionario_de_formas_de_onda
+            simbolos = rng.integers(0, 2**bits_por_simbolo, 200)
+            segmentos = np.array([dicionario[s] for s in simbolos]) + rng.normal(
+                0, 3.0, (200, 33)
+            )
+            npt.assert_array_equal(
+                demodulador.detector.detectar(segmentos),
+                BancoDeDetectores(dicionario).detectar(segmentos),
+            )
+
+        # FSK não tem constelação e continua com os templates
+        self.assertIsInstance(
+            Demodulador("fsk", 10, bits_por_simbolo=2).detector, BancoDeDetectores
+        )
+
+    def test_demodulador_fase_continua(self):
+        bits = np.random.default_rng(5).integers(0, 2, 600)
+        for bits_por_simbolo in [1, 2, 3]:
+            transmissor, receptor = criar_transmissor_e_receptor(
+                "fsk",
+                bits_por_simbolo,
+                frequencia=10,
+                taxa_amostragem=1000,
+                sigma=0.3,
+                semente=0,
+                fase_continua=True,
+            )
+            self.assertIsInstance(receptor.detector, DetectorDeFaseContinua)
+            sinal = transmissor.processar_sinal(bits)
+            npt.assert_array_equal(receptor.processar_sinal(sinal).ravel(), bits)
+
+            # Em fluxo, a fase passa de um bloco para o outro dos dois lados
+            fluxo = receptor.processar_fluxo(
+                transmissor.processar_fluxo(bits, amostras_por_bloco=777)
+            )
+            npt.assert_array_equal(np.concatenate(list(fluxo)).ravel(), bits)
+
+        # Com mais de 1 bit por símbolo os tons não têm ciclos inteiros,
+        # e um receptor com símbolos na fase 0 erra
+        receptor_fase_zero = Demodulador("fsk", 10, 3, taxa_amostragem=1000)
+        self.assertGreater(
+            np.count_nonzero(receptor_fase_zero.processar_sinal(sinal).ravel() != bits),
+            0,
+        )
+
+        with self.assertRaises(ValueError):
+            criar_transmissor_e_receptor("bipolar", fase_continua=True)
+
+    def test_constelacao_com_menos_bits(self):
+        # A interface gráfica usa bits_por_simbolo=1 por padrão, mesmo com QPSK e 16QAM:
+        # o transmissor usa só parte da constelação e o receptor decide entre eles
+        bits = np.random.default_rng(4).integers(0, 2, 240)
+        for modulacao, bits_por_simbolo in [("qpsk", 1), ("16-qam", 1), ("16-qam", 2)]:
+            modulador = Modulador(
+                modulacao,
+                10,
+                bits_por_simbolo,
+                taxa_amostragem=1000,
+                sigma=0.1,
+                semente=0,
+            )
+            demodulador = Demodulador(
+                modulacao, 10, bits_por_simbolo, taxa_amostragem=1000
+            )
+            sinal = modulador.processar_sinal(bits)
+            npt.assert_array_equal(demodulador.processar_sinal(sinal).ravel(), bits)
+
+            # Mesmas decisões da busca pelos templates
+            segmentos = sinal.reshape((-1, 100))
+            dicionario = demodulador.dicionario_de_formas_de_onda
+            npt.assert_array_equal(
+                demodulador.detector.detectar(segmentos),
+                BancoDeDetectores(dicionario).detectar(segmentos),
+            )
+
+    def test_modulacoes_de_ordem_alta(self):
+        bits = np.random.default_rng(3).integers(0, 2, 2400)
+        for esquema, bits_por_simbolo in [("8-psk", 3), ("64-qam", 6), ("256-qam", 8)]:
+            transmissor, receptor = criar_transmissor_e_receptor(
+                esquema,
+                bits_por_simbolo,
+                frequencia=10,
+                taxa_amostragem=1000,
+                sigma=0.01,
+                semente=0,
+            )
+            self.assertIsInstance(receptor.detector, DetectorIQ)
+            sinal = transmissor.processar_sinal(bits)
+            self.assertEqual(sinal.size, len(bits) // bits_por_simbolo * 100)
+            npt.assert_array_equal(receptor.processar_sinal(sinal).ravel(), bits)
+
+        # bits_por_simbolo incompatível com a ordem da modulação
+        for esquema, bits_por_simbolo in [
+            ("8-psk", 2),
+            ("64-qam", 4),
+            ("256-qam", 6),
+            ("qpsk", 3),
+            ("16-qam", 3),
+        ]:
+            with self.assertRaises(ValueError):
+                Modulador(esquema, 10, bits_por_simbolo)
+            with self.assertRaises(ValueError):
+                Demodulador(esquema, 10, bits_por_simbolo)
+
+    def test_cache_de_formas_de_onda(self):
+        CACHE_DE_FORMAS_DE_ONDA.limpar()
+        primeiro = Demodulador(
+            modulacao="fsk", frequencia_portadora=10, bits_por_simbolo=2
+        )
+        segundo = Demodulador(
+            modulacao="fsk", frequencia_portadora=10, bits_por_simbolo=2
+        )
+        Demodulador(modulacao="fsk", frequencia_portadora=20, bits_por_simbolo=2)
+        self.assertEqual(
+            (CACHE_DE_FORMAS_DE_ONDA.falhas, CACHE_DE_FORMAS_DE_ONDA.acertos), (2, 1)
+        )
+
+        # Mesmas formas de onda, compartilhadas e somente leitura
+        forma_de_onda = primeiro.dicionario_de_formas_de_onda[0]
+        self.assertIs(forma_de_onda, segundo.dicionario_de_formas_de_onda[0])
+        with self.assertRaises(ValueError):
+            forma_de_onda[0] = 1.0
+
+        # LRU: a configuração usada há mais tempo é descartada
+        cache = CacheDeFormasDeOnda(capacidade=2)
+        gerar = lambda: {0: np.zeros(4)}
+        cache.obter("a", gerar)
+        cache.obter("b", gerar)
+        cache.obter("a", gerar)
+        cache.obter("c", gerar)
+        self.assertEqual(len(cache), 2)
+        cache.obter("b", gerar)
+        self.assertEqual((cache.falhas, cache.acertos), (4, 1))
+
+    def test_receptor_em_fluxo(self):
+        rng = np.random.default_rng(0)
+        bits = rng.integers(0, 2, 120)
+        casos = [
+            (
+                TransmissorBandaBase(
+                    "manchester", bits_por_simbolo=2, taxa_amostragem=40, sigma=0.2
+                ),
+                Decodificador("manchester", bits_por_simbolo=2, taxa_amostragem=40),
+            ),
+            (
+                TransmissorBandaBase("bipolar", taxa_amostragem=40, sigma=0.2),
+                Decodificador("bipolar", taxa_amostragem=40),
+            ),
+            (
+                Modulador(
+                    "16-qam", 10, bits_por_simbolo=4, taxa_amostragem=100, sigma=0.3
+                ),
+                Demodulador("16-qam", 10, bits_por_simbolo=4, taxa_amostragem=100),
+            ),
+        ]
+        for transmissor, receptor in casos:
+            sinal = transmissor.processar_sinal(bits).ravel()
+            esperado = receptor.processar_sinal(sinal)
+
+            # Blocos de tamanhos quaisquer, cortando os símbolos (e o clock) no meio
+            fluxo = ReceptorEmFluxo(receptor)
+            cortes = np.cumsum(rng.integers(1, 97, len(sinal)))
+            blocos = np.split(sinal, cortes[cortes < len(sinal)])
+            recebidos = [fluxo.alimentar(bloco) for bloco in blocos]
+
+            npt.assert_array_equal(np.concatenate(recebidos), esperado)
+            self.assertEqual(fluxo.amostras_pendentes, 0)
+
+            # O primeiro símbolo sai assim que fica completo
+            fluxo.reiniciar()
+            self.assertEqual(
+                len(fluxo.alimentar(sinal[: fluxo.amostras_por_simbolo - 1])), 0
+            )
+            npt.assert_array_equal(
+                fluxo.alimentar(
+                    sinal[fluxo.amostras_por_simbolo - 1 : fluxo.amostras_por_simbolo]
+                ),
+                esperado[:1],
+            )
+
+            # Encadeado com o transmissor em fluxo
+            recebidos = receptor.processar_fluxo(
+                transmissor.processar_fluxo(bits, amostras_por_bloco=33)
+            )
+            self.assertEqual(np.concatenate(list(recebidos)).shape, esperado.shape)
+
+    def test_float32_ponta_a_ponta(self):
+        bits = np.random.default_rng(2).integers(0, 2, 400)
+        casos = [
+            (
+                lambda **kw: TransmissorBandaBase(
+                    "bipolar", bits_por_simbolo=2, taxa_amostragem=40, **kw
+                ),
+                Decodificador(
+                    "bipolar", bits_por_simbolo=2, taxa_amostragem=40, dtype=np.float32
+                ),
+            ),
+            (
+                lambda **kw: Modulador(
+                    "16-qam", 10, bits_por_simbolo=4, taxa_amostragem=100, **kw
+                ),
+                Demodulador(
+                    "16-qam",
+                    10,
+                    bits_por_simbolo=4,
+                    taxa_amostragem=100,
+                    dtype=np.float32,
+                ),
+            ),
+        ]
+        for criar_transmissor, receptor in casos:
+            transmissor = criar_transmissor(sigma=0.3, semente=0, dtype=np.float32)
+            sinal = transmissor.processar_sinal(bits)
+            self.assertEqual(sinal.dtype, np.float32)
+            self.assertEqual(
+                transmissor.processar_lote(bits.reshape((4, -1))).dtype, np.float32
+            )
+            detector = receptor.detector
+            self.assertEqual(
+                (
+                    detector.base
+                    if isinstance(detector, DetectorIQ)
+                    else detector.templates
+                ).dtype,
+                np.float32,
+            )
+            npt.assert_array_equal(receptor.processar_sinal(sinal).flatten(), bits)
+
+            # Sem ruído, a mesma forma de onda do caminho em float64 (até a precisão)
+            npt.assert_allclose(
+                criar_transmissor(sigma=0, dtype=np.float32).processar_sinal(bits),
+                criar_transmissor(sigma=0).processar_sinal(bits),
+                atol=1e-5,
+            )
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+
+import numpy as np
+import numpy.testing as npt
+
+from CamadaFisica import Ruido
+
+
+class TestRuido(unittest.TestCase):
+
+    def test_semente_reproduz_o_ruido(self):
+        sinal = np.zeros(1000)
+        npt.assert_array_equal(
+            Ruido(0.5, semente=1).gerar_ruido(sinal),
+            Ruido(0.5, semente=1).gerar_ruido(sinal),
+        )
+        self.assertFalse(
+            np.array_equal(
+                Ruido(0.5, semente=1).gerar_ruido(sinal),
+                Ruido(0.5, semente=2).gerar_ruido(sinal),
+            )
+        )
+
+        # Sequências independentes para processos paralelos
+        a, b = (
+            Ruido(0.5, semente=semente)
+            for semente in np.random.SeedSequence(0).spawn(2)
+        )
+        self.assertFalse(np.array_equal(a.gerar_ruido(sinal), b.gerar_ruido(sinal)))
+
+    def test_adicionar_em_blocos(self):
+        esperado = np.ones((37, 100)) + Ruido(2.0, semente=3).gerar_ruido(
+            np.ones((37, 100))
+        )
+
+        sinal = np.ones((37, 100))
+        resultado = Ruido(2.0, semente=3, amostras_por_bloco=64).adicionar(sinal)
+        self.assertIs(resultado, sinal)
+        npt.assert_array_equal(sinal, esperado)
+
+        # Gerar em blocos continua a mesma sequência
+        ruido = Ruido(2.0, semente=3)
+        blocos = np.concatenate([ruido.gerar_bloco(1000), ruido.gerar_bloco(2700)])
+        npt.assert_array_equal(blocos + 1, esperado.ravel())
+
+    def test_float32(self):
+        sinal = np.zeros(200_000, dtype=np.float32)
+        Ruido(0.5, semente=0, dtype=np.float32).adicionar(sinal)
+        self.assertEqual(sinal.dtype, np.float32)
+        self.assertAlmostEqual(float(np.std(sinal)), 0.5, places=2)
+        self.assertEqual(Ruido(0.5, dtype=np.float32).gerar_bloco(10).dtype, np.float32)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@ import unittest
 import numpy as np
 import numpy.testing as npt
 from matplotlib import pyplot as plt
+from scipy.integrate import quad
 
 from CamadaFisica import Sinal
 
@@ -212,6 +213,38 @@ class TestSinal(unittest.TestCase):
         self.assertEqual(len(sinal_com_curva[0]), fonte.taxa_amostragem)
         self.assertEqual(len(sinal_com_curva), len(simbolos))
 
+    def test_gerar_curva_tensao_coeficientes_forma_fechada(self):
+        fonte = Sinal(bits_por_simbolo=2, taxa_amostragem=200)
+        simbolos = fonte.binario_para_decimal(
+            np.array([[0, 1], [1, 1], [1, 0], [0, 0], [1, 1], [0, 1]])
+        )
+        sinal_com_curva = fonte.gerar_pulso_tensao(simbolos, tempo_de_simbolo=0.5)
+
+        # Referência: série de Fourier integrada numericamente para cada segmento
+        # (4 símbolos + 2 símbolos excedentes)
+        referencia = []
+        for segmento in (simbolos[:4], simbolos[4:]):
+            periodo = 0.5 * len(segmento)
+            t = np.linspace(0, periodo, int(periodo * 200), endpoint=False)
+            nivel = lambda x: segmento[int(x // 0.5)]
+            resultado = np.full_like(t, quad(nivel, 0, periodo)[0] / periodo)
+            for n in range(1, 9):
+                w = 2 * np.pi * n / periodo
+                an = (
+                    2
+                    / periodo
+                    * quad(lambda x: nivel(x) * np.sin(w * x), 0, periodo)[0]
+                )
+                bn = (
+                    2
+                    / periodo
+                    * quad(lambda x: nivel(x) * np.cos(w * x), 0, periodo)[0]
+                )
+                resultado += an * np.sin(w * t) + bn * np.cos(w * t)
+            referencia.append(resultado.reshape((len(segmento), -1)))
+
+        npt.assert_allclose(sinal_com_curva, np.concatenate(referencia), atol=1e-8)
+
     def test_sequencia_de_bits_para_simbolos_com_excedentes(self):
         fonte = Sinal(bits_por_simbolo=3)
         bits = np.array([1, 0, 1, 1, 1, 0, 1])  # 7 bits
@@ -222,6 +255,46 @@ class TestSinal(unittest.TestCase):
 
         npt.assert_array_equal(simbolos, esperado)
 
+    def test_tabela_de_bits(self):
+        fonte = Sinal(bits_por_simbolo=3)
+        tabela = fonte.tabela_de_bits
+        self.assertEqual(tabela.shape, (8, 3))
+        self.assertFalse(tabela.flags.writeable)
+        for decimal in range(8):
+            npt.assert_array_equal(
+                fonte.decimal_para_binario(decimal),
+                [int(b) for b in format(decimal, "03b")],
+            )
+
+        # Ida e volta com vários símbolos de uma vez
+        decimais = np.array([5, 0, 7, 2])
+        bits = fonte.decimal_para_binario(decimais)
+        npt.assert_array_equal(bits, [[1, 0, 1], [0, 0, 0], [1, 1, 1], [0, 1, 0]])
+        npt.assert_allclose(fonte.binario_para_decimal(bits), decimais / 7)
+
+    def test_pulso_tensao_ideal(self):
+        fonte = Sinal(taxa_amostragem=100)
+        simbolos = np.array([0.0, 3.3, 1.1])
+        esperado = np.array([np.full(50, simbolo) for simbolo in simbolos])
+
+        pulso = fonte.gerar_pulso_tensao_ideal(simbolos, tempo_de_simbolo=0.5)
+        npt.assert_array_equal(pulso, esperado)
+        self.assertTrue(pulso.flags.writeable)
+
+        # Visão sem cópia: cada linha aponta para o próprio símbolo
+        visao = fonte.gerar_pulso_tensao_ideal(
+            simbolos, tempo_de_simbolo=0.5, somente_leitura=True
+        )
+        npt.assert_array_equal(visao, esperado)
+        self.assertEqual(visao.strides[1], 0)
+        self.assertFalse(visao.flags.writeable)
+
+        # Lote: uma sequência por linha
+        lote = fonte.gerar_pulso_tensao_ideal(
+            np.stack((simbolos, simbolos[::-1])), tempo_de_simbolo=0.5
+        )
+        npt.assert_array_equal(lote, [esperado, esperado[::-1]])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,6 @@
+import io
 import unittest
+from itertools import product
 
 import numpy as np
 import numpy.testing as npt
@@ -795,6 +797,106 @@ class TestTransmissorBandaBase(unittest.TestCase):
         )
         plt.close()
 
+    def test_banda_base_lote(self):
+        quadros = np.random.randint(0, 2, (5, 13))
+        for codificacao, bits_por_simbolo in product(
+            ["nrz_polar", "manchester", "bipolar"], [1, 2, 3]
+        ):
+            transmissor = TransmissorBandaBase(
+                codificacao=codificacao,
+                bits_por_simbolo=bits_por_simbolo,
+                taxa_amostragem=100,
+                sigma=0,
+            )
+            lote = transmissor.processar_lote(quadros)
+            esperado = np.array([transmissor.processar_sinal(q) for q in quadros])
+            self.assertEqual(lote.shape, esperado.shape)
+            npt.assert_allclose(lote, esperado, atol=1e-12)
+            npt.assert_array_equal(transmissor.processar_lote(list(quadros)), lote)
+
+        with self.assertRaises(ValueError):
+            transmissor.processar_lote([[0, 1], [0, 1, 1]])
+
+    def test_modulador_lote(self):
+        quadros = np.random.randint(0, 2, (6, 16))
+        for modulacao, bits_por_simbolo in [
+            ("ask", 2),
+            ("psk", 1),
+            ("qpsk", 2),
+            ("16-qam", 4),
+            ("qpsk", 1),
+            ("16-qam", 2),
+            ("fsk", 2),
+        ]:
+            modulador = Modulador(
+                modulacao=modulacao,
+                frequencia_portadora=10.0,
+                bits_por_simbolo=bits_por_simbolo,
+                taxa_amostragem=200,
+                debug=True,
+            )
+            esperado = np.array([modulador.processar_sinal(q) for q in quadros])
+            npt.assert_array_equal(modulador.processar_lote(quadros), esperado)
+
+            # Buffer de saída reaproveitado entre lotes
+            buffer = np.empty_like(esperado)
+            lote = modulador.processar_lote(quadros, out=buffer)
+            self.assertTrue(np.shares_memory(lote, buffer))
+            npt.assert_array_equal(buffer, esperado)
+
+    def test_banda_base_fluxo(self):
+        bits = np.random.randint(0, 2, 301)
+        for codificacao in ["bipolar", "manchester"]:
+            transmissor = TransmissorBandaBase(
+                codificacao=codificacao,
+                bits_por_simbolo=2,
+                taxa_amostragem=50,
+                semente=3,
+            )
+            esperado = transmissor.processar_sinal(bits).ravel()
+
+            # Trechos menores e maiores que um bloco: a alternância do bipolar e o
+            # ruído continuam entre eles
+            for amostras_por_bloco, bits_por_leitura in [(64, 8), (30, 64)]:
+                transmissor = TransmissorBandaBase(
+                    codificacao=codificacao,
+                    bits_por_simbolo=2,
+                    taxa_amostragem=50,
+                    semente=3,
+                )
+                blocos = list(
+                    transmissor.processar_fluxo(
+                        iter(bits),
+                        amostras_por_bloco=amostras_por_bloco,
+                        bits_por_leitura=bits_por_leitura,
+                    )
+                )
+                self.assertTrue(
+                    all(len(bloco) == amostras_por_bloco for bloco in blocos[:-1])
+                )
+                npt.assert_allclose(np.concatenate(blocos), esperado, atol=1e-9)
+
+    def test_modulador_fluxo_arquivo(self):
+        dados = bytes(range(256))
+        configuracao = dict(
+            modulacao="qpsk",
+            frequencia_portadora=10.0,
+            bits_por_simbolo=2,
+            taxa_amostragem=100,
+            semente=5,
+        )
+        esperado = Modulador(**configuracao).processar_sinal(
+            np.unpackbits(np.frombuffer(dados, dtype=np.uint8))
+        )
+
+        blocos = list(
+            Modulador(**configuracao).processar_fluxo(
+                io.BytesIO(dados), amostras_por_bloco=1000
+            )
+        )
+        self.assertEqual(len(blocos), int(np.ceil(len(esperado) / 1000)))
+        npt.assert_array_equal(np.concatenate(blocos), esperado)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,63 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import numpy.testing as npt
+from scipy.special import erfc
+
+from Varredura import VarreduraBER
+
+
+class TestVarreduraBER(unittest.TestCase):
+
+    def test_psk_segue_a_teoria(self):
+        # BPSK: BER = Q(sqrt(2 Eb/N0)) = erfc(sqrt(Eb/N0)) / 2
+        varredura = VarreduraBER(
+            erros_alvo=400, max_bits=100_000, semente=0, processos=1
+        )
+        resultados = varredura.executar(
+            VarreduraBER.grade(["psk", "nrz_polar"], [1], ebn0_db=[0, 4])
+        )
+
+        for linha in resultados:
+            teorica = 0.5 * erfc(np.sqrt(10 ** (linha["ebn0_db"] / 10)))
+            # Parou cedo por ter visto erros suficientes
+            self.assertGreaterEqual(linha["erros"], 400)
+            self.assertLess(linha["bits"], 100_000)
+            npt.assert_allclose(linha["ber"], teorica, rtol=0.2)
+
+    def test_reprodutivel_e_paralelo(self):
+        grade = VarreduraBER.grade(["qpsk", "manchester"], [2], sigmas=[1.0, 4.0])
+        sequencial = VarreduraBER(
+            erros_alvo=20, max_bits=20_000, semente=7, processos=1
+        ).executar(grade)
+        paralela = VarreduraBER(
+            erros_alvo=20, max_bits=20_000, semente=7, processos=2
+        ).executar(grade)
+        self.assertEqual(sequencial, paralela)
+        self.assertEqual([linha["sigma"] for linha in paralela], [1.0, 4.0, 1.0, 4.0])
+
+        with tempfile.TemporaryDirectory() as pasta:
+            VarreduraBER.salvar_npz(paralela, os.path.join(pasta, "ber.npz"))
+            VarreduraBER.salvar_csv(paralela, os.path.join(pasta, "ber.csv"))
+            tabela = np.load(os.path.join(pasta, "ber.npz"))
+            npt.assert_array_equal(
+                tabela["esquema"], ["qpsk", "qpsk", "manchester", "manchester"]
+            )
+            npt.assert_array_equal(tabela["ber"], [linha["ber"] for linha in paralela])
+            with open(os.path.join(pasta, "ber.csv")) as arquivo:
+                self.assertEqual(len(arquivo.readlines()), 5)
+
+    def test_grade_exige_um_tipo_de_ruido(self):
+        with self.assertRaises(ValueError):
+            VarreduraBER.grade(["ask"], [1])
+
+    def test_lote_menor_que_um_simbolo(self):
+        varredura = VarreduraBER(bits_por_lote=2, max_bits=100, processos=1)
+        with self.assertRaises(ValueError):
+            varredura.executar(VarreduraBER.grade(["64-qam"], [6], sigmas=[1.0]))
+
+
+if __name__ == "__main__":
+    unittest.main()